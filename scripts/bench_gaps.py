@@ -0,0 +1,99 @@
+import argparse
+import time
+from typing import Dict, List
+
+from scripts.gen_data import generate_data
+from sort_it_out.gaps import GAP_SEQUENCES, gap_sequence
+from sort_it_out.sorts import _comb_sort_inplace, _shell_sort_inplace
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.comparisons = 0
+        self.writes = 0
+
+
+class _Item:
+    """Wrap a value and count every comparison made on it."""
+
+    __slots__ = ("value", "counter")
+
+    def __init__(self, value, counter: _Counter) -> None:
+        self.value = value
+        self.counter = counter
+
+    def __gt__(self, other: "_Item") -> bool:
+        self.counter.comparisons += 1
+        return self.value > other.value
+
+    def __lt__(self, other: "_Item") -> bool:
+        self.counter.comparisons += 1
+        return self.value < other.value
+
+
+class _CountingList(list):
+    """List that counts element writes (moves and swap halves)."""
+
+    def __init__(self, items, counter: _Counter) -> None:
+        super().__init__(items)
+        self.counter = counter
+
+    def __setitem__(self, index, value) -> None:
+        self.counter.writes += 1
+        super().__setitem__(index, value)
+
+
+KERNELS = {
+    "shell": _shell_sort_inplace,
+    "comb": _comb_sort_inplace,
+}
+
+
+def measure(kernel: str, sequence: str, data: List[int]) -> Dict[str, float]:
+    """Sort ``data`` with ``kernel`` and ``sequence`` and return the counts."""
+    counter = _Counter()
+    arr = _CountingList((_Item(x, counter) for x in data), counter)
+    gaps = gap_sequence(sequence, len(arr))
+    t0 = time.perf_counter()
+    KERNELS[kernel](arr, gaps)
+    elapsed = time.perf_counter() - t0
+    assert [item.value for item in arr] == sorted(data)
+    return {
+        "comparisons": counter.comparisons,
+        "writes": counter.writes,
+        "passes": len(gaps),
+        "seconds": elapsed,
+    }
+
+
+def main(count: int = 10_000, kernel: str = "shell") -> None:
+    """Print comparison and write counts for every gap sequence."""
+    data = generate_data(count=count, lo=0, hi=count * 10)
+    print(f"{kernel} sort, n={count}")
+    print(
+        f"{'sequence':<10} {'passes':>6} {'comparisons':>12} {'writes':>12} {'sec':>8}"
+    )
+    for name in GAP_SEQUENCES:
+        stats = measure(kernel, name, data)
+        print(
+            f"{name:<10} {stats['passes']:>6} {stats['comparisons']:>12} "
+            f"{stats['writes']:>12} {stats['seconds']:>8.4f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare gap sequences for shell sort and comb sort"
+    )
+    parser.add_argument(
+        "-n", "--count", type=int, default=10_000, help="number of items to sort"
+    )
+    parser.add_argument(
+        "-k",
+        "--kernel",
+        choices=sorted(KERNELS),
+        default="shell",
+        help="which gap-based sort to measure (default: shell)",
+    )
+    args = parser.parse_args()
+    main(count=args.count, kernel=args.kernel)
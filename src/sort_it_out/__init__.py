@@ -3,12 +3,20 @@
 Expose basic sorting helpers and timing utilities.
 """
 
+from .auto import auto_sort, choose_algorithm
+from .dedup import sort_counts, sort_unique
+from .parallel import parallel_sort
+from .permutation import apply_permutation, argsort, lexsort
+from .records import sort_records
+from .selection import partial_sort, quantiles, select
+from .sortedlist import SortedList
 from .sorts import (
     bubble_sort,
     bucket_sort,
     cocktail_sort,
     comb_sort,
     compare_algorithms,
+    counting_histogram,
     counting_sort,
     gnome_sort,
     heap_sort,
@@ -32,11 +40,25 @@ __all__ = [
     "heap_sort",
     "shell_sort",
     "counting_sort",
+    "counting_histogram",
     "radix_sort",
     "bucket_sort",
     "comb_sort",
     "cocktail_sort",
     "gnome_sort",
+    "auto_sort",
+    "choose_algorithm",
+    "parallel_sort",
+    "partial_sort",
+    "select",
+    "quantiles",
+    "SortedList",
+    "sort_unique",
+    "sort_counts",
+    "argsort",
+    "lexsort",
+    "apply_permutation",
+    "sort_records",
     "run",
 ]
 
@@ -3,8 +3,11 @@
 Put algorithm mappings here so the CLI, GUI and other tools use a single
 source of truth for available algorithm names.
 """
-from typing import Callable, Dict, List
+from functools import partial
+from inspect import signature
+from typing import Callable, Dict, List, Union
 
+from .auto import auto_sort
 from .sorts import (
     bubble_sort,
     bucket_sort,
@@ -35,6 +38,8 @@ ALGORITHMS: Dict[str, Callable[[List], List]] = {
     "Comb": comb_sort,
     "Cocktail": cocktail_sort,
     "Gnome": gnome_sort,
+    # Profiles the input and dispatches to one of the engines above
+    "Auto": auto_sort,
 }
 
 # Case-insensitive lookup mapping to preserve backward compatibility
@@ -42,4 +47,39 @@ ALGORITHMS_LOWER: Dict[str, Callable[[List], List]] = {
     name.lower(): func for name, func in ALGORITHMS.items()
 }
 
-__all__ = ["ALGORITHMS", "ALGORITHMS_LOWER"]
+# The algorithms with a vectorized variant, bound to ``backend="numpy"``
+# (requires NumPy at call time; see :mod:`sort_it_out.numpy_backend`).
+NUMPY_ALGORITHMS: Dict[str, Callable[[List], List]] = {
+    name: partial(func, backend="numpy")
+    for name, func in ALGORITHMS.items()
+    if "backend" in signature(func).parameters
+}
+
+# A registry name or a sorting function.
+Algorithm = Union[str, Callable]
+
+
+def get_algorithm(name: str) -> Callable:
+    """Return the registry algorithm ``name``, matched exactly first and
+    then case-insensitively; ``ValueError`` lists the available names."""
+    func = ALGORITHMS.get(name) or ALGORITHMS_LOWER.get(name.lower())
+    if func is None:
+        names = ", ".join(sorted(ALGORITHMS))
+        raise ValueError(f"Unknown algorithm: {name}. Available: {names}")
+    return func
+
+
+def resolve_algorithm(algorithm: Algorithm) -> Callable:
+    """Return ``algorithm`` itself if it is a function, otherwise the
+    registry algorithm of that name (see :func:`get_algorithm`)."""
+    return get_algorithm(algorithm) if isinstance(algorithm, str) else algorithm
+
+
+__all__ = [
+    "ALGORITHMS",
+    "ALGORITHMS_LOWER",
+    "NUMPY_ALGORITHMS",
+    "Algorithm",
+    "get_algorithm",
+    "resolve_algorithm",
+]
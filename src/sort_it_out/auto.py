@@ -0,0 +1,205 @@
+"""Adaptive ``Auto`` sort: profile the input, then pick an engine.
+
+:func:`profile_data` makes one cheap pass over the keys (type, range,
+whether they are already in order) plus a sample of adjacent pairs and
+values to estimate how presorted the data is and how many duplicates it
+holds. :func:`choose_algorithm` turns the profile into a decision with a
+human-readable reason, and :func:`auto_sort` runs it.
+"""
+from __future__ import annotations
+
+from itertools import islice
+from operator import ge, gt, le, lt
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from .sorts import (
+    COUNTING_MAX_RANGE,
+    KeyFunc,
+    _use_dense_counts,
+    _write_back,
+    bucket_sort,
+    counting_sort,
+    insertion_sort,
+    merge_sort,
+    quick_sort,
+    radix_sort,
+)
+
+# Adjacent pairs / values inspected to estimate runs and duplicates.
+_SAMPLE = 1024
+# Inputs this small are insertion sorted: setup costs dominate.
+_TINY = 32
+# At most this share of sampled neighbours out of order means long runs.
+_RUNNY = 0.1
+# Radix sort wins while keys fit in 32 bits; wider keys go to bucket sort.
+_RADIX_MAX_BITS = 32
+# Bucket sort scales keys through floats; ranges wider than a float can
+# hold are scaled with slow big-int arithmetic, so quick sort wins there.
+_BUCKET_MAX_BITS = 1023
+_INF = float("inf")
+
+ENGINES: Dict[str, Callable] = {
+    "Counting": counting_sort,
+    "Radix": radix_sort,
+    "Bucket": bucket_sort,
+    "Merge": merge_sort,
+    "Quick": quick_sort,
+    "Insertion": insertion_sort,
+}
+
+
+class DataProfile(NamedTuple):
+    n: int
+    kind: str  # "int", "float" (any int/float mix) or "other"
+    lo: Any
+    hi: Any
+    in_order: bool
+    against_order: bool  # strictly opposite to the requested order
+    disorder: float  # sampled share of neighbours out of order
+    duplicates: float  # sampled share of repeated values
+    finite: bool = True  # no infinity or NaN among the keys
+
+
+class AutoChoice(NamedTuple):
+    algorithm: str  # an ENGINES name, "Sorted" or "Reversed"
+    reason: str
+    profile: DataProfile
+
+
+def profile_data(keys, reverse: bool = False) -> DataProfile:
+    """Profile the indexable sequence ``keys`` for sorting into ascending
+    order (descending with ``reverse``)."""
+    n = len(keys)
+    if n < 2:
+        return DataProfile(n, "other", None, None, True, False, 0.0, 0.0)
+    in_order = all(map(ge if reverse else le, keys, islice(keys, 1, None)))
+    against = False
+    if not in_order:
+        against = all(map(lt if reverse else gt, keys, islice(keys, 1, None)))
+    if all(isinstance(k, int) for k in keys):
+        kind = "int"
+    elif all(isinstance(k, (int, float)) for k in keys):
+        kind = "float"
+    else:
+        kind = "other"
+    lo = hi = None
+    finite = True
+    if kind != "other":
+        lo, hi = min(keys), max(keys)
+    if kind == "float":
+        # NaN fails both comparisons, so min/max cannot be trusted alone.
+        finite = all(-_INF < k < _INF for k in keys)
+    step = max(1, (n - 1) // _SAMPLE)
+    pos = range(0, n - 1, step)
+    descents = sum(1 for i in pos if keys[i + 1] < keys[i])
+    ascents = sum(1 for i in pos if keys[i] < keys[i + 1])
+    # Merge sort reverses descending runs, so either direction counts.
+    disorder = min(descents, ascents) / len(pos)
+    sample = [keys[i] for i in pos]
+    try:
+        duplicates = 1 - len(set(sample)) / len(sample)
+    except TypeError:
+        duplicates = 0.0
+    return DataProfile(n, kind, lo, hi, in_order, against, disorder, duplicates, finite)
+
+
+def _decide(p: DataProfile) -> AutoChoice:
+    if p.in_order:
+        return AutoChoice("Sorted", "input is already in order", p)
+    if p.against_order:
+        return AutoChoice("Reversed", "input is in strictly opposite order", p)
+    if p.n <= _TINY:
+        return AutoChoice("Insertion", f"tiny input ({p.n} items)", p)
+    if p.disorder <= _RUNNY:
+        return AutoChoice(
+            "Merge",
+            f"long natural runs ({p.disorder:.0%} of sampled neighbours "
+            "out of order)",
+            p,
+        )
+    if p.kind == "int":
+        span = p.hi - p.lo + 1
+        if _use_dense_counts(span, p.n, COUNTING_MAX_RANGE):
+            return AutoChoice(
+                "Counting", f"integers in a small range ({span} values)", p
+            )
+        bits = (span - 1).bit_length()
+        if bits <= _RADIX_MAX_BITS:
+            return AutoChoice("Radix", f"integers with a {bits}-bit range", p)
+        if bits <= _BUCKET_MAX_BITS:
+            return AutoChoice("Bucket", f"integers with a wide {bits}-bit range", p)
+        return AutoChoice(
+            "Quick", f"integers with a {bits}-bit range, beyond float scaling", p
+        )
+    if p.kind == "float" and not p.finite:
+        return AutoChoice("Merge", "numeric data with infinities or NaN", p)
+    if p.kind == "float":
+        return AutoChoice("Bucket", "numeric data with floats", p)
+    if p.duplicates >= 0.5:
+        return AutoChoice(
+            "Quick",
+            f"{p.duplicates:.0%} duplicates suit three-way partitioning",
+            p,
+        )
+    return AutoChoice("Quick", "general comparable data in random order", p)
+
+
+def choose_algorithm(
+    data: Iterable, key: KeyFunc = None, reverse: bool = False
+) -> AutoChoice:
+    """Return the engine :func:`auto_sort` would use for ``data`` and why."""
+    items = data if isinstance(data, list) else list(data)
+    keys = items if key is None else [key(x) for x in items]
+    return _decide(profile_data(keys, reverse))
+
+
+def auto_sort(
+    data: Iterable,
+    key: KeyFunc = None,
+    reverse: bool = False,
+    inplace: bool = False,
+    report: Optional[Callable[[AutoChoice], None]] = None,
+) -> Optional[List]:
+    """Sort ``data`` with the engine that suits it best.
+
+    Input already in the requested order is returned as is and input in
+    strictly opposite order is reversed; otherwise the engine picked by
+    :func:`choose_algorithm` runs. ``report``, when given, receives the
+    :class:`AutoChoice` before sorting. Keys are computed once and the
+    result is stable, as for every other algorithm.
+    """
+    items = data if inplace else list(data)
+    keys = items if key is None else [key(x) for x in items]
+    choice = _decide(profile_data(keys, reverse))
+    if report is not None:
+        report(choice)
+    if choice.algorithm == "Sorted":
+        return None if inplace else items
+    if choice.algorithm == "Reversed":
+        if hasattr(items, "reverse"):
+            items.reverse()
+        else:
+            _write_back(items, list(items)[::-1])
+        return None if inplace else items
+    engine = ENGINES[choice.algorithm]
+    if key is None:
+        if inplace:
+            return engine(items, reverse=reverse, inplace=True)
+        engine(items, reverse=reverse, inplace=True)
+        return items
+    order = engine(range(len(items)), key=keys.__getitem__, reverse=reverse)
+    res = [items[i] for i in order]
+    if inplace:
+        _write_back(items, res)
+        return None
+    return res
+
+
+__all__ = [
+    "ENGINES",
+    "DataProfile",
+    "AutoChoice",
+    "profile_data",
+    "choose_algorithm",
+    "auto_sort",
+]
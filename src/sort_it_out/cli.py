@@ -7,38 +7,388 @@ Reads a newline-separated data file (or stdin) and outputs the sorted values.
 from __future__ import annotations
 
 import argparse
+import inspect
+import os
 import sys
-from typing import List, Optional
+import time
+from functools import partial
+from itertools import islice
+from typing import Iterable, List, Optional
 
 from . import gui
 from .algorithms import ALGORITHMS, ALGORITHMS_LOWER
-from .sorts import time_sort
+from .auto import auto_sort
+from .dedup import sort_counts
+from .external import (
+    DEFAULT_MEMORY_LIMIT,
+    MERGE_BUFFER_SIZE,
+    external_sort,
+    merge_sorted_files,
+    parse_memory_limit,
+)
+from .formats import FORMATS, format_for_path, load_values, save_values
+from .gaps import GAP_SEQUENCES
+from .mapped import MAPPED_ALGORITHMS, sort_mapped_file
+from .parallel import parallel_sort
+from .parsing import PARSE_TYPES, value_parser
+from .records import (
+    delimiter_for_path,
+    external_sort_records,
+    parse_key_columns,
+    sort_records,
+)
+from .selection import partial_sort, quantiles
+from .sorts import stream_counting_histogram, time_sort
+from .streams import (
+    DEFAULT_BUFFER_SIZE,
+    iter_lines,
+    iter_values,
+    open_output,
+    write_histogram,
+    write_values,
+)
 
 
-def _parse_value(s: str):
-    s = s.strip()
-    if s == "":
-        return s
-    # Try int, then float, fallback to original string
+def read_input(
+    path: Optional[str], buffer_size: int = DEFAULT_BUFFER_SIZE, kind: str = "auto"
+) -> List:
+    # Accept None (no -i passed) or '-' to read from stdin; values are
+    # parsed while reading, a block of lines at a time.
+    return list(iter_values(path, kind, buffer_size))
+
+
+def _write_output(
+    values: List, path: Optional[str], buffer_size: int, fmt: str = "text"
+) -> None:
+    if fmt != "text":
+        save_values(values, path, fmt)
+        return
+    with open_output(path, buffer_size) as out:
+        write_values(values, out)
+
+
+def _read_values(ns: argparse.Namespace, read_buffer: int) -> Iterable:
+    """Values of ``-i`` as a stream of parsed text lines or a loaded
+    binary file, according to its format."""
+    if ns.input_format == "text":
+        return iter_values(ns.input, ns.type, read_buffer)
+    return load_values(ns.input, ns.input_format)
+
+
+def _print_choice(choices: List) -> None:
+    """With ``-s auto --explain``, report Auto's last choice on stderr."""
+    if choices:
+        choice = choices[-1]
+        print(f"Auto chose {choice.algorithm}: {choice.reason}", file=sys.stderr)
+
+
+def _run_external(ns: argparse.Namespace, algorithm, buffers, choices: List) -> int:
+    """Stream the input through :func:`external_sort` to ``-o`` or stdout."""
+    if ns.time:
+        print("--time is not supported with --external")
+        return 2
+    if ns.input_format != "text" or ns.output_format != "text":
+        print("--external only supports text input and output")
+        return 2
     try:
-        return int(s)
-    except Exception:
-        pass
+        limit = parse_memory_limit(ns.memory_limit)
+    except ValueError as exc:
+        print(exc)
+        return 2
+    read_buffer, write_buffer = buffers
     try:
-        return float(s)
-    except Exception:
-        return s
+        with open_output(ns.output, write_buffer) as out:
+            values = iter_values(ns.input, ns.type, read_buffer)
+            external_sort(
+                values,
+                out,
+                algorithm,
+                memory_limit=limit,
+                parse=value_parser(ns.type),
+            )
+    except Exception as exc:
+        print(f"Error while sorting: {exc}")
+        return 3
+    _print_choice(choices)
+    return 0
 
 
-def read_input(path: Optional[str]) -> List:
-    lines: List[str]
-    # Accept None (no -i passed) or '-' to read from stdin
-    if path and path != "-":
-        with open(path, "r", encoding="utf-8") as fh:
-            lines = [line.rstrip("\n") for line in fh]
-    else:
-        lines = [line.rstrip("\n") for line in sys.stdin]
-    return [_parse_value(x) for x in lines if x is not None]
+def _run_inplace_mmap(ns: argparse.Namespace, display_name: str, algorithm) -> int:
+    """Sort the binary file ``--inplace-mmap`` in its mapped pages."""
+    for flag, used in (
+        ("-i", ns.input),
+        ("-o", ns.output),
+        ("--external", ns.external),
+        ("--workers", ns.workers not in (None, 1)),
+        ("--backend", ns.backend != "python"),
+        ("--top/--bottom", ns.top is not None or ns.bottom is not None),
+        ("--stream-counting", ns.stream_counting),
+        ("--quantiles", ns.quantiles),
+        ("--unique/--count", ns.unique or ns.count),
+        ("--key-column", ns.records),
+    ):
+        if used:
+            print(f"{flag} is not supported with --inplace-mmap")
+            return 2
+    if display_name not in MAPPED_ALGORITHMS:
+        names = ", ".join(MAPPED_ALGORITHMS)
+        print(f"--inplace-mmap supports: {names}")
+        return 2
+    options = algorithm.keywords if isinstance(algorithm, partial) else {}
+    t0 = time.perf_counter()
+    try:
+        n = sort_mapped_file(ns.inplace_mmap, display_name, ns.format, **options)
+    except Exception as exc:
+        print(f"Error while sorting: {exc}")
+        return 3
+    if ns.time:
+        t = time.perf_counter() - t0
+        print(f"{display_name}: {t:.6f} sec ({n} values sorted in place)")
+    return 0
+
+
+def _run_stream_counting(ns: argparse.Namespace, buffers) -> int:
+    """Count the input while reading it and write the sorted values from
+    the histogram, never holding the values themselves."""
+    for flag, used in (
+        ("--time", ns.time),
+        ("--external", ns.external),
+        ("--workers", ns.workers not in (None, 1)),
+        ("--backend", ns.backend != "python"),
+        ("--top/--bottom", ns.top is not None or ns.bottom is not None),
+        ("--unique/--count", ns.unique or ns.count),
+        ("--key-column", ns.records),
+        ("--explain", ns.explain),
+    ):
+        if used:
+            print(f"{flag} is not supported with --stream-counting")
+            return 2
+    read_buffer, write_buffer = buffers
+    try:
+        values = _read_values(ns, read_buffer)
+        hist = stream_counting_histogram(values)
+    except Exception as exc:
+        print(f"Error while sorting: {exc}")
+        return 3
+    try:
+        if ns.output_format == "text":
+            with open_output(ns.output, write_buffer) as out:
+                write_histogram(hist, out)
+        else:
+            expanded = (v for v, c in hist for _ in range(c))
+            _write_output(expanded, ns.output, write_buffer, ns.output_format)
+    except Exception as exc:
+        print(f"Error writing output file: {exc}")
+        return 3
+    return 0
+
+
+def _run_dedup(ns: argparse.Namespace, algorithm, buffers, choices: List) -> int:
+    """Sort only the distinct values of the input, for ``--unique`` or
+    ``--count``; the values are counted while reading."""
+    flag = "--unique" if ns.unique else "--count"
+    for other, used in (
+        ("--time", ns.time),
+        ("--external", ns.external),
+        ("--top/--bottom", ns.top is not None or ns.bottom is not None),
+        ("--stream-counting", ns.stream_counting),
+        ("binary output", ns.count and ns.output_format != "text"),
+        ("--key-column", ns.records),
+    ):
+        if used:
+            print(f"{other} is not supported with {flag}")
+            return 2
+    read_buffer, write_buffer = buffers
+    try:
+        values = _read_values(ns, read_buffer)
+        pairs = sort_counts(values, algorithm)
+    except Exception as exc:
+        print(f"Error while sorting: {exc}")
+        return 3
+    try:
+        if ns.unique:
+            res: List = [v for v, _ in pairs]
+            _write_output(res, ns.output, write_buffer, ns.output_format)
+        else:
+            _write_output([f"{c} {v}" for v, c in pairs], ns.output, write_buffer)
+    except Exception as exc:
+        print(f"Error writing output file: {exc}")
+        return 3
+    _print_choice(choices)
+    return 0
+
+
+def _run_records(ns: argparse.Namespace, algorithm, buffers, choices: List) -> int:
+    """Sort delimited records by ``--key-column`` and write the original
+    lines in the new order, in memory or with ``--external``."""
+    for flag, used in (
+        ("--time", ns.time),
+        ("--backend", ns.backend != "python"),
+        ("binary formats", "text" not in (ns.input_format, ns.output_format)),
+    ):
+        if used:
+            print(f"{flag} is not supported with --key-column")
+            return 2
+    try:
+        keys = parse_key_columns(ns.key_column or "1", ns.type)
+        if ns.external:
+            limit = parse_memory_limit(ns.memory_limit)
+    except ValueError as exc:
+        print(exc)
+        return 2
+    delimiter = ns.delimiter or delimiter_for_path(ns.input)
+    delimiter = {"\\t": "\t", "tab": "\t"}.get(delimiter, delimiter)
+    read_buffer, write_buffer = buffers
+    try:
+        with open_output(ns.output, write_buffer) as out:
+            lines = iter_lines(ns.input, read_buffer)
+            if ns.header:
+                write_values(islice(lines, 1), out)
+            if ns.external:
+                external_sort_records(
+                    lines, out, keys, delimiter, algorithm, memory_limit=limit
+                )
+            else:
+                write_values(sort_records(lines, keys, delimiter, algorithm), out)
+    except Exception as exc:
+        print(f"Error while sorting: {exc}")
+        return 3
+    _print_choice(choices)
+    return 0
+
+
+def _run_partial(ns: argparse.Namespace, buffers) -> int:
+    """Stream the input through :func:`partial_sort` for ``--top`` or
+    ``--bottom``, holding only K values."""
+    largest = ns.top is not None
+    k = ns.top if largest else ns.bottom
+    flag = "--top" if largest else "--bottom"
+    if k < 0:
+        print(f"{flag} must be >= 0")
+        return 2
+    for other, used in (
+        ("--time", ns.time),
+        ("--external", ns.external),
+        ("--workers", ns.workers not in (None, 1)),
+        ("--backend", ns.backend != "python"),
+        ("--unique/--count", ns.unique or ns.count),
+        ("--key-column", ns.records),
+        ("--explain", ns.explain),
+    ):
+        if used:
+            print(f"{other} is not supported with {flag}")
+            return 2
+    read_buffer, write_buffer = buffers
+    try:
+        values = _read_values(ns, read_buffer)
+        res = partial_sort(values, k, largest=largest)
+    except Exception as exc:
+        print(f"Error while sorting: {exc}")
+        return 3
+    try:
+        _write_output(res, ns.output, write_buffer, ns.output_format)
+    except Exception as exc:
+        print(f"Error writing output file: {exc}")
+        return 3
+    return 0
+
+
+def _run_quantiles(ns: argparse.Namespace, buffers) -> int:
+    """Print the ``--quantiles`` of the input as ``q: value`` lines."""
+    try:
+        qs = [float(q) for q in ns.quantiles.split(",")]
+        if any(not 0 <= q <= 1 for q in qs):
+            raise ValueError
+    except ValueError:
+        print("--quantiles takes fractions between 0 and 1, e.g. 0.5,0.95,0.99")
+        return 2
+    for other, used in (
+        ("--time", ns.time),
+        ("--external", ns.external),
+        ("--workers", ns.workers not in (None, 1)),
+        ("--backend", ns.backend != "python"),
+        ("--top/--bottom", ns.top is not None or ns.bottom is not None),
+        ("--stream-counting", ns.stream_counting),
+        ("--unique/--count", ns.unique or ns.count),
+        ("--key-column", ns.records),
+        ("--explain", ns.explain),
+    ):
+        if used:
+            print(f"{other} is not supported with --quantiles")
+            return 2
+    read_buffer, write_buffer = buffers
+    try:
+        values = _read_values(ns, read_buffer)
+        res = quantiles(values, qs)
+    except Exception as exc:
+        print(f"Error while sorting: {exc}")
+        return 3
+    try:
+        lines = [f"{q}: {v}" for q, v in zip(qs, res)]
+        _write_output(lines, ns.output, write_buffer)
+    except Exception as exc:
+        print(f"Error writing output file: {exc}")
+        return 3
+    return 0
+
+
+def merge_main(argv: List[str]) -> int:
+    """``sortItOut merge``: stream a k-way merge of already sorted files."""
+    parser = argparse.ArgumentParser(
+        prog="sortItOut merge",
+        description="merge files that are already sorted into one sorted output",
+    )
+    parser.add_argument("files", nargs="+", help="sorted input files")
+    parser.add_argument(
+        "-o", "--output", help="output file (default: stdout), one value per line"
+    )
+    parser.add_argument(
+        "--type",
+        choices=PARSE_TYPES,
+        default="auto",
+        help="value type of the input lines (default: auto)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="fail if an input is not actually sorted",
+    )
+    parser.add_argument(
+        "--reverse",
+        action="store_true",
+        help="inputs are sorted in descending order",
+    )
+    parser.add_argument(
+        "--read-buffer",
+        default=str(MERGE_BUFFER_SIZE),
+        help="input buffer size per file, e.g. 256K (default: 64K)",
+    )
+    parser.add_argument(
+        "--write-buffer",
+        default=str(DEFAULT_BUFFER_SIZE),
+        help="output buffer size, e.g. 4M (default: 1M)",
+    )
+    ns = parser.parse_args(argv)
+    try:
+        read_buffer = parse_memory_limit(ns.read_buffer)
+        write_buffer = parse_memory_limit(ns.write_buffer)
+    except ValueError as exc:
+        print(exc)
+        return 2
+    try:
+        with open_output(ns.output, write_buffer) as out:
+            merge_sorted_files(
+                ns.files,
+                out,
+                ns.type,
+                check=ns.check,
+                reverse=ns.reverse,
+                buffer_size=read_buffer,
+            )
+    except Exception as exc:
+        print(f"Error while merging: {exc}")
+        return 3
+    return 0
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -51,6 +401,10 @@ def main(argv: Optional[List[str]] = None) -> int:
             return 3
         return 0
 
+    args = sys.argv[1:] if argv is None else argv
+    if args and args[0] == "merge":
+        return merge_main(args[1:])
+
     parser = argparse.ArgumentParser(prog="sortItOut")
     parser.add_argument(
         "-i",
@@ -79,6 +433,125 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=3,
         help="repeat times for timing (default: 3)",
     )
+    parser.add_argument(
+        "--gaps",
+        help=(
+            "gap sequence for Shell and Comb sort: " + ", ".join(sorted(GAP_SEQUENCES))
+        ),
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("python", "numpy"),
+        default="python",
+        help="run Counting, Radix, Bucket, Merge or Quick sort vectorized with "
+        "NumPy (default: python)",
+    )
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="with -s auto, print the algorithm Auto chose and why (to stderr)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="sort with N processes using parallel sample sort (0: one per CPU)",
+    )
+    parser.add_argument(
+        "--external",
+        action="store_true",
+        help="external merge sort for inputs larger than memory: sort bounded "
+        "chunks, spill them to temp files and merge",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        default=DEFAULT_MEMORY_LIMIT,
+        help=f"memory budget per chunk for --external, e.g. 2G "
+        f"(default: {DEFAULT_MEMORY_LIMIT})",
+    )
+    parser.add_argument(
+        "--type",
+        choices=PARSE_TYPES,
+        default="auto",
+        help="value type of the input lines; auto detects it from a sample "
+        "(default: auto)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        help="format of the input and output: text, raw little-endian int32, "
+        "int64 or float64, or npy (default: from the file extension, "
+        ".i32/.i64/.f64/.npy, else text)",
+    )
+    parser.add_argument(
+        "--inplace-mmap",
+        metavar="FILE",
+        help="sort the binary FILE in place in its memory-mapped pages with "
+        "Heap, Quick, Radix or Shell sort",
+    )
+    limit = parser.add_mutually_exclusive_group()
+    limit.add_argument(
+        "--top",
+        type=int,
+        metavar="K",
+        help="output only the K largest values, largest first, streaming the "
+        "input through a bounded heap",
+    )
+    limit.add_argument(
+        "--bottom",
+        type=int,
+        metavar="K",
+        help="output only the K smallest values, smallest first",
+    )
+    parser.add_argument(
+        "--quantiles",
+        metavar="Q[,Q...]",
+        help="print the given quantiles of the input instead of sorting it, "
+        "e.g. 0.5,0.95,0.99 (selection in expected linear time)",
+    )
+    dedup = parser.add_mutually_exclusive_group()
+    dedup.add_argument(
+        "--unique",
+        action="store_true",
+        help="output each distinct value once; only distinct values are sorted",
+    )
+    dedup.add_argument(
+        "--count",
+        action="store_true",
+        help="output 'COUNT VALUE' lines for the distinct values, like uniq -c",
+    )
+    parser.add_argument(
+        "--key-column",
+        metavar="N[:TYPE][,N[:TYPE]...]",
+        help="sort delimited records by these 1-based columns, most significant "
+        "first, e.g. 3:float,1; TYPE is int, float, str or auto (default: --type) "
+        "and the original lines are written in the new order",
+    )
+    parser.add_argument(
+        "--delimiter",
+        help="field delimiter of the records, '\\t' or 'tab' for tabs (default: "
+        "tab for .tsv input, else ','); implies --key-column 1 if not given",
+    )
+    parser.add_argument(
+        "--header",
+        action="store_true",
+        help="keep the first line of the records at the top, unsorted",
+    )
+    parser.add_argument(
+        "--stream-counting",
+        action="store_true",
+        help="counting sort for small-range integers that builds the histogram "
+        "while reading, in memory proportional to the distinct values only",
+    )
+    parser.add_argument(
+        "--read-buffer",
+        default=str(DEFAULT_BUFFER_SIZE),
+        help="input buffer size, e.g. 4M (default: 1M)",
+    )
+    parser.add_argument(
+        "--write-buffer",
+        default=str(DEFAULT_BUFFER_SIZE),
+        help="output buffer size, e.g. 4M (default: 1M)",
+    )
     ns = parser.parse_args(argv)
 
     if ns.gui:
@@ -89,6 +562,19 @@ def main(argv: Optional[List[str]] = None) -> int:
             return 3
         return 0
 
+    try:
+        buffers = (
+            parse_memory_limit(ns.read_buffer),
+            parse_memory_limit(ns.write_buffer),
+        )
+    except ValueError as exc:
+        print(exc)
+        return 2
+
+    ns.records = bool(ns.key_column or ns.delimiter or ns.header)
+    ns.input_format = ns.format or format_for_path(ns.input)
+    ns.output_format = ns.format or format_for_path(ns.output)
+
     alg_raw = ns.sort
     # Try exact (capitalized) name first, otherwise case-insensitive lookup
     algorithm = ALGORITHMS.get(alg_raw) or ALGORITHMS_LOWER.get(alg_raw.lower())
@@ -100,33 +586,111 @@ def main(argv: Optional[List[str]] = None) -> int:
     # Determine display name (the canonical capitalized name)
     display_name = next((n for n, f in ALGORITHMS.items() if f is algorithm), alg_raw)
 
-    data = read_input(ns.input)
+    if ns.gaps:
+        if "gaps" not in inspect.signature(algorithm).parameters:
+            print(f"--gaps is not supported by {display_name} sort")
+            return 2
+        if ns.gaps.lower() not in GAP_SEQUENCES:
+            names = ", ".join(sorted(GAP_SEQUENCES))
+            print(f"Unknown gap sequence: {ns.gaps}\nAvailable: {names}")
+            return 2
+        algorithm = partial(algorithm, gaps=ns.gaps)
+
+    if ns.backend != "python":
+        if "backend" not in inspect.signature(algorithm).parameters:
+            print(f"--backend {ns.backend} is not supported by {display_name} sort")
+            return 2
+        algorithm = partial(algorithm, backend=ns.backend)
+
+    if ns.inplace_mmap:
+        return _run_inplace_mmap(ns, display_name, algorithm)
+
+    if ns.quantiles:
+        return _run_quantiles(ns, buffers)
+
+    if ns.stream_counting:
+        return _run_stream_counting(ns, buffers)
+
+    if ns.top is not None or ns.bottom is not None:
+        return _run_partial(ns, buffers)
+
+    if ns.workers is not None and ns.workers != 1:
+        if ns.workers < 0:
+            print("--workers must be >= 0")
+            return 2
+        if ns.explain:
+            # Each worker makes its own choice for its key range.
+            print("--explain is not supported with --workers")
+            return 2
+        # Workers look the algorithm up by name; bound options travel along.
+        options = algorithm.keywords if isinstance(algorithm, partial) else {}
+        algorithm = partial(
+            parallel_sort,
+            algorithm=display_name,
+            workers=ns.workers or None,
+            **options,
+        )
+
+    choices: List = []
+    if ns.explain and algorithm is auto_sort:
+        algorithm = partial(algorithm, report=choices.append)
+
+    if ns.unique or ns.count:
+        return _run_dedup(ns, algorithm, buffers, choices)
+
+    if ns.records:
+        return _run_records(ns, algorithm, buffers, choices)
+
+    if ns.external:
+        return _run_external(ns, algorithm, buffers, choices)
+
+    read_buffer, write_buffer = buffers
+    t0 = time.perf_counter()
+    try:
+        if ns.input_format == "text":
+            data = read_input(ns.input, read_buffer, ns.type)
+        else:
+            # Binary input is mapped, not parsed, and sorted in place.
+            data = load_values(ns.input, ns.input_format)
+    except (OSError, ValueError) as exc:
+        print(f"Error reading input: {exc}")
+        return 3
+    parse_time = time.perf_counter() - t0
 
     if ns.time:
         try:
             t = time_sort(algorithm, data, repeat=ns.repeat)
+            algorithm(data, inplace=True)
         except Exception as exc:
             print(f"Error while timing: {exc}")
             return 3
+        # Time the output phase too: to -o if given, else to the null device.
+        t0 = time.perf_counter()
+        try:
+            _write_output(data, ns.output or os.devnull, write_buffer, ns.output_format)
+        except Exception as exc:
+            print(f"Error writing output file: {exc}")
+            return 3
+        write_time = time.perf_counter() - t0
         print(f"{display_name}: {t:.6f} sec (avg over {ns.repeat} runs)")
+        print(
+            f"parse: {parse_time:.6f} sec, sort: {t:.6f} sec, "
+            f"write: {write_time:.6f} sec"
+        )
     else:
         try:
-            out = algorithm(data)
+            # The parsed list is ours: sort it in place instead of copying.
+            algorithm(data, inplace=True)
         except Exception as exc:
             print(f"Error while sorting: {exc}")
             return 3
-        # If an output file is provided, write results there; otherwise print to stdout
-        if ns.output:
-            try:
-                with open(ns.output, "w", encoding="utf-8") as fh:
-                    for item in out:
-                        fh.write(f"{item}\n")
-            except Exception as exc:
-                print(f"Error writing output file: {exc}")
-                return 3
-        else:
-            for item in out:
-                print(item)
+        # Write to the output file if given, otherwise to stdout
+        try:
+            _write_output(data, ns.output, write_buffer, ns.output_format)
+        except Exception as exc:
+            print(f"Error writing output file: {exc}")
+            return 3
+    _print_choice(choices)
     return 0
 
 
@@ -0,0 +1,71 @@
+"""Duplicate-collapsing sorts: sorted unique values and frequency counts.
+
+Instead of sorting every item and collapsing equal neighbours afterwards
+(``sort | uniq -c``), the items are counted into a hash table while
+they are read and only the distinct values are sorted, with any
+algorithm; every algorithm, Counting and Radix included, sees just those
+keys. On heavily duplicated data the sort shrinks from ``n`` to the
+number of distinct values. Unhashable items cannot be counted; only then
+is everything sorted in full and equal runs collapsed in one pass over
+the sorted output.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Tuple
+
+from .sorts import merge_sort
+
+# Items counted per step.
+_BLOCK = 1 << 16
+
+
+def _collapse_runs(items: List) -> List[Tuple[Any, int]]:
+    """Return ``(value, count)`` for each run of equal neighbours."""
+    pairs: List[List] = []
+    for x in items:
+        if pairs and pairs[-1][0] == x:
+            pairs[-1][1] += 1
+        else:
+            pairs.append([x, 1])
+    return [(v, c) for v, c in pairs]
+
+
+def sort_counts(
+    data: Iterable, algorithm: Callable = merge_sort, reverse: bool = False
+) -> List[Tuple[Any, int]]:
+    """Return ``(value, count)`` pairs for the distinct values of ``data``,
+    sorted with ``algorithm`` (ascending, descending for ``reverse``).
+
+    ``data`` may be any iterable and is read once; hashable values are
+    counted as they are read, so only the distinct values are ever held
+    and sorted. Values that are equal (e.g. ``1`` and ``1.0``) count as
+    one, represented by the first one seen.
+    """
+    it = iter(data)
+    hist: Counter = Counter()
+    while True:
+        block = list(islice(it, _BLOCK))
+        if not block:
+            break
+        try:
+            hist.update(Counter(block))
+        except TypeError:
+            # Unhashable item: sort everything in full instead.
+            items = list(hist.elements())
+            items.extend(block)
+            items.extend(it)
+            return _collapse_runs(algorithm(items, reverse=reverse))
+    return [(v, hist[v]) for v in algorithm(list(hist), reverse=reverse)]
+
+
+def sort_unique(
+    data: Iterable, algorithm: Callable = merge_sort, reverse: bool = False
+) -> List:
+    """Return the distinct values of ``data`` sorted with ``algorithm``;
+    see :func:`sort_counts`."""
+    return [v for v, _ in sort_counts(data, algorithm, reverse)]
+
+
+__all__ = ["sort_counts", "sort_unique"]
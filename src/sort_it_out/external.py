@@ -0,0 +1,229 @@
+"""External (out-of-core) merge sort for inputs larger than memory.
+
+:func:`external_sort` reads values in chunks that fit a memory budget,
+sorts each chunk with any registered algorithm and spills it to a
+temporary file as a sorted run. The runs are then combined with a
+heap-based k-way merge (:func:`kway_merge`), in several passes when there
+are more runs than can be open at once, and the last pass streams
+straight to the output. Peak memory is one chunk during the first phase
+and one buffered line per open run during merging.
+
+:func:`merge_sorted_files` applies the same merge to inputs that are
+already sorted (e.g. per-shard outputs), optionally checking that they
+really are, so combining them costs one linear pass instead of a sort.
+"""
+from __future__ import annotations
+
+import os
+import re
+import sys
+import tempfile
+from itertools import chain, count
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TextIO
+
+from .heaps import min_heap_pop, min_heap_replace, min_heapify
+from .sorts import KeyFunc, merge_sort
+from .streams import iter_values, write_values
+
+# Default --memory-limit for the CLI.
+DEFAULT_MEMORY_LIMIT = "512M"
+# Runs merged at once; more runs trigger intermediate merge passes.
+DEFAULT_FAN_IN = 64
+# Read buffer per input of merge_sorted_files: many inputs are open at once.
+MERGE_BUFFER_SIZE = 64 << 10
+# Per-item bookkeeping not counted by sys.getsizeof: the list slot.
+_SLOT_BYTES = 8
+
+_END = object()
+
+_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def parse_memory_limit(text: str) -> int:
+    """Parse sizes such as ``"2G"``, ``"512M"``, ``"64KB"`` or ``"1000"``
+    (binary units) into a number of bytes."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)I?B?\s*", text.upper())
+    if not match:
+        raise ValueError(f"Invalid memory size: {text!r} (use e.g. 512M or 2G)")
+    size = int(float(match.group(1)) * _UNITS[match.group(2)])
+    if size <= 0:
+        raise ValueError("memory limit must be positive")
+    return size
+
+
+class _Reversed:
+    """Heap entry ordering keys descending, runs ascending."""
+
+    __slots__ = ("key", "run", "value")
+
+    def __init__(self, key, run: int, value) -> None:
+        self.key = key
+        self.run = run
+        self.value = value
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        if self.key == other.key:
+            return self.run < other.run
+        return other.key < self.key
+
+
+def kway_merge(
+    iterables: Iterable[Iterable], key: KeyFunc = None, reverse: bool = False
+) -> Iterator:
+    """Lazily merge sorted iterables into one sorted stream.
+
+    Each input must already be sorted by ``key`` (descending for
+    ``reverse``). The merge is stable: equal items come out in the order
+    of the iterables they came from. Only one item per input is held.
+    """
+    heap: List = []
+    iterators = [iter(it) for it in iterables]
+    for run, it in enumerate(iterators):
+        for value in it:
+            k = value if key is None else key(value)
+            heap.append(_Reversed(k, run, value) if reverse else [k, run, value])
+            break
+    min_heapify(heap)
+    while heap:
+        top = heap[0]
+        if reverse:
+            run, value = top.run, top.value
+        else:
+            run, value = top[1], top[2]
+        for nxt in iterators[run]:
+            k = nxt if key is None else key(nxt)
+            min_heap_replace(heap, _Reversed(k, run, nxt) if reverse else [k, run, nxt])
+            break
+        else:
+            min_heap_pop(heap)
+        yield value
+
+
+def check_sorted(
+    values: Iterable, label: str = "input", key: KeyFunc = None, reverse: bool = False
+) -> Iterator:
+    """Yield ``values``, raising ``ValueError`` at the first item that is
+    out of order (ascending, or descending for ``reverse``)."""
+    prev = _END
+    for i, value in enumerate(values, 1):
+        k = value if key is None else key(value)
+        if prev is not _END and (prev < k if reverse else k < prev):
+            raise ValueError(f"{label} is not sorted at item {i}: {value!r}")
+        prev = k
+        yield value
+
+
+def _read_run(path: str, parse: Callable[[str], Any]) -> Iterator:
+    with open(path, "r", encoding="utf-8", newline="\n") as fh:
+        for line in fh:
+            yield parse(line[:-1])
+
+
+def _chunks(values: Iterable, budget: int) -> Iterator[List]:
+    """Group ``values`` into lists that end as soon as their estimated
+    size reaches ``budget`` bytes."""
+    chunk: List = []
+    used = 0
+    for value in values:
+        chunk.append(value)
+        used += sys.getsizeof(value) + _SLOT_BYTES
+        if used >= budget:
+            yield chunk
+            chunk = []
+            used = 0
+    if chunk:
+        yield chunk
+
+
+def external_sort(
+    values: Iterable,
+    out: TextIO,
+    algorithm: Callable = merge_sort,
+    memory_limit: int = parse_memory_limit(DEFAULT_MEMORY_LIMIT),
+    parse: Callable[[str], Any] = str,
+    key: KeyFunc = None,
+    reverse: bool = False,
+    fan_in: int = DEFAULT_FAN_IN,
+    tmp_dir: Optional[str] = None,
+) -> int:
+    """Sort the stream ``values`` into the text or binary stream ``out``
+    (one value per line) and return the number of values written.
+
+    ``memory_limit`` bounds the bytes of values held per chunk (estimated
+    with :func:`sys.getsizeof`). Each chunk is sorted in place with
+    ``algorithm`` and spilled as a run of text lines; ``parse`` turns a
+    run line back into a value, so ``parse(str(value))`` must reproduce
+    ``value``. At most ``fan_in`` runs are merged at once. Temporary
+    files go to ``tmp_dir`` (default: the system temp directory) and are
+    removed afterwards. Input that fits a single chunk is never spilled.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be >= 2")
+    it = iter(values)
+    chunks = _chunks(it, memory_limit)
+    first = next(chunks, [])
+    algorithm(first, key=key, reverse=reverse, inplace=True)
+    peek = next(it, _END)
+    if peek is _END:
+        return write_values(first, out)
+    with tempfile.TemporaryDirectory(prefix="sortitout-", dir=tmp_dir) as tmp:
+        names = count()
+
+        def spill(run: Iterable) -> str:
+            path = os.path.join(tmp, f"run{next(names)}.txt")
+            with open(path, "w", encoding="utf-8", newline="\n") as fh:
+                write_values(run, fh)
+            return path
+
+        runs = [spill(first)]
+        del first
+        for chunk in _chunks(chain([peek], it), memory_limit):
+            algorithm(chunk, key=key, reverse=reverse, inplace=True)
+            runs.append(spill(chunk))
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i : i + fan_in]
+                readers = [_read_run(path, parse) for path in group]
+                merged.append(spill(kway_merge(readers, key, reverse)))
+                for path in group:
+                    os.remove(path)
+            runs = merged
+        readers = [_read_run(path, parse) for path in runs]
+        return write_values(kway_merge(readers, key, reverse), out)
+
+
+def merge_sorted_files(
+    paths: Iterable[str],
+    out: TextIO,
+    kind: str = "auto",
+    check: bool = False,
+    reverse: bool = False,
+    buffer_size: int = MERGE_BUFFER_SIZE,
+) -> int:
+    """Merge the sorted files ``paths`` (one value per line, parsed as
+    ``kind``) into the text or binary stream ``out`` and return the number
+    of values written.
+
+    Each file is streamed through a buffer of ``buffer_size`` bytes, so
+    memory grows with the number of files, not their size. Files must be
+    sorted ascending (descending for ``reverse``); with ``check`` an
+    unsorted file raises ``ValueError`` naming it.
+    """
+    readers = []
+    for path in paths:
+        values = iter_values(path, kind, buffer_size)
+        readers.append(check_sorted(values, path, reverse=reverse) if check else values)
+    return write_values(kway_merge(readers, reverse=reverse), out)
+
+
+__all__ = [
+    "DEFAULT_MEMORY_LIMIT",
+    "MERGE_BUFFER_SIZE",
+    "check_sorted",
+    "merge_sorted_files",
+    "DEFAULT_FAN_IN",
+    "parse_memory_limit",
+    "kway_merge",
+    "external_sort",
+]
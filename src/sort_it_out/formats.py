@@ -0,0 +1,201 @@
+"""Binary input/output formats.
+
+Besides newline-separated text, SortItOut reads and writes packed
+little-endian ``int32``, ``int64`` and ``float64`` files and 1-D NumPy
+``.npy`` files (without needing NumPy). Binary files are memory-mapped
+copy-on-write and exposed as a typed :class:`memoryview`, so loading
+parses nothing and copies nothing, and the algorithms can sort the view
+in place (``inplace=True``) without touching the file. Writing is a
+single bulk write of the packed values.
+"""
+from __future__ import annotations
+
+import ast
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+from array import array
+from typing import Dict, Iterable, Optional, Tuple
+
+FORMATS = ("text", "int32", "int64", "float64", "npy")
+
+# Raw formats -> array/memoryview typecode (all little-endian on disk).
+_RAW_TYPECODES: Dict[str, str] = {"int32": "i", "int64": "q", "float64": "d"}
+
+_EXTENSIONS: Dict[str, str] = {
+    ".npy": "npy",
+    ".i32": "int32",
+    ".int32": "int32",
+    ".i64": "int64",
+    ".int64": "int64",
+    ".f64": "float64",
+    ".float64": "float64",
+}
+
+# .npy dtype descriptors we can map onto a typecode; "|" means no byte order.
+_NPY_TYPECODES: Dict[str, str] = {
+    "|i1": "b",
+    "|u1": "B",
+    "<i2": "h",
+    "<u2": "H",
+    "<i4": "i",
+    "<u4": "I",
+    "<i8": "q",
+    "<u8": "Q",
+    "<f4": "f",
+    "<f8": "d",
+}
+_NPY_MAGIC = b"\x93NUMPY"
+
+
+def format_for_path(path: Optional[str]) -> str:
+    """Return the format implied by the extension of ``path`` (``text`` for
+    unknown extensions, stdin/stdout and ``None``)."""
+    if not path or path == "-":
+        return "text"
+    return _EXTENSIONS.get(os.path.splitext(path)[1].lower(), "text")
+
+
+def _check_format(fmt: str) -> None:
+    if fmt not in FORMATS or fmt == "text":
+        names = ", ".join(FORMATS[1:])
+        raise ValueError(f"Unknown binary format: {fmt}. Available: {names}")
+
+
+def _parse_npy_header(buf) -> Tuple[str, int]:
+    """Return the typecode and data offset of the ``.npy`` bytes ``buf``."""
+    if bytes(buf[:6]) != _NPY_MAGIC:
+        raise ValueError("not a .npy file")
+    major = buf[6]
+    if major == 1:
+        size, start = int.from_bytes(buf[8:10], "little"), 10
+    else:
+        size, start = int.from_bytes(buf[8:12], "little"), 12
+    header = ast.literal_eval(bytes(buf[start : start + size]).decode("latin1"))
+    descr = header["descr"]
+    if descr not in _NPY_TYPECODES:
+        raise ValueError(f"unsupported .npy dtype: {descr}")
+    if header["fortran_order"] or len(header["shape"]) != 1:
+        raise ValueError(".npy file must hold a 1-D array")
+    return _NPY_TYPECODES[descr], start + size
+
+
+def _layout(buf, fmt: str) -> Tuple[str, int]:
+    """Return the typecode and data offset of ``buf`` holding ``fmt``,
+    checking that the data is a whole number of items."""
+    if fmt == "npy":
+        typecode, offset = _parse_npy_header(buf)
+    else:
+        typecode, offset = _RAW_TYPECODES[fmt], 0
+    itemsize = array(typecode).itemsize
+    if (len(buf) - offset) % itemsize:
+        raise ValueError(f"file size is not a multiple of {itemsize} bytes")
+    return typecode, offset
+
+
+def _view(buf, fmt: str) -> memoryview:
+    typecode, offset = _layout(buf, fmt)
+    data = memoryview(buf)[offset:]
+    itemsize = array(typecode).itemsize
+    if sys.byteorder == "big" and itemsize > 1:
+        # Files are little-endian: swap into a private native copy.
+        values = array(typecode, bytes(data))
+        values.byteswap()
+        return memoryview(values)
+    return data.cast(typecode)
+
+
+def load_values(path: Optional[str], fmt: str) -> memoryview:
+    """Map the binary file ``path`` (stdin for ``None`` or ``"-"``) and
+    return a writable typed memoryview of its values.
+
+    Files are mapped copy-on-write: writes through the view (e.g. sorting
+    it in place) never reach the file. Stdin is read into memory.
+    """
+    _check_format(fmt)
+    if not path or path == "-":
+        return _view(bytearray(sys.stdin.buffer.read()), fmt)
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return _view(bytearray(), fmt)
+        mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_COPY)
+    return _view(mapped, fmt)
+
+
+def _npy_header(typecode: str, n: int) -> bytes:
+    descr = next(d for d, t in _NPY_TYPECODES.items() if t == typecode)
+    text = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({n},), }}"
+    # Magic, version 1.0, header length, then padding to a 64-byte boundary.
+    pad = -(len(_NPY_MAGIC) + 4 + len(text) + 1) % 64
+    text += " " * pad + "\n"
+    return _NPY_MAGIC + b"\x01\x00" + len(text).to_bytes(2, "little") + text.encode()
+
+
+def pack_values(values: Iterable, fmt: str, typecode: Optional[str] = None):
+    """Return ``values`` as a buffer of packed native values for ``fmt``.
+
+    Typed memoryviews and arrays with the right typecode are used as they
+    are; ``typecode`` picks the ``.npy`` dtype (default: the typecode of
+    ``values`` if it has one, else ``int64`` for ints and ``float64``).
+    """
+    _check_format(fmt)
+    have = getattr(values, "format", None) or getattr(values, "typecode", None)
+    if fmt != "npy":
+        typecode = _RAW_TYPECODES[fmt]
+    elif typecode is None:
+        typecode = have if have in _NPY_TYPECODES.values() else None
+    if typecode is None:
+        values = values if isinstance(values, list) else list(values)
+        is_int = all(isinstance(x, int) for x in values)
+        typecode = "q" if is_int else "d"
+    if have == typecode:
+        return values
+    return array(typecode, values)
+
+
+def save_values(values: Iterable, path: Optional[str], fmt: str) -> None:
+    """Write ``values`` to ``path`` (stdout for ``None``) in the binary
+    format ``fmt`` with one bulk write (plus the header for ``.npy``).
+
+    An existing regular file is replaced rather than truncated, so
+    ``values`` may be a view still mapping that very file.
+    """
+    packed = memoryview(pack_values(values, fmt))
+    header = _npy_header(packed.format, len(packed)) if fmt == "npy" else b""
+    data = packed.cast("B")
+    if sys.byteorder == "big" and packed.itemsize > 1:
+        swapped = array(packed.format, packed)
+        swapped.byteswap()
+        data = memoryview(swapped).cast("B")
+    if path and os.path.isfile(path):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with open(fd, "wb") as fh:
+                fh.write(header)
+                fh.write(data)
+            shutil.copymode(path, tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        return
+    if path:
+        with open(path, "wb") as fh:
+            fh.write(header)
+            fh.write(data)
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(header)
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
+__all__ = [
+    "FORMATS",
+    "format_for_path",
+    "load_values",
+    "pack_values",
+    "save_values",
+]
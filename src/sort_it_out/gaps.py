@@ -0,0 +1,151 @@
+"""Gap sequences for shell sort and comb sort.
+
+Each generator returns the ascending gaps smaller than ``n`` (always
+starting at 1). :func:`gap_sequence` looks a sequence up by name and
+caches the descending tuple per ``(name, n)`` so repeated sorts of the
+same size do not recompute it.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Tuple, Union
+
+# Ciura's empirically derived gaps; extended geometrically by 2.25.
+_CIURA = (1, 4, 10, 23, 57, 132, 301, 701, 1750)
+
+
+def ciura_gaps(n: int) -> List[int]:
+    gaps = [g for g in _CIURA if g < n]
+    if not gaps:
+        return [1]
+    if gaps[-1] == _CIURA[-1]:
+        g = int(gaps[-1] * 2.25)
+        while g < n:
+            gaps.append(g)
+            g = int(g * 2.25)
+    return gaps
+
+
+def tokuda_gaps(n: int) -> List[int]:
+    gaps = [1]
+    k = 1
+    while True:
+        # ceil((9 * (9/4)**k - 4) / 5) computed with integers
+        num = 9 * 9**k - 4 * 4**k
+        den = 5 * 4**k
+        g = -(-num // den)
+        if g >= n:
+            return gaps
+        gaps.append(g)
+        k += 1
+
+
+def sedgewick_gaps(n: int) -> List[int]:
+    # Sedgewick (1986): 1, then 4**k + 3 * 2**(k - 1) + 1
+    gaps = [1]
+    k = 1
+    while True:
+        g = 4**k + 3 * 2 ** (k - 1) + 1
+        if g >= n:
+            return gaps
+        gaps.append(g)
+        k += 1
+
+
+def pratt_gaps(n: int) -> List[int]:
+    # Every 3-smooth number 2**p * 3**q below n, generated in order
+    gaps = [1]
+    i2 = i3 = 0
+    while True:
+        by2 = gaps[i2] * 2
+        by3 = gaps[i3] * 3
+        g = by2 if by2 < by3 else by3
+        if g >= n:
+            return gaps
+        gaps.append(g)
+        if g == by2:
+            i2 += 1
+        if g == by3:
+            i3 += 1
+
+
+def knuth_gaps(n: int) -> List[int]:
+    # (3**k - 1) / 2, capped at ceil(n / 3) as Knuth recommends
+    gaps = [1]
+    g = 4
+    while g < n and g <= -(-n // 3):
+        gaps.append(g)
+        g = 3 * g + 1
+    return gaps
+
+
+def shell_gaps(n: int) -> List[int]:
+    # Shell's original halving sequence: n // 2, n // 4, ..., 1
+    gaps = []
+    g = n // 2
+    while g > 0:
+        gaps.append(g)
+        g //= 2
+    gaps.reverse()
+    return gaps or [1]
+
+
+def comb_gaps(n: int) -> List[int]:
+    # Comb sort's classic shrink factor of 1.3
+    gaps = []
+    g = int(n / 1.3)
+    while g > 1:
+        gaps.append(g)
+        g = int(g / 1.3)
+    gaps.append(1)
+    gaps.reverse()
+    return gaps
+
+
+GAP_SEQUENCES: Dict[str, Callable[[int], List[int]]] = {
+    "ciura": ciura_gaps,
+    "tokuda": tokuda_gaps,
+    "sedgewick": sedgewick_gaps,
+    "pratt": pratt_gaps,
+    "knuth": knuth_gaps,
+    "shell": shell_gaps,
+    "comb": comb_gaps,
+}
+
+
+@lru_cache(maxsize=256)
+def _cached_sequence(name: str, n: int) -> Tuple[int, ...]:
+    return tuple(reversed(GAP_SEQUENCES[name](n)))
+
+
+def gap_sequence(gaps: Union[str, Iterable[int]], n: int) -> Tuple[int, ...]:
+    """Return the gaps to use for ``n`` items, largest first.
+
+    ``gaps`` is either a name from :data:`GAP_SEQUENCES` (case-insensitive)
+    or an explicit iterable of positive integers. Explicit sequences are
+    sorted, filtered to gaps below ``n`` and always end with 1.
+    """
+    if isinstance(gaps, str):
+        name = gaps.lower()
+        if name not in GAP_SEQUENCES:
+            names = ", ".join(sorted(GAP_SEQUENCES))
+            raise ValueError(f"Unknown gap sequence: {gaps}. Available: {names}")
+        return _cached_sequence(name, n)
+    custom = {int(g) for g in gaps}
+    if any(g < 1 for g in custom):
+        raise ValueError("gaps must be positive integers")
+    custom.add(1)
+    return tuple(g for g in sorted(custom, reverse=True) if g < n or g == 1)
+
+
+__all__ = [
+    "GAP_SEQUENCES",
+    "gap_sequence",
+    "ciura_gaps",
+    "tokuda_gaps",
+    "sedgewick_gaps",
+    "pratt_gaps",
+    "knuth_gaps",
+    "shell_gaps",
+    "comb_gaps",
+]
@@ -14,6 +14,8 @@ from tkinter import filedialog, messagebox, ttk
 
 from . import __version__
 from .algorithms import ALGORITHMS, ALGORITHMS_LOWER
+from .auto import auto_sort
+from .parsing import parse_values
 from .sorts import time_sort
 
 # Optional markdown -> HTML rendering support
@@ -28,24 +30,10 @@ except Exception:
     _MD_HTML_AVAILABLE = False
 
 
-def _parse_value(s: str):
-    s = s.strip()
-    if s == "":
-        return s
-    try:
-        return int(s)
-    except Exception:
-        pass
-    try:
-        return float(s)
-    except Exception:
-        return s
-
-
 def _parse_input(text: str):
     # Accept newline- or comma-separated values
     parts = [p for line in text.splitlines() for p in line.split(",")]
-    return [_parse_value(p) for p in parts if p.strip() != ""]
+    return parse_values([p for p in parts if p.strip() != ""])
 
 
 def run_gui():
@@ -235,15 +223,9 @@ def run_gui():
                 if has_int and not has_float and not has_str:
                     allowed.append(name)
             elif lname == "bucket":
-                # bucket expects floats in [0,1)
+                # bucket accepts any numeric data
                 if not has_str and (has_float or has_int):
-                    # check values are floats in [0,1)
-                    try:
-                        vals = [float(x) for x in data_list]
-                    except Exception:
-                        continue
-                    if vals and all(0.0 <= v < 1.0 for v in vals):
-                        allowed.append(name)
+                    allowed.append(name)
             else:
                 # comparison-based algorithms: require homogeneous comparable types
                 if has_str and not (has_int or has_float):
@@ -316,9 +298,12 @@ def run_gui():
         if alg is None:
             messagebox.showerror("Error", f"Unknown algorithm: {alg_raw}")
             return
+        # Auto reports the engine it picked so it can be shown below.
+        choices = []
+        kwargs = {"report": choices.append} if alg is auto_sort else {}
         try:
             t0 = time.perf_counter()
-            res = alg(data)
+            res = alg(data, **kwargs)
             t1 = time.perf_counter()
             elapsed = t1 - t0
         except Exception as exc:
@@ -326,7 +311,10 @@ def run_gui():
             return
         output_text.delete("1.0", "end")
         output_text.insert("1.0", "\n".join(str(x) for x in res))
-        time_label.config(text=f"Last sort: {elapsed:.6f} sec")
+        label = f"Last sort: {elapsed:.6f} sec"
+        if choices:
+            label += f" (Auto chose {choices[0].algorithm}: {choices[0].reason})"
+        time_label.config(text=label)
 
     def do_time():
         txt = input_text.get("1.0", "end")
@@ -0,0 +1,152 @@
+"""Binary heap primitives shared by SortItOut features.
+
+The heap lives in a slice ``heap[lo:end]`` of a mutable sequence, so the
+same primitives serve heap sort, the introsort fallback and any feature
+that needs a bounded priority queue. Node ``i`` (relative to ``lo``) has
+children ``2 * i + 1`` and ``2 * i + 2``. All functions compare with
+``<`` only. The ``sift``/``heapify`` functions maintain a max-heap; the
+``min_heap_*`` functions keep a min-heap in a whole list, as a priority
+queue.
+"""
+from __future__ import annotations
+
+from typing import List
+
+
+def sift_down(heap: List, lo: int, pos: int, end: int) -> None:
+    """Restore the max-heap property below node ``pos`` of ``heap[lo:end]``.
+
+    Uses Floyd's bottom-up strategy: the hole at ``pos`` is first moved
+    down to a leaf along the path of larger children (one comparison per
+    level), then the displaced item is sifted back up. Items taken from
+    the bottom of a heap rarely climb far, so this needs roughly half the
+    comparisons of the textbook sift-down.
+    """
+    size = end - lo
+    item = heap[lo + pos]
+    start = pos
+    child = 2 * pos + 1
+    while child < size:
+        right = child + 1
+        if right < size and heap[lo + child] < heap[lo + right]:
+            child = right
+        heap[lo + pos] = heap[lo + child]
+        pos = child
+        child = 2 * pos + 1
+    # Inlined sift_up: this is the hot loop of heap sort.
+    while pos > start:
+        parent = (pos - 1) >> 1
+        above = heap[lo + parent]
+        if above < item:
+            heap[lo + pos] = above
+            pos = parent
+        else:
+            break
+    heap[lo + pos] = item
+
+
+def sift_up(heap: List, lo: int, start: int, pos: int) -> None:
+    """Move node ``pos`` of ``heap[lo:]`` up until its parent is not smaller.
+
+    ``start`` is the highest node the item may reach (``0`` for the
+    root).
+    """
+    item = heap[lo + pos]
+    while pos > start:
+        parent = (pos - 1) >> 1
+        above = heap[lo + parent]
+        if above < item:
+            heap[lo + pos] = above
+            pos = parent
+        else:
+            break
+    heap[lo + pos] = item
+
+
+def heapify(heap: List, lo: int, end: int) -> None:
+    """Arrange ``heap[lo:end]`` into a max-heap in O(n)."""
+    for pos in range((end - lo) // 2 - 1, -1, -1):
+        sift_down(heap, lo, pos, end)
+
+
+def heap_sort_range(arr: List, lo: int, hi: int) -> None:
+    """Sort ``arr[lo:hi]`` in place with O(1) extra memory."""
+    heapify(arr, lo, hi)
+    for end in range(hi - 1, lo, -1):
+        arr[lo], arr[end] = arr[end], arr[lo]
+        sift_down(arr, lo, 0, end)
+
+
+# Min-heap priority queue on a whole list (``heap[0]`` is the smallest
+# item), used by k-way merging and bounded top-k selection.
+
+
+def _min_sift_up(heap: List, pos: int) -> None:
+    item = heap[pos]
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        above = heap[parent]
+        if item < above:
+            heap[pos] = above
+            pos = parent
+        else:
+            break
+    heap[pos] = item
+
+
+def _min_sift_down(heap: List, pos: int) -> None:
+    # Floyd's bottom-up strategy, mirrored for a min-heap.
+    size = len(heap)
+    item = heap[pos]
+    start = pos
+    child = 2 * pos + 1
+    while child < size:
+        right = child + 1
+        if right < size and heap[right] < heap[child]:
+            child = right
+        heap[pos] = heap[child]
+        pos = child
+        child = 2 * pos + 1
+    while pos > start:
+        parent = (pos - 1) >> 1
+        above = heap[parent]
+        if item < above:
+            heap[pos] = above
+            pos = parent
+        else:
+            break
+    heap[pos] = item
+
+
+def min_heapify(heap: List) -> None:
+    """Arrange the list ``heap`` into a min-heap in O(n)."""
+    for pos in range(len(heap) // 2 - 1, -1, -1):
+        _min_sift_down(heap, pos)
+
+
+def min_heap_push(heap: List, item) -> None:
+    """Add ``item`` to the min-heap ``heap``."""
+    heap.append(item)
+    _min_sift_up(heap, len(heap) - 1)
+
+
+def min_heap_pop(heap: List):
+    """Remove and return the smallest item of the min-heap ``heap``."""
+    last = heap.pop()
+    if not heap:
+        return last
+    top = heap[0]
+    heap[0] = last
+    _min_sift_down(heap, 0)
+    return top
+
+
+def min_heap_replace(heap: List, item):
+    """Return the smallest item and put ``item`` in its place.
+
+    Cheaper than a pop followed by a push: one sift instead of two.
+    """
+    top = heap[0]
+    heap[0] = item
+    _min_sift_down(heap, 0)
+    return top
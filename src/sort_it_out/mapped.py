@@ -0,0 +1,136 @@
+"""In-place sorting of memory-mapped binary files.
+
+:func:`sort_mapped_file` maps a fixed-width binary file (see
+:mod:`sort_it_out.formats`) writable and sorts the values directly in
+its pages, so the operating system pages data in and out as the sort
+touches it and no Python list of the values is ever built. Only the
+algorithms that sort in place with O(1) or O(log n) extra memory are
+offered, plus radix sort, whose scatter buffer is a second mapping
+backed by a temporary file. Radix passes read the data in blocks of
+:data:`BLOCK` values, which bounds the Python objects alive at once.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from .formats import _layout, format_for_path
+from .sorts import _radix_bias, _radix_prefix, heap_sort, quick_sort, shell_sort
+
+# Values read per block by the mapped radix sort.
+BLOCK = 1 << 16
+
+
+def _radix_sort_mapped(
+    view: memoryview, bits: int = 8, tmp_dir: Optional[str] = None
+) -> None:
+    """LSD radix sort of the integer ``view`` with a file-backed scratch
+    mapping, reading ``BLOCK`` values at a time."""
+    if view.format in ("f", "d"):
+        raise TypeError("radix_sort requires integer inputs")
+    if bits < 1:
+        raise ValueError("bits must be >= 1")
+    n = len(view)
+    if n < 2:
+        return
+    lo_val, hi_val = min(view), max(view)
+    bias = _radix_bias(lo_val, hi_val)
+    key_bits = (hi_val + bias).bit_length()
+    radix = 1 << bits
+    mask = radix - 1
+    with tempfile.TemporaryFile(dir=tmp_dir) as fh:
+        fh.truncate(n * view.itemsize)
+        with mmap.mmap(fh.fileno(), 0) as scratch_map:
+            with memoryview(scratch_map) as raw, raw.cast(view.format) as scratch:
+                src, dst = view, scratch
+                shift = 0
+                while shift < key_bits:
+                    counts = [0] * radix
+                    for lo in range(0, n, BLOCK):
+                        for x in src[lo : lo + BLOCK].tolist():
+                            counts[((x + bias) >> shift) & mask] += 1
+                    if max(counts) != n:
+                        _radix_prefix(counts)
+                        for lo in range(0, n, BLOCK):
+                            for x in src[lo : lo + BLOCK].tolist():
+                                d = ((x + bias) >> shift) & mask
+                                dst[counts[d]] = x
+                                counts[d] += 1
+                        src, dst = dst, src
+                    shift += bits
+                if src is not view:
+                    view[:] = src
+
+
+def _sort_inplace(func: Callable) -> Callable:
+    def run(view: memoryview, tmp_dir: Optional[str] = None, **options: Any) -> None:
+        func(view, inplace=True, **options)
+
+    return run
+
+
+# In-place algorithms usable on a mapping; each takes the view, tmp_dir
+# and the algorithm's own options.
+MAPPED_ALGORITHMS: Dict[str, Callable[..., None]] = {
+    "Heap": _sort_inplace(heap_sort),
+    "Quick": _sort_inplace(quick_sort),
+    "Radix": _radix_sort_mapped,
+    "Shell": _sort_inplace(shell_sort),
+}
+
+
+@contextmanager
+def map_file(path: str, fmt: Optional[str] = None) -> Iterator[memoryview]:
+    """Map the binary file ``path`` writable and yield a typed view of its
+    values; writes through the view change the file. ``fmt`` defaults to
+    the format implied by the extension."""
+    fmt = fmt or format_for_path(path)
+    if fmt == "text":
+        raise ValueError(f"{path} is not a binary file; pass a binary format")
+    if sys.byteorder != "little":
+        raise ValueError("in-place sorting of mapped files needs a little-endian CPU")
+    with open(path, "r+b") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            if fmt == "npy":
+                raise ValueError("not a .npy file")
+            yield memoryview(bytearray()).cast(_layout(b"", fmt)[0])
+            return
+        with mmap.mmap(fh.fileno(), 0) as mapped:
+            typecode, offset = _layout(mapped, fmt)
+            with memoryview(mapped) as raw, raw[offset:] as data:
+                with data.cast(typecode) as view:
+                    yield view
+            mapped.flush()
+
+
+def sort_mapped_file(
+    path: str,
+    algorithm: str = "Quick",
+    fmt: Optional[str] = None,
+    tmp_dir: Optional[str] = None,
+    **options: Any,
+) -> int:
+    """Sort the binary file ``path`` in place and return its value count.
+
+    ``algorithm`` is one of :data:`MAPPED_ALGORITHMS` (case-insensitive);
+    extra ``options`` such as ``gaps`` for Shell or ``bits`` for Radix are
+    passed on to it. Radix sort's scratch file goes to ``tmp_dir``
+    (default: the system temp directory).
+    """
+    names = {name.lower(): func for name, func in MAPPED_ALGORITHMS.items()}
+    func = names.get(algorithm.lower())
+    if func is None:
+        available = ", ".join(MAPPED_ALGORITHMS)
+        raise ValueError(
+            f"Algorithm {algorithm} cannot sort a mapped file. Available: {available}"
+        )
+    with map_file(path, fmt) as view:
+        func(view, tmp_dir=tmp_dir, **options)
+        return len(view)
+
+
+__all__ = ["BLOCK", "MAPPED_ALGORITHMS", "map_file", "sort_mapped_file"]
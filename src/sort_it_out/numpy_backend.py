@@ -0,0 +1,421 @@
+"""Optional NumPy-vectorized backend for SortItOut's algorithms.
+
+These are the project's own algorithms expressed as whole-array NumPy
+operations (``bincount``, ``cumsum``, fancy-indexed scatter, vectorized
+digit extraction, ``searchsorted`` for merging) rather than calls to
+``np.sort``. They accept int or float data (anything ``np.asarray`` turns
+into an integer or floating array) and are selected with
+``backend="numpy"`` on the matching functions in :mod:`sort_it_out.sorts`.
+NaN values are taken out before sorting and placed at the end of the
+ascending result, as ``np.sort`` does.
+
+Heap sort has no vectorized variant: every sift depends on the previous
+one, so there is nothing to batch.
+"""
+from __future__ import annotations
+
+from functools import wraps
+from typing import Any, Callable, Dict, List, Tuple
+
+try:
+    import numpy as np
+
+    _NUMPY_AVAILABLE = True
+except Exception:
+    np = None
+    _NUMPY_AVAILABLE = False
+
+# Same guards as the pure-Python counting sort.
+from .sorts import _DENSE_SPAN_RATIO, _DENSE_SPAN_SLACK, COUNTING_MAX_RANGE
+
+# Rows sorted with a bitonic network before merging (power of two).
+_MERGE_BLOCK = 256
+# Quick sort partitions segments down to this size (power of two), then
+# finishes all of them at once with a batched bitonic network.
+_QUICK_BLOCK = 64
+# Light buckets are finished with at most this many odd-even rounds.
+_BUCKET_LIMIT = 32
+# Overflowing buckets are bucket sorted recursively up to this depth and
+# merge sorted below it, as in the pure-Python bucket sort.
+_BUCKET_MAX_DEPTH = 16
+
+
+def _require_numpy() -> None:
+    if not _NUMPY_AVAILABLE:
+        raise ImportError("backend='numpy' requires NumPy (pip install numpy)")
+
+
+def _as_numeric_array(data: Any):
+    _require_numpy()
+    try:
+        arr = np.asarray(data)
+    except OverflowError as exc:
+        raise TypeError(f"numpy backend cannot represent the input: {exc}")
+    if arr.ndim != 1:
+        arr = arr.reshape(-1)
+    if arr.dtype.kind not in "iuf":
+        raise TypeError("numpy backend requires integer or float inputs")
+    return arr
+
+
+def _nans_last(func: Callable) -> Callable:
+    """Run the sort ``func`` on the non-NaN values of a float input and
+    append the NaNs: comparisons with NaN are always false, so min/max
+    networks and partition masks would otherwise duplicate or drop
+    values."""
+
+    @wraps(func)
+    def sort(data: Any, **options):
+        arr = _as_numeric_array(data)
+        if arr.dtype.kind == "f":
+            nan = np.isnan(arr)
+            if nan.any():
+                return np.concatenate([func(arr[~nan], **options), arr[nan]])
+        return func(arr, **options)
+
+    return sort
+
+
+def _sortable_keys(arr) -> Tuple[Any, Callable]:
+    """Map ``arr`` to ``uint64`` keys whose unsigned order matches the
+    value order, and return them with the inverse mapping."""
+    sign = np.uint64(1 << 63)
+    if arr.dtype.kind == "u":
+        return arr.astype(np.uint64), lambda k: k.astype(arr.dtype)
+    if arr.dtype.kind == "i":
+        keys = arr.astype(np.int64).view(np.uint64) ^ sign
+        return keys, lambda k: (k ^ sign).view(np.int64).astype(arr.dtype)
+    # IEEE 754: flip every bit of negatives, only the sign bit of positives.
+    bits = arr.astype(np.float64).view(np.uint64)
+    negative = (bits & sign) != 0
+    keys = np.where(negative, ~bits, bits | sign)
+
+    def decode(k):
+        neg = (k & sign) == 0
+        return np.where(neg, ~k, k & ~sign).view(np.float64).astype(arr.dtype)
+
+    return keys, decode
+
+
+def _lsd_order(keys, bits: int):
+    """Return the stable permutation ordering the ``uint64`` ``keys``.
+
+    Each pass extracts one ``bits``-wide digit for every key at once and
+    reorders the items by a stable ``argsort`` of the digits. Digits are
+    stored in the narrowest unsigned type, for which NumPy's stable sort
+    is itself a linear-time radix pass, so a pass costs O(n) whatever
+    ``bits`` is.
+    """
+    n = len(keys)
+    perm = np.arange(n)
+    if n < 2:
+        return perm
+    key_bits = int(keys.max()).bit_length()
+    mask = np.uint64((1 << bits) - 1)
+    digit_type = np.min_scalar_type((1 << bits) - 1)
+    shift = 0
+    while shift < key_bits:
+        digits = ((keys[perm] >> np.uint64(shift)) & mask).astype(digit_type)
+        shift += bits
+        perm = perm[np.argsort(digits, kind="stable")]
+    return perm
+
+
+@_nans_last
+def radix_sort(data: Any, bits: int = 4):
+    """Vectorized LSD radix sort; returns a new ``ndarray``.
+
+    Keys are rebased on their minimum so only the bits that actually vary
+    are processed; each pass is a stable linear-time reorder on one
+    ``bits``-wide digit.
+    """
+    if bits < 1:
+        raise ValueError("bits must be >= 1")
+    arr = _as_numeric_array(data)
+    if len(arr) < 2:
+        return arr.copy()
+    keys, decode = _sortable_keys(arr)
+    kmin = keys.min()
+    order = _lsd_order(keys - kmin, bits)
+    return decode(keys[order])
+
+
+@_nans_last
+def counting_sort(data: Any, max_range: int = COUNTING_MAX_RANGE):
+    """Vectorized counting sort (``bincount`` + ``repeat``) for integers.
+
+    Spans that would need an oversized count table use
+    :func:`radix_sort` instead, mirroring the sparse guard of the
+    pure-Python version.
+    """
+    arr = _as_numeric_array(data)
+    if len(arr) == 0:
+        return arr.copy()
+    if arr.dtype.kind not in "iu":
+        raise TypeError("counting_sort requires integer inputs")
+    lo, hi = int(arr.min()), int(arr.max())
+    span = hi - lo + 1
+    if span > max_range or span > _DENSE_SPAN_RATIO * len(arr) + _DENSE_SPAN_SLACK:
+        return radix_sort(arr)
+    counts = np.bincount((arr - lo).astype(np.intp), minlength=span)
+    values = np.arange(lo, hi + 1, dtype=np.int64).astype(arr.dtype)
+    return np.repeat(values, counts)
+
+
+def _odd_even_rounds(out, max_rounds: int) -> None:
+    """Odd-even transposition rounds over the whole array until it is
+    sorted or ``max_rounds`` have run. Each round is one vectorized
+    compare-exchange of all disjoint neighbour pairs."""
+    n = len(out)
+    quiet = 0
+    for r in range(max_rounds):
+        start = r & 1
+        left = out[start : n - 1 : 2]
+        right = out[start + 1 : n : 2]
+        if not (left > right).any():
+            quiet += 1
+            if quiet == 2:
+                return
+            continue
+        quiet = 0
+        lo = np.minimum(left, right)
+        right[...] = np.maximum(left, right)
+        left[...] = lo
+
+
+def _bucket_offsets(arr, lo):
+    """Return ``arr - lo`` as float64 and the span ``max - lo`` as a float.
+
+    Integers are subtracted exactly in 64-bit unsigned space first, so
+    values too close together to differ as floats (e.g. nanosecond
+    timestamps) still get distinct offsets.
+    """
+    if arr.dtype.kind == "f":
+        offsets = arr.astype(np.float64) - float(lo)
+        return offsets, float(arr.max()) - float(lo)
+    if arr.dtype.kind == "u":
+        diff = arr.astype(np.uint64) - np.uint64(lo)
+    else:
+        base = np.uint64(int(lo) & 0xFFFFFFFFFFFFFFFF)
+        diff = arr.astype(np.int64).view(np.uint64) - base
+    return diff.astype(np.float64), float(int(arr.max()) - int(lo))
+
+
+def _bucket_sort(arr, depth: int):
+    n = len(arr)
+    if n < 2:
+        return arr.copy()
+    lo, hi = arr.min(), arr.max()
+    if lo == hi:
+        return arr.copy()
+    offsets, span = _bucket_offsets(arr, lo)
+    scale = n / span if span else np.inf
+    if not np.isfinite(scale):
+        # Distinct values with no usable float span (e.g. subnormals).
+        return np.sort(arr, kind="stable")
+    idx = (offsets * scale).astype(np.int64)
+    np.clip(idx, 0, n - 1, out=idx)
+    order = _lsd_order(idx.astype(np.uint64), 4)
+    out = arr[order]
+    sizes = np.bincount(idx, minlength=n)
+    ends = np.cumsum(sizes)
+    for b in np.flatnonzero(sizes > _BUCKET_LIMIT):
+        start = ends[b] - sizes[b]
+        seg = out[start : ends[b]]
+        if depth >= _BUCKET_MAX_DEPTH:
+            out[start : ends[b]] = merge_sort(seg)
+        else:
+            out[start : ends[b]] = _bucket_sort(seg, depth + 1)
+    _odd_even_rounds(out, _BUCKET_LIMIT + 2)
+    return out
+
+
+@_nans_last
+def bucket_sort(data: Any):
+    """Vectorized bucket sort for int and float data.
+
+    Bucket indices are computed for all items at once and items are
+    scattered into bucket order with a stable LSD pass over the bucket
+    index. Buckets then hold only a few items each, so a handful of
+    vectorized odd-even transposition rounds finish them; the rare
+    overflowing buckets are bucket sorted recursively, down to
+    ``_BUCKET_MAX_DEPTH`` levels and merge sorted below. Integer offsets
+    are computed exactly before scaling; infinities have no place on the
+    bucket scale and are split off to the ends first, and inputs whose
+    span does not scale (subnormal ranges) are handed to ``np.sort``.
+    """
+    arr = _as_numeric_array(data)
+    if arr.dtype.kind == "f":
+        finite = np.isfinite(arr)
+        if not finite.all():
+            ends = arr[~finite]
+            body = _bucket_sort(arr[finite], 0)
+            return np.concatenate([ends[ends < 0], body, ends[ends > 0]])
+    return _bucket_sort(arr, 0)
+
+
+def _bitonic_rows(rows) -> None:
+    """Sort every row of the 2-D array ``rows`` in place with a bitonic
+    network; the row width must be a power of two."""
+    width = rows.shape[1]
+    lanes = np.arange(width)
+    k = 2
+    while k <= width:
+        j = k >> 1
+        while j > 0:
+            lower = lanes[(lanes & j) == 0]
+            upper = lower | j
+            ascending = (lower & k) == 0
+            a = rows[:, lower]
+            b = rows[:, upper]
+            small = np.minimum(a, b)
+            large = np.maximum(a, b)
+            rows[:, lower] = np.where(ascending, small, large)
+            rows[:, upper] = np.where(ascending, large, small)
+            j >>= 1
+        k <<= 1
+
+
+def _sort_segments(out, starts, lengths, width: int) -> None:
+    """Sort the segments ``out[s:s + l]`` (each ``l <= width``) together:
+    they are gathered into padded rows, bitonic sorted and scattered back."""
+    if len(starts) == 0:
+        return
+    pad = out.max()
+    cols = np.arange(width)
+    valid = cols[None, :] < lengths[:, None]
+    index = np.minimum(starts[:, None] + cols[None, :], len(out) - 1)
+    rows = np.where(valid, out[index], pad)
+    _bitonic_rows(rows)
+    # Pads equal the global maximum, so they sort to the end of each row.
+    out[index[valid]] = rows[valid]
+
+
+def _merge_pair(left, right, dst) -> None:
+    """Stably merge sorted ``left`` and ``right`` into ``dst``: each item's
+    final position is its own index plus the number of items of the other
+    run that precede it."""
+    dst[np.arange(len(left)) + np.searchsorted(right, left, side="left")] = left
+    dst[np.arange(len(right)) + np.searchsorted(left, right, side="right")] = right
+
+
+@_nans_last
+def merge_sort(data: Any):
+    """Block-vectorized bottom-up merge sort.
+
+    Blocks of ``_MERGE_BLOCK`` items are sorted together with a bitonic
+    network, then adjacent runs are merged pass by pass with vectorized
+    two-run merges, alternating between two buffers.
+    """
+    arr = _as_numeric_array(data)
+    n = len(arr)
+    src = arr.copy()
+    if n < 2:
+        return src
+    width = _MERGE_BLOCK
+    starts = np.arange(0, n, width)
+    lengths = np.minimum(width, n - starts)
+    _sort_segments(src, starts, lengths, width)
+    dst = np.empty_like(src)
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid == hi or src[mid - 1] <= src[mid]:
+                dst[lo:hi] = src[lo:hi]
+            else:
+                _merge_pair(src[lo:mid], src[mid:hi], dst[lo:hi])
+        src, dst = dst, src
+        width *= 2
+    return src
+
+
+@_nans_last
+def quick_sort(data: Any):
+    """Quick sort with vectorized three-way partitioning.
+
+    Each partition step splits a segment with boolean masks in a few
+    whole-array operations. Segments of at most ``_QUICK_BLOCK`` items are
+    collected and finished together with one batched bitonic network, and
+    segments that keep partitioning badly are handed to :func:`merge_sort`.
+    """
+    arr = _as_numeric_array(data)
+    n = len(arr)
+    out = arr.copy()
+    if n < 2:
+        return out
+    small_starts: List[int] = []
+    small_lengths: List[int] = []
+    stack = [(0, n, 2 * n.bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        size = hi - lo
+        if size <= _QUICK_BLOCK:
+            if size > 1:
+                small_starts.append(lo)
+                small_lengths.append(size)
+            continue
+        seg = out[lo:hi]
+        if depth == 0:
+            out[lo:hi] = merge_sort(seg)
+            continue
+        a, b, c = seg[0], seg[size // 2], seg[-1]
+        pivot = max(min(a, b), min(max(a, b), c))
+        less = seg[seg < pivot]
+        greater = seg[seg > pivot]
+        n_less, n_greater = len(less), len(greater)
+        out[lo : lo + n_less] = less
+        out[lo + n_less : hi - n_greater] = pivot
+        out[hi - n_greater : hi] = greater
+        stack.append((lo, lo + n_less, depth - 1))
+        stack.append((hi - n_greater, hi, depth - 1))
+    _sort_segments(out, np.array(small_starts), np.array(small_lengths), _QUICK_BLOCK)
+    return out
+
+
+NUMPY_SORTS: Dict[str, Callable] = {
+    "counting": counting_sort,
+    "radix": radix_sort,
+    "bucket": bucket_sort,
+    "merge": merge_sort,
+    "quick": quick_sort,
+}
+
+
+def run(name: str, data: Any, reverse: bool = False, inplace: bool = False, **options):
+    """Sort ``data`` with the vectorized variant of algorithm ``name``.
+
+    Mirrors the pure-Python calling convention: ``ndarray`` inputs give an
+    ``ndarray`` result, any other input gives a list of Python numbers
+    equal to what the pure-Python algorithm returns. With ``inplace`` the
+    mutable sequence ``data`` is overwritten and ``None`` returned.
+    """
+    _require_numpy()
+    result = NUMPY_SORTS[name](data, **options)
+    if reverse:
+        # NaNs stay last, as in the pure-Python algorithms.
+        nans = int(np.isnan(result).sum()) if result.dtype.kind == "f" else 0
+        body = len(result) - nans
+        result = np.concatenate([result[:body][::-1], result[body:]])
+    is_array = isinstance(data, np.ndarray)
+    if inplace:
+        if is_array:
+            data[...] = result.reshape(data.shape)
+        elif isinstance(data, list):
+            data[:] = result.tolist()
+        else:
+            for i, x in enumerate(result.tolist()):
+                data[i] = x
+        return None
+    return result.copy() if is_array else result.tolist()
+
+
+__all__ = [
+    "NUMPY_SORTS",
+    "counting_sort",
+    "radix_sort",
+    "bucket_sort",
+    "merge_sort",
+    "quick_sort",
+    "run",
+]
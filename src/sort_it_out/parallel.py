@@ -0,0 +1,177 @@
+"""Multi-process sample sort.
+
+:func:`parallel_sort` picks ``workers - 1`` splitters from a random sample
+of the keys, distributes the items into that many key ranges and sorts
+each range in its own process with any registered algorithm. Ranges are
+disjoint and ordered, so the sorted ranges are simply concatenated.
+
+Plain ``int`` (64-bit) or ``float`` data travels through one
+:class:`multiprocessing.shared_memory.SharedMemory` block: the ranges are
+written into it back to back and every worker sorts its slice in place,
+so no chunk is pickled. Other data is pickled to the workers; with a
+``key`` only the computed keys are sent and workers return the order.
+"""
+from __future__ import annotations
+
+import os
+import random
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterable, List, Optional
+
+from .algorithms import get_algorithm
+from .sorts import KeyFunc, _write_back, merge_sort
+
+# Below this many items the process start-up costs more than it saves.
+PARALLEL_MIN_ITEMS = 20_000
+# Sampled keys per worker when choosing splitters.
+_OVERSAMPLE = 64
+
+
+def _sort_shared(name, typecode, lo, hi, algorithm, reverse, options) -> None:
+    """Worker: sort slice ``[lo:hi]`` of the shared block ``name``."""
+    shm = SharedMemory(name=name)
+    try:
+        with shm.buf.cast(typecode) as view, view[lo:hi] as chunk:
+            res = get_algorithm(algorithm)(chunk.tolist(), reverse=reverse, **options)
+            chunk[:] = array(typecode, res)
+    finally:
+        shm.close()
+
+
+def _sort_chunk(chunk, algorithm, reverse, options) -> List:
+    """Worker: return ``chunk`` sorted."""
+    return get_algorithm(algorithm)(chunk, reverse=reverse, **options)
+
+
+def _order_chunk(keys, algorithm, reverse, options) -> List[int]:
+    """Worker: return the positions of ``keys`` in sorted order."""
+    return get_algorithm(algorithm)(
+        range(len(keys)), key=keys.__getitem__, reverse=reverse, **options
+    )
+
+
+def _shared_typecode(items: List) -> Optional[str]:
+    if all(type(x) is int for x in items):
+        if -(1 << 63) <= min(items) and max(items) < 1 << 63:
+            return "q"
+        return None
+    if all(type(x) is float for x in items):
+        return "d"
+    return None
+
+
+def _splitters(keys: List, parts: int, rng: random.Random) -> List:
+    sample = merge_sort(rng.choice(keys) for _ in range(parts * _OVERSAMPLE))
+    step = len(sample) / parts
+    picked = [sample[int(i * step)] for i in range(1, parts)]
+    # Equal splitters would only produce empty ranges.
+    return [s for i, s in enumerate(picked) if i == 0 or picked[i - 1] < s]
+
+
+def parallel_sort(
+    data: Iterable,
+    algorithm: str = "Merge",
+    workers: Optional[int] = None,
+    key: KeyFunc = None,
+    reverse: bool = False,
+    inplace: bool = False,
+    **options: Any,
+) -> Optional[List]:
+    """Sort ``data`` with ``workers`` processes (default: one per CPU).
+
+    ``algorithm`` is a registry name run in every worker; extra keyword
+    ``options`` (e.g. ``gaps`` or ``backend``) are passed on to it and must
+    be picklable. ``key`` and ``reverse`` behave as for the algorithms
+    themselves, and the result is stable: equal keys always land in the
+    same range and keep their relative order. Inputs smaller than
+    :data:`PARALLEL_MIN_ITEMS` or a single worker sort in this process.
+    """
+    func = get_algorithm(algorithm)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    items = list(data)
+    n = len(items)
+    if workers == 1 or n < PARALLEL_MIN_ITEMS:
+        res = func(items, key=key, reverse=reverse, **options)
+    else:
+        keys = items if key is None else [key(x) for x in items]
+        splitters = _splitters(keys, workers, random.Random(n))
+        ranges: List[List[int]] = [[] for _ in range(len(splitters) + 1)]
+        for i, k in enumerate(keys):
+            ranges[bisect_right(splitters, k)].append(i)
+        if reverse:
+            ranges.reverse()
+        ranges = [r for r in ranges if r]
+        res = _sort_ranges(
+            items, keys, ranges, algorithm, workers, key, reverse, options
+        )
+    if inplace:
+        _write_back(data, res)
+        return None
+    return res
+
+
+def _sort_ranges(items, keys, ranges, algorithm, workers, key, reverse, options):
+    """Sort every range of item indices in the pool and concatenate."""
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        if key is not None:
+            futures = [
+                pool.submit(
+                    _order_chunk, [keys[i] for i in r], algorithm, reverse, options
+                )
+                for r in ranges
+            ]
+            res: List = []
+            for r, fut in zip(ranges, futures):
+                res.extend(items[r[i]] for i in fut.result())
+            return res
+        typecode = _shared_typecode(items)
+        if typecode is None:
+            futures = [
+                pool.submit(
+                    _sort_chunk, [items[i] for i in r], algorithm, reverse, options
+                )
+                for r in ranges
+            ]
+            res = []
+            for fut in futures:
+                res.extend(fut.result())
+            return res
+        values = array(typecode, (items[i] for r in ranges for i in r))
+        shm = SharedMemory(create=True, size=max(1, len(values) * values.itemsize))
+        try:
+            with shm.buf.cast(typecode) as view, view[: len(values)] as block:
+                block[:] = values
+                bounds = []
+                lo = 0
+                for r in ranges:
+                    bounds.append((lo, lo + len(r)))
+                    lo += len(r)
+                futures = [
+                    pool.submit(
+                        _sort_shared,
+                        shm.name,
+                        typecode,
+                        lo,
+                        hi,
+                        algorithm,
+                        reverse,
+                        options,
+                    )
+                    for lo, hi in bounds
+                ]
+                for fut in futures:
+                    fut.result()
+                res = block.tolist()
+        finally:
+            shm.close()
+            shm.unlink()
+        return res
+
+
+__all__ = ["PARALLEL_MIN_ITEMS", "parallel_sort"]
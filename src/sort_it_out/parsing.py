@@ -0,0 +1,140 @@
+"""Shared parsing of text values for the CLI and GUI.
+
+Values are converted in bulk: a whole batch of lines goes through one
+``map(int, ...)`` (or ``float``) call, which accepts surrounding
+whitespace and the trailing newline, so no per-line ``try``/``except``
+or stripping is needed. In ``auto`` mode the type is detected from a
+sample at the start of the batch; the per-value :func:`parse_value` is
+only used when the sample is mixed or the typed conversion fails. Batches
+detected as floats keep integer-looking values as ints, so ``auto``
+gives the same values as :func:`parse_value` would.
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, List, Sequence
+
+PARSE_TYPES = ("auto", "int", "float", "str")
+# Lines inspected by detect_type.
+SAMPLE_LINES = 1000
+
+
+def parse_value(s: str):
+    """Parse one value: int if possible, then float, else the stripped
+    string (empty lines give ``""``)."""
+    s = s.strip()
+    if s == "":
+        return s
+    # Try int, then float, fallback to original string
+    try:
+        return int(s)
+    except ValueError:
+        pass
+    try:
+        return float(s)
+    except ValueError:
+        return s
+
+
+def detect_type(lines: Sequence[str]) -> str:
+    """Guess the type of ``lines`` from the first :data:`SAMPLE_LINES`
+    non-blank lines: ``"int"``, ``"float"`` or ``"str"`` when the sample is
+    uniform, ``"mixed"`` otherwise."""
+    sample = [s for s in lines[:SAMPLE_LINES] if s.strip()]
+    kinds = {type(parse_value(s)) for s in sample}
+    if kinds == {int}:
+        return "int"
+    if kinds == {float}:
+        return "float"
+    if kinds <= {str}:
+        return "str"
+    return "mixed"
+
+
+def _bulk(convert: Callable[[str], object], lines: Sequence[str]) -> List:
+    try:
+        return list(map(convert, lines))
+    except ValueError:
+        # Only blank lines are tolerated; anything else raises again.
+        return [convert(s) for s in lines if s.strip()]
+
+
+def _numbers(lines: Sequence[str]) -> List:
+    """Convert as floats in bulk, then turn the integral values whose text
+    is an integer back into ints."""
+    values = _bulk(float, lines)
+    if not any(map(float.is_integer, values)):
+        return values
+    if len(values) != len(lines):
+        lines = [s for s in lines if s.strip()]
+    for i, v in enumerate(values):
+        if v.is_integer():
+            try:
+                values[i] = int(lines[i])
+            except ValueError:
+                pass
+    return values
+
+
+_CONVERTERS: Dict[str, Callable[[Sequence[str]], List]] = {
+    "int": lambda lines: _bulk(int, lines),
+    "float": lambda lines: _bulk(float, lines),
+    "number": _numbers,
+    "str": lambda lines: [s.strip() for s in lines],
+    "mixed": lambda lines: [parse_value(s) for s in lines],
+}
+
+
+def auto_kind(lines: Sequence[str]) -> str:
+    """The converter for ``auto`` mode: :func:`detect_type`, with floats
+    read as ``"number"`` so integer-looking values stay ints."""
+    kind = detect_type(lines)
+    return "number" if kind == "float" else kind
+
+
+def convert_lines(lines: Sequence[str], kind: str, fallback: bool = False) -> List:
+    """Convert ``lines`` as ``kind`` (a :func:`detect_type` result, or
+    ``"number"``: floats, with integer-looking values kept as ints).
+
+    Typed conversions skip blank lines and raise ``ValueError`` on a bad
+    value, unless ``fallback`` is set: then the batch is parsed value by
+    value with :func:`parse_value` instead.
+    """
+    if not fallback:
+        return _CONVERTERS[kind](lines)
+    try:
+        return _CONVERTERS[kind](lines)
+    except ValueError:
+        return _CONVERTERS["mixed"](lines)
+
+
+def parse_values(lines: Iterable[str], kind: str = "auto") -> List:
+    """Parse a batch of lines as ``kind`` (one of :data:`PARSE_TYPES`).
+
+    ``auto`` detects the type from a sample and falls back to per-value
+    parsing only if the typed conversion fails; integer-looking values
+    stay ints in a batch of floats.
+    """
+    if kind not in PARSE_TYPES:
+        raise ValueError(f"kind must be one of {', '.join(PARSE_TYPES)}")
+    if not isinstance(lines, (list, tuple)):
+        lines = list(lines)
+    if kind == "auto":
+        return convert_lines(lines, auto_kind(lines), fallback=True)
+    return convert_lines(lines, kind)
+
+
+def value_parser(kind: str) -> Callable[[str], object]:
+    """Return the per-value parser matching ``kind``."""
+    return {"int": int, "float": float, "str": str.strip}.get(kind, parse_value)
+
+
+__all__ = [
+    "PARSE_TYPES",
+    "SAMPLE_LINES",
+    "parse_value",
+    "detect_type",
+    "auto_kind",
+    "convert_lines",
+    "parse_values",
+    "value_parser",
+]
@@ -0,0 +1,115 @@
+"""Sorting permutations: argsort, lexicographic argsort and reordering.
+
+:func:`argsort` returns the indices that would sort a column instead of
+the sorted values, so parallel columns (ids, timestamps, payloads) can be
+sorted by one of them without zipping them into tuples. Any registry
+algorithm can produce it: the indices ``0 .. n-1`` are sorted with the
+column as their key, which every algorithm supports stably. The
+distribution sorts move only indices through their passes (Counting
+places them by prefix sums, Radix by digit passes and Bucket distributes
+them by key), and the comparison sorts order ``(key, index)`` pairs.
+
+:func:`lexsort` sorts by several columns with one stable argsort pass per
+column, from the least to the most significant, and
+:func:`apply_permutation` reorders any number of columns in place by
+following the cycles of the permutation.
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, MutableSequence, Sequence, Union
+
+from .algorithms import Algorithm, resolve_algorithm
+from .sorts import KeyFunc
+
+
+def argsort(
+    data: Iterable,
+    algorithm: Algorithm = "Merge",
+    key: KeyFunc = None,
+    reverse: bool = False,
+    **options,
+) -> List[int]:
+    """Return the indices that put ``data`` in sorted order.
+
+    ``[data[i] for i in argsort(data)]`` is the sorted data. ``algorithm``
+    is a registry name (case-insensitive) or a sorting function taking
+    ``key`` and ``reverse``; extra ``options`` such as ``gaps`` or
+    ``bits`` are passed on to it. ``key`` is computed once per item. The
+    permutation is stable: equal keys keep their input order, also with
+    ``reverse``.
+    """
+    keys = list(data) if key is None else [key(x) for x in data]
+    return resolve_algorithm(algorithm)(
+        range(len(keys)), key=keys.__getitem__, reverse=reverse, **options
+    )
+
+
+def lexsort(
+    columns: Sequence[Sequence],
+    algorithm: Algorithm = "Merge",
+    reverse: Union[bool, Sequence[bool]] = False,
+    **options,
+) -> List[int]:
+    """Return the indices that sort the rows of the parallel ``columns``,
+    most significant column first.
+
+    Each column is argsorted once, from the last to the first, and every
+    pass is stable, so ties on a column keep the order set by the columns
+    after it. ``reverse`` is one flag for all columns or one per column.
+    Unlike ``numpy.lexsort``, the primary key is the *first* column.
+    """
+    if not columns:
+        raise ValueError("lexsort needs at least one column")
+    n = len(columns[0])
+    if any(len(col) != n for col in columns):
+        raise ValueError("lexsort columns must have the same length")
+    flags = [reverse] * len(columns) if isinstance(reverse, bool) else list(reverse)
+    if len(flags) != len(columns):
+        raise ValueError("reverse needs one flag per column")
+    func = resolve_algorithm(algorithm)
+    perm: List[int] = list(range(n))
+    for col, desc in zip(reversed(columns), reversed(flags)):
+        keys = [col[i] for i in perm]
+        order = func(range(n), key=keys.__getitem__, reverse=desc, **options)
+        perm = [perm[i] for i in order]
+    return perm
+
+
+def apply_permutation(perm: Sequence[int], *columns: MutableSequence) -> None:
+    """Reorder every column in place so that ``column[i]`` becomes the
+    old ``column[perm[i]]``, as ``column[:] = [column[p] for p in perm]``
+    would without the copy.
+
+    The cycles of ``perm`` are followed once for all columns, moving each
+    value a single time; the only extra memory is a ``bytearray`` flag
+    per index. Columns may be lists, ``array.array`` objects or
+    writable ``memoryview`` objects. ``ValueError`` is raised when ``perm``
+    is not a permutation of ``range(len(perm))``; columns may be partly
+    reordered by then.
+    """
+    n = len(perm)
+    if any(len(col) != n for col in columns):
+        raise ValueError("columns must have the same length as the permutation")
+    done = bytearray(n)
+    for start in range(n):
+        if done[start]:
+            continue
+        done[start] = 1
+        nxt = perm[start]
+        if nxt == start:
+            continue
+        saved = [col[start] for col in columns]
+        i = start
+        while nxt != start:
+            if not 0 <= nxt < n or done[nxt]:
+                raise ValueError("perm is not a permutation")
+            done[nxt] = 1
+            for col in columns:
+                col[i] = col[nxt]
+            i = nxt
+            nxt = perm[i]
+        for col, value in zip(columns, saved):
+            col[i] = value
+
+
+__all__ = ["argsort", "lexsort", "apply_permutation"]
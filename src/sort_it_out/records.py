@@ -0,0 +1,220 @@
+"""Sorting delimited records (CSV/TSV lines) by key columns.
+
+Each line is split once, only up to the last key column, and the key
+fields are converted into typed columns (one list per key column). The
+sort itself is a :func:`sort_it_out.permutation.lexsort` of those
+columns, so the algorithms never compare tuples or touch the lines; the
+original lines are then written in the new order exactly as they were
+read. Fields containing a quote are split with :mod:`csv`, so quoted
+delimiters are honoured; a record must still fit on one line.
+
+:func:`external_sort_records` plugs the same column sort into
+:func:`sort_it_out.external.external_sort` for inputs larger than
+memory: every chunk is sorted through its key columns and the runs are
+merged on the key of each line.
+"""
+from __future__ import annotations
+
+import csv
+from itertools import chain, islice
+from typing import IO, Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .algorithms import Algorithm, resolve_algorithm
+from .external import DEFAULT_MEMORY_LIMIT, external_sort, parse_memory_limit
+from .parsing import PARSE_TYPES, SAMPLE_LINES, parse_value
+from .permutation import apply_permutation, lexsort
+
+# Lines split and converted per step.
+_BLOCK = 1 << 14
+# A key column: its 0-based index and its type (one of PARSE_TYPES).
+KeySpec = List[Tuple[int, str]]
+
+
+def parse_key_columns(text: str, default_type: str = "auto") -> KeySpec:
+    """Parse a ``--key-column`` value such as ``"3,1"`` or
+    ``"3:float,1:str"``: 1-based columns, most significant first, each
+    with an optional type (default ``default_type``)."""
+    keys: KeySpec = []
+    for part in text.split(","):
+        col, _, kind = part.strip().partition(":")
+        kind = kind.strip() or default_type
+        if not col.isdigit() or int(col) < 1:
+            raise ValueError(f"Invalid key column: {part!r} (columns start at 1)")
+        if kind not in PARSE_TYPES:
+            raise ValueError(
+                f"Invalid type for column {col}: {kind!r} "
+                f"(use {', '.join(PARSE_TYPES)})"
+            )
+        keys.append((int(col) - 1, kind))
+    return keys
+
+
+def delimiter_for_path(path: Optional[str]) -> str:
+    """Tab for ``.tsv`` files, otherwise a comma."""
+    return "\t" if path and path.lower().endswith(".tsv") else ","
+
+
+def _number(s: str) -> Union[int, float]:
+    try:
+        return int(s)
+    except ValueError:
+        return float(s)
+
+
+_CONVERTERS = {"int": int, "float": float, "number": _number, "str": str.strip}
+
+
+def _splitter(delimiter: str, maxsplit: int) -> Callable[[str], List[str]]:
+    def split(line: str) -> List[str]:
+        if '"' in line:
+            return next(csv.reader([line], delimiter=delimiter))
+        return line.split(delimiter, maxsplit)
+
+    return split
+
+
+def resolve_types(lines: Sequence[str], keys: KeySpec, delimiter: str) -> KeySpec:
+    """Replace the ``auto`` types of ``keys`` using the first
+    :data:`sort_it_out.parsing.SAMPLE_LINES` ``lines``: a column whose
+    sample is all numbers becomes ``"number"`` (int, or float where an
+    int does not parse), anything else ``"str"``."""
+    if all(kind != "auto" for _, kind in keys):
+        return list(keys)
+    split = _splitter(delimiter, max(col for col, _ in keys) + 1)
+    rows = [split(line) for line in lines[:SAMPLE_LINES]]
+    resolved: KeySpec = []
+    for col, kind in keys:
+        if kind == "auto":
+            sample = [row[col] for row in rows if col < len(row)]
+            kinds = {type(parse_value(s)) for s in sample}
+            kind = "number" if kinds and kinds <= {int, float} else "str"
+        resolved.append((col, kind))
+    return resolved
+
+
+def key_columns(
+    lines: Sequence[str], keys: KeySpec, delimiter: str, first_record: int = 1
+) -> List[List]:
+    """Split ``lines`` once and return one typed list per key column.
+
+    ``keys`` must be resolved (see :func:`resolve_types`). A missing
+    field or a value that does not convert raises ``ValueError`` naming
+    the record, counting from ``first_record``.
+    """
+    split = _splitter(delimiter, max(col for col, _ in keys) + 1)
+    rows = list(map(split, lines))
+    columns = []
+    for col, kind in keys:
+        convert = _CONVERTERS[kind]
+        try:
+            columns.append([convert(row[col]) for row in rows])
+        except (IndexError, ValueError):
+            for n, row in enumerate(rows, first_record):
+                if col >= len(row):
+                    raise ValueError(f"record {n} has no column {col + 1}") from None
+                try:
+                    convert(row[col])
+                except ValueError:
+                    raise ValueError(
+                        f"record {n}: column {col + 1} is not a valid {kind}: "
+                        f"{row[col]!r}"
+                    ) from None
+            raise
+    return columns
+
+
+def sort_records(
+    lines: Iterable[str],
+    keys: KeySpec,
+    delimiter: str = ",",
+    algorithm: Algorithm = "Merge",
+    reverse: Union[bool, Sequence[bool]] = False,
+) -> List[str]:
+    """Return ``lines`` (without newlines) sorted by their key columns.
+
+    ``keys`` lists ``(column, type)`` pairs with 0-based columns, most
+    significant first (see :func:`parse_key_columns`); ``auto`` types are
+    resolved from the first lines. The key columns are extracted block by
+    block while ``lines`` is read. The sort is stable and ``reverse`` is
+    a flag for all key columns or one per column.
+    """
+    it = iter(lines)
+    records: List[str] = []
+    columns: List[List] = [[] for _ in keys]
+    while True:
+        block = list(islice(it, _BLOCK))
+        if not block:
+            break
+        if not records:
+            keys = resolve_types(block, keys, delimiter)
+        typed = key_columns(block, keys, delimiter, len(records) + 1)
+        for column, values in zip(columns, typed):
+            column.extend(values)
+        records.extend(block)
+    if records:
+        apply_permutation(lexsort(columns, algorithm, reverse), records)
+    return records
+
+
+def record_key(keys: KeySpec, delimiter: str) -> Callable[[str], Tuple]:
+    """Return a function giving the typed key tuple of one line
+    (``keys`` must be resolved)."""
+    split = _splitter(delimiter, max(col for col, _ in keys) + 1)
+    fields = [(col, _CONVERTERS[kind]) for col, kind in keys]
+
+    def key(line: str) -> Tuple:
+        row = split(line)
+        return tuple(convert(row[col]) for col, convert in fields)
+
+    return key
+
+
+def external_sort_records(
+    lines: Iterable[str],
+    out: IO,
+    keys: KeySpec,
+    delimiter: str = ",",
+    algorithm: Algorithm = "Merge",
+    memory_limit: int = parse_memory_limit(DEFAULT_MEMORY_LIMIT),
+    tmp_dir: Optional[str] = None,
+) -> int:
+    """Sort the stream of ``lines`` (without newlines) by their key
+    columns into ``out`` with :func:`sort_it_out.external.external_sort`
+    and return the number of lines written.
+
+    ``auto`` types are resolved from the first lines. Each chunk is
+    sorted with :func:`lexsort` on its key columns; during the merge the
+    key of each line is extracted once, when it is read from its run.
+    """
+    it = iter(lines)
+    head = list(islice(it, SAMPLE_LINES))
+    keys = resolve_types(head, keys, delimiter)
+    func = resolve_algorithm(algorithm)
+    seen = 0
+
+    def sort_chunk(chunk: List[str], key=None, reverse=False, inplace=True) -> None:
+        nonlocal seen
+        columns = key_columns(chunk, keys, delimiter, seen + 1)
+        seen += len(chunk)
+        apply_permutation(lexsort(columns, func, reverse), chunk)
+
+    return external_sort(
+        chain(head, it),
+        out,
+        sort_chunk,
+        memory_limit=memory_limit,
+        key=record_key(keys, delimiter),
+        tmp_dir=tmp_dir,
+    )
+
+
+__all__ = [
+    "KeySpec",
+    "parse_key_columns",
+    "delimiter_for_path",
+    "resolve_types",
+    "key_columns",
+    "sort_records",
+    "record_key",
+    "external_sort_records",
+]
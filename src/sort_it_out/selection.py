@@ -0,0 +1,244 @@
+"""Partial sorting and selection: top-k, the ``k``-th item and quantiles.
+
+:func:`partial_sort` keeps a bounded heap of the best ``k`` items seen so
+far while it scans the input once, so it needs O(k) memory, works on any
+iterable (including a stream) and costs O(n log k) comparisons instead
+of the O(n log n) of a full sort. When ``k`` is a large fraction of a
+sized input the heap saves little, and the input is instead partitioned
+with quickselect around the ``k``-th item and only the first ``k`` items
+are sorted.
+
+:func:`select` finds the item of one rank and :func:`quantiles` those of
+several ranks in expected O(n) time with introselect: quickselect with
+the introsort pivot choice, falling back to the median-of-medians pivot
+when partitions keep coming out unbalanced, which bounds the worst case
+to O(n). Several ranks share the partitioning: each partition only
+recurses into the segments that still contain a wanted rank.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Sized
+from itertools import islice
+from typing import Iterable, List, Optional, Sequence
+
+from .heaps import heap_sort_range, heapify, min_heap_replace, min_heapify, sift_down
+from .sorts import (
+    _INSERTION_CUTOFF,
+    KeyFunc,
+    _choose_pivot,
+    _insertion_sort_range,
+    _introsort,
+    _partition3,
+)
+
+# Above this k / n ratio a sized input is quickselected and sorted
+# (measured crossover on random data: about 3%).
+_SELECT_FRACTION = 0.03
+
+QUANTILE_METHODS = ("linear", "lower", "higher", "nearest")
+
+
+def _median_of_medians(arr: List, lo: int, hi: int):
+    """Return a pivot of ``arr[lo:hi]`` with at least 30% of the items on
+    either side: the median of the medians of groups of five."""
+    m = lo
+    for g in range(lo, hi, 5):
+        end = min(g + 5, hi)
+        _insertion_sort_range(arr, g, end)
+        mid = (g + end - 1) // 2
+        arr[m], arr[mid] = arr[mid], arr[m]
+        m += 1
+    mid = lo + (m - lo) // 2
+    # Depth 0: the medians are selected with this pivot rule too.
+    _quickselect(arr, lo, m, mid, 0)
+    return arr[mid]
+
+
+def _pivot(arr: List, lo: int, hi: int, depth: int):
+    if depth == 0:
+        return _median_of_medians(arr, lo, hi)
+    return _choose_pivot(arr, lo, hi)
+
+
+def _quickselect(arr: List, lo: int, hi: int, k: int, depth: Optional[int] = None):
+    """Reorder ``arr[lo:hi]`` so ``arr[k]`` holds the item of that rank,
+    with no larger item before it and no smaller item after it.
+
+    Introselect: after ``depth`` partitions (default ``2 * log2(n)``)
+    pivots come from :func:`_median_of_medians`, so the worst case stays
+    linear.
+    """
+    if depth is None:
+        depth = 2 * (hi - lo).bit_length()
+    while hi - lo > _INSERTION_CUTOFF:
+        lt, gt = _partition3(arr, lo, hi, _pivot(arr, lo, hi, depth))
+        depth = max(depth - 1, 0)
+        if k < lt:
+            hi = lt
+        elif k >= gt:
+            lo = gt
+        else:
+            return
+    _insertion_sort_range(arr, lo, hi)
+
+
+def _multiselect(arr: List, lo: int, hi: int, ranks: Sequence[int], depth: int):
+    """Place every rank of the sorted ``ranks`` (all in ``[lo, hi)``) as
+    :func:`_quickselect` would, partitioning each segment once."""
+    while ranks:
+        if hi - lo <= _INSERTION_CUTOFF:
+            _insertion_sort_range(arr, lo, hi)
+            return
+        lt, gt = _partition3(arr, lo, hi, _pivot(arr, lo, hi, depth))
+        depth = max(depth - 1, 0)
+        left = ranks[: bisect_left(ranks, lt)]
+        ranks = ranks[bisect_left(ranks, gt) :]
+        # Ranks in [lt, gt) hold the pivot and are already in place.
+        if left:
+            _multiselect(arr, lo, lt, left, depth)
+        lo = gt
+
+
+def _heap_smallest(items: Iterable, k: int) -> List:
+    """Return the ``k`` smallest items ascending, via a bounded max-heap."""
+    it = iter(items)
+    heap = list(islice(it, k))
+    heapify(heap, 0, len(heap))
+    if len(heap) == k:
+        for x in it:
+            # The root is the largest item kept: replace it if x beats it.
+            if x < heap[0]:
+                heap[0] = x
+                sift_down(heap, 0, 0, k)
+    heap_sort_range(heap, 0, len(heap))
+    return heap
+
+
+def _heap_largest(items: Iterable, k: int) -> List:
+    """Return the ``k`` largest items descending, via a bounded min-heap."""
+    it = iter(items)
+    heap = list(islice(it, k))
+    min_heapify(heap)
+    if len(heap) == k:
+        for x in it:
+            if heap[0] < x:
+                min_heap_replace(heap, x)
+    heap_sort_range(heap, 0, len(heap))
+    heap.reverse()
+    return heap
+
+
+def _select_smallest(arr: List, k: int) -> List:
+    """Return the ``k`` smallest items of the list ``arr`` ascending;
+    ``arr`` is reordered."""
+    if k < len(arr):
+        _quickselect(arr, 0, len(arr), k)
+    del arr[k:]
+    _introsort(arr, 0, k, 2 * k.bit_length())
+    return arr
+
+
+def _select_largest(arr: List, k: int) -> List:
+    """Return the ``k`` largest items of the list ``arr`` descending;
+    ``arr`` is reordered."""
+    n = len(arr)
+    if k < n:
+        _quickselect(arr, 0, n, n - k)
+    top = arr[n - k :]
+    _introsort(top, 0, k, 2 * k.bit_length())
+    top.reverse()
+    return top
+
+
+def partial_sort(
+    data: Iterable, k: int, largest: bool = False, key: KeyFunc = None
+) -> List:
+    """Return the ``k`` smallest items of ``data`` in ascending order, or
+    with ``largest`` the ``k`` largest in descending order.
+
+    ``data`` may be any iterable and is read once; fewer than ``k`` items
+    are all returned. ``key`` is computed once per item and equal keys
+    keep their input order, as in a stable sort. Sized inputs with ``k``
+    above ``_SELECT_FRACTION`` of their length use quickselect and sort
+    the selected items instead of the bounded heap.
+    """
+    if k < 0:
+        raise ValueError("k must be >= 0")
+    if k == 0:
+        return []
+    items: Iterable = data
+    if key is not None:
+        # Entries compare as (key, index) so ties keep their input order;
+        # for ``largest`` the index is negated so earlier items rank higher.
+        sign = -1 if largest else 1
+        items = ((key(x), sign * i, x) for i, x in enumerate(data))
+    if isinstance(data, Sized) and k > _SELECT_FRACTION * len(data):
+        arr = list(items)
+        select = _select_largest if largest else _select_smallest
+        top = select(arr, min(k, len(arr)))
+    elif largest:
+        top = _heap_largest(items, k)
+    else:
+        top = _heap_smallest(items, k)
+    if key is not None:
+        return [entry[2] for entry in top]
+    return top
+
+
+def select(data: Iterable, k: int, key: KeyFunc = None):
+    """Return the item that would be at index ``k`` of ``sorted(data)``.
+
+    Negative ``k`` counts from the end, as in indexing, and an index out
+    of range raises ``IndexError``. Expected and worst-case O(n); with
+    ``key``, equal keys rank in input order.
+    """
+    arr = list(data) if key is None else [(key(x), i, x) for i, x in enumerate(data)]
+    n = len(arr)
+    if k < 0:
+        k += n
+    if not 0 <= k < n:
+        raise IndexError("select index out of range")
+    _quickselect(arr, 0, n, k)
+    return arr[k] if key is None else arr[k][2]
+
+
+def quantiles(data: Iterable, qs: Iterable[float], method: str = "linear") -> List:
+    """Return the quantiles ``qs`` (fractions in ``[0, 1]``) of ``data``.
+
+    Quantile ``q`` sits at position ``q * (n - 1)`` of the sorted data.
+    Between two items, ``method`` picks the ``lower`` or ``higher`` one,
+    the ``nearest`` one (ties to the even position, as NumPy does) or,
+    with ``linear`` (the default, which needs numbers), interpolates
+    between them. All the needed ranks are selected together in expected
+    O(n).
+    """
+    if method not in QUANTILE_METHODS:
+        raise ValueError(f"method must be one of {', '.join(QUANTILE_METHODS)}")
+    qs = list(qs)
+    if any(not 0 <= q <= 1 for q in qs):
+        raise ValueError("quantiles must be between 0 and 1")
+    arr = list(data)
+    n = len(arr)
+    if not n:
+        raise ValueError("quantiles of empty data")
+    positions = [q * (n - 1) for q in qs]
+    ranks = sorted({r for p in positions for r in (int(p), min(int(p) + 1, n - 1))})
+    _multiselect(arr, 0, n, ranks, 2 * n.bit_length())
+    res = []
+    for p in positions:
+        lo = int(p)
+        frac = p - lo
+        hi = min(lo + 1, n - 1)
+        if method == "higher" and frac:
+            lo = hi
+        elif method == "nearest" and (frac > 0.5 or frac == 0.5 and lo % 2):
+            lo = hi
+        elif method == "linear" and frac and arr[lo] != arr[hi]:
+            res.append(arr[lo] + (arr[hi] - arr[lo]) * frac)
+            continue
+        res.append(arr[lo])
+    return res
+
+
+__all__ = ["QUANTILE_METHODS", "partial_sort", "select", "quantiles"]
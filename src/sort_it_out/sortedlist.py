@@ -0,0 +1,328 @@
+"""A sorted container for continuous ingestion.
+
+:class:`SortedList` keeps its values in a list of sorted sublists of
+about ``load`` items each, plus the maximum of every sublist. Adding a
+value bisects the maxima to find its sublist and inserts it there, so no
+insertion ever re-sorts the data; a sublist that grows past twice the
+load is split in two. A Fenwick tree over the sublist lengths maps
+positions to sublists in O(log n) for indexing and range queries. Plain
+insertions and removals update it in O(log n); it is rebuilt, in time
+linear in the number of sublists (about ``n / load``), only when
+sublists are split, merged or removed, which happens at most once per
+``load / 2`` insertions, so the amortised cost per insertion is tiny.
+
+Bulk :meth:`SortedList.update` sorts the batch with the merge engine of
+:func:`sort_it_out.sorts.merge_sort`, cuts it at the sublist maxima and
+merges each piece into its own sublist, so only the sublists that
+receive values are touched; existing values are never re-sorted or
+rechunked.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from .sorts import _merge_runs, _natural_merge_sort
+
+# Target sublist length: lists are split at twice this and merged with a
+# neighbour below half of it.
+DEFAULT_LOAD = 1000
+
+
+class SortedList:
+    """A list that keeps its values in ascending order.
+
+    Equal values keep their insertion order. Values must be mutually
+    comparable with ``<``; there is no ``key`` (store ``(key, value)``
+    pairs instead).
+    """
+
+    def __init__(
+        self, iterable: Optional[Iterable] = None, load: int = DEFAULT_LOAD
+    ) -> None:
+        if load < 4:
+            raise ValueError("load must be >= 4")
+        self._load = load
+        self._len = 0
+        self._lists: List[List] = []
+        self._maxes: List = []
+        self._tree: List[int] = [0]
+        if iterable is not None:
+            self.update(iterable)
+
+    # Positional index: a 1-based Fenwick tree of the sublist lengths.
+
+    def _rebuild_index(self) -> None:
+        tree = [0]
+        tree.extend(len(lst) for lst in self._lists)
+        m = len(self._lists)
+        for i in range(1, m + 1):
+            j = i + (i & -i)
+            if j <= m:
+                tree[j] += tree[i]
+        self._tree = tree
+
+    def _index_add(self, pos: int, delta: int) -> None:
+        tree = self._tree
+        i = pos + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _offset(self, pos: int) -> int:
+        """Number of values in the sublists before sublist ``pos``."""
+        tree = self._tree
+        total = 0
+        while pos > 0:
+            total += tree[pos]
+            pos -= pos & -pos
+        return total
+
+    def _locate(self, index: int) -> Tuple[int, int]:
+        """Return the sublist and offset holding position ``index``."""
+        tree = self._tree
+        m = len(tree) - 1
+        pos = 0
+        step = 1 << (m.bit_length() - 1) if m else 0
+        while step:
+            nxt = pos + step
+            if nxt <= m and tree[nxt] <= index:
+                pos = nxt
+                index -= tree[nxt]
+            step >>= 1
+        return pos, index
+
+    # Structure maintenance.
+
+    def _reset(self, items: List) -> None:
+        """Replace the contents with the sorted list ``items``."""
+        load = self._load
+        self._lists = [items[i : i + load] for i in range(0, len(items), load)]
+        self._maxes = [lst[-1] for lst in self._lists]
+        self._len = len(items)
+        self._rebuild_index()
+
+    def _split(self, pos: int) -> None:
+        lst = self._lists[pos]
+        self._lists.insert(pos + 1, lst[self._load :])
+        del lst[self._load :]
+        self._maxes.insert(pos, lst[-1])
+        self._rebuild_index()
+
+    def _delete(self, pos: int, idx: int) -> None:
+        lists, maxes = self._lists, self._maxes
+        lst = lists[pos]
+        del lst[idx]
+        self._len -= 1
+        if not lst:
+            del lists[pos]
+            del maxes[pos]
+            self._rebuild_index()
+        elif len(lst) < self._load // 2 and len(lists) > 1:
+            # Merge with a neighbour so sublists stay near the load.
+            left = pos - 1 if pos else pos
+            lists[left].extend(lists[left + 1])
+            maxes[left] = lists[left][-1]
+            del lists[left + 1]
+            del maxes[left + 1]
+            if len(lists[left]) > 2 * self._load:
+                self._split(left)
+            else:
+                self._rebuild_index()
+        else:
+            maxes[pos] = lst[-1]
+            self._index_add(pos, -1)
+
+    # Mutation.
+
+    def add(self, value: Any) -> None:
+        """Insert ``value`` after any equal values, in O(log n) amortised."""
+        lists, maxes = self._lists, self._maxes
+        if not maxes:
+            self._reset([value])
+            return
+        pos = bisect_right(maxes, value)
+        if pos == len(maxes):
+            pos -= 1
+            lists[pos].append(value)
+            maxes[pos] = value
+        else:
+            insort(lists[pos], value)
+        self._len += 1
+        if len(lists[pos]) > 2 * self._load:
+            self._split(pos)
+        else:
+            self._index_add(pos, 1)
+
+    def update(self, iterable: Iterable) -> None:
+        """Insert every value of ``iterable``.
+
+        The batch is sorted, then each run of it that falls below the
+        same sublist maximum is merged into that sublist; overfull
+        sublists are split afterwards. Batches smaller than the number of
+        sublists are inserted one by one instead.
+        """
+        values = list(iterable)
+        if not values:
+            return
+        lists, maxes = self._lists, self._maxes
+        if len(values) < len(lists):
+            for value in values:
+                self.add(value)
+            return
+        _natural_merge_sort(values)
+        if not lists:
+            self._reset(values)
+            return
+        start = 0
+        last = len(lists) - 1
+        for pos in range(len(lists)):
+            if start == len(values):
+                break
+            # Values equal to a maximum go after it, as with add().
+            end = len(values) if pos == last else bisect_left(values, maxes[pos], start)
+            if end > start:
+                lst = lists[pos]
+                mid = len(lst)
+                lst.extend(values[start:end])
+                _merge_runs(lst, lst[:0], 0, mid, len(lst))
+                maxes[pos] = lst[-1]
+                start = end
+        load = self._load
+        self._lists = [
+            piece
+            for lst in lists
+            for piece in (
+                [lst]
+                if len(lst) <= 2 * load
+                else [lst[i : i + load] for i in range(0, len(lst), load)]
+            )
+        ]
+        self._maxes = [lst[-1] for lst in self._lists]
+        self._len += len(values)
+        self._rebuild_index()
+
+    def discard(self, value: Any) -> bool:
+        """Remove the first occurrence of ``value``; return whether one
+        was found."""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        lst = self._lists[pos]
+        idx = bisect_left(lst, value)
+        if lst[idx] != value:
+            return False
+        self._delete(pos, idx)
+        return True
+
+    def remove(self, value: Any) -> None:
+        """Remove the first occurrence of ``value`` or raise ``ValueError``."""
+        if not self.discard(value):
+            raise ValueError(f"{value!r} not in SortedList")
+
+    def pop(self, index: int = -1) -> Any:
+        """Remove and return the value at ``index`` (default: the largest)."""
+        pos, idx = self._locate(self._check_index(index))
+        value = self._lists[pos][idx]
+        self._delete(pos, idx)
+        return value
+
+    def clear(self) -> None:
+        self._reset([])
+
+    # Queries.
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        return index
+
+    def _iter_from(self, start: int) -> Iterator:
+        if start >= self._len:
+            return iter(())
+        pos, idx = self._locate(start)
+        return chain(
+            islice(self._lists[pos], idx, None),
+            chain.from_iterable(islice(self._lists, pos + 1, None)),
+        )
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(islice(self._iter_from(start), max(stop - start, 0)))
+            return [self[i] for i in range(start, stop, step)]
+        pos, idx = self._locate(self._check_index(index))
+        return self._lists[pos][idx]
+
+    def bisect_left(self, value: Any) -> int:
+        """Index where ``value`` would be inserted before equal values."""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + bisect_left(self._lists[pos], value)
+
+    def bisect_right(self, value: Any) -> int:
+        """Index where ``value`` would be inserted after equal values."""
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + bisect_right(self._lists[pos], value)
+
+    def count(self, value: Any) -> int:
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def index(self, value: Any) -> int:
+        """Position of the first occurrence of ``value``."""
+        i = self.bisect_left(value)
+        if i == self._len or self[i] != value:
+            raise ValueError(f"{value!r} not in SortedList")
+        return i
+
+    def irange(
+        self,
+        minimum: Any = None,
+        maximum: Any = None,
+        inclusive: Tuple[bool, bool] = (True, True),
+    ) -> Iterator:
+        """Iterate over the values between ``minimum`` and ``maximum``
+        (``None`` leaves that side open); ``inclusive`` says whether each
+        bound itself is included."""
+        if minimum is None:
+            start = 0
+        elif inclusive[0]:
+            start = self.bisect_left(minimum)
+        else:
+            start = self.bisect_right(minimum)
+        if maximum is None:
+            stop = self._len
+        elif inclusive[1]:
+            stop = self.bisect_right(maximum)
+        else:
+            stop = self.bisect_left(maximum)
+        return islice(self._iter_from(start), max(stop - start, 0))
+
+    def __contains__(self, value: Any) -> bool:
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        lst = self._lists[pos]
+        return lst[bisect_left(lst, value)] == value
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator:
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self) -> Iterator:
+        return chain.from_iterable(map(reversed, reversed(self._lists)))
+
+    def __repr__(self) -> str:
+        return f"SortedList({list(self)!r})"
+
+
+__all__ = ["DEFAULT_LOAD", "SortedList"]
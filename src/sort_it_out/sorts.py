@@ -1,17 +1,118 @@
 """Sorting algorithms and timing utilities for SortItOut.
 
 Functions operate on sequences of comparable items and return a new list
-with the sorted result. Timing helpers measure execution time using
-`time.perf_counter`.
+with the sorted result. Every algorithm accepts ``key`` and ``reverse``
+with the same meaning as for :func:`sorted`; keys are computed once per
+item and the result is stable. With ``inplace=True`` a mutable sequence
+(list, ``array.array``, ``bytearray``, writable ``memoryview``) is sorted
+directly and ``None`` is returned, like :meth:`list.sort`. The numeric
+algorithms also take ``backend="numpy"`` to run the vectorized variants
+in :mod:`sort_it_out.numpy_backend`. Timing helpers measure execution
+time using `time.perf_counter`.
 """
 from __future__ import annotations
 
 import time
-from typing import Callable, Dict, Iterable, List
+from array import array
+from collections import Counter
+from itertools import islice, repeat
+from math import isfinite, isqrt
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from .gaps import gap_sequence
+from .heaps import heap_sort_range
 
-def bubble_sort(data: Iterable) -> List:
-    arr = list(data)
+KeyFunc = Optional[Callable[[Any], Any]]
+
+
+def _scratch_like(arr, size: int):
+    """Return a ``size``-item buffer whose slices can be copied to and from
+    slices of ``arr`` (same type and item format).
+    """
+    if isinstance(arr, memoryview):
+        return memoryview(bytearray(size * arr.itemsize)).cast(arr.format)
+    if isinstance(arr, array):
+        return array(arr.typecode, bytes(size * arr.itemsize))
+    if isinstance(arr, bytearray):
+        return bytearray(size)
+    return [0] * size
+
+
+def _write_back(target, values: List) -> None:
+    """Copy ``values`` over the mutable sequence ``target`` in place."""
+    if isinstance(target, list):
+        target[:] = values
+    elif isinstance(target, memoryview):
+        target[:] = array(target.format, values)
+    elif isinstance(target, array):
+        target[:] = array(target.typecode, values)
+    else:
+        for i, x in enumerate(values):
+            target[i] = x
+
+
+_BACKENDS = ("python", "numpy")
+
+
+def _use_numpy(backend: str, key: KeyFunc) -> bool:
+    """Validate ``backend`` and return whether the call runs on NumPy."""
+    if backend not in _BACKENDS:
+        raise ValueError(f"backend must be one of {', '.join(_BACKENDS)}")
+    if backend == "numpy" and key is not None:
+        raise ValueError("key is not supported with backend='numpy'")
+    return backend == "numpy"
+
+
+def _comparison_sort(
+    kernel: Callable[[List], None],
+    data: Iterable,
+    key: KeyFunc,
+    reverse: bool,
+    inplace: bool,
+) -> Optional[List]:
+    """Sort ``data`` with the in-place ``kernel``.
+
+    Without ``inplace`` the items are copied and the sorted copy returned.
+    With ``inplace`` the mutable sequence ``data`` itself is sorted and
+    ``None`` returned, as :meth:`list.sort` does.
+
+    With ``key`` or ``reverse`` the items are decorated once as
+    ``(key, index)`` pairs: keys are computed exactly once per item, the
+    index breaks ties so every kernel sorts stably and items themselves are
+    never compared. For ``reverse`` the index is negated and the result
+    reversed, which keeps equal keys in their original order.
+    """
+    if inplace:
+        if key is None and not reverse:
+            kernel(data)
+        else:
+            _write_back(data, _comparison_sort(kernel, data, key, reverse, False))
+        return None
+    items = list(data)
+    if key is None and not reverse:
+        kernel(items)
+        return items
+    keys = items if key is None else [key(x) for x in items]
+    if reverse:
+        decorated = [(k, -i) for i, k in enumerate(keys)]
+        kernel(decorated)
+        return [items[-i] for _, i in reversed(decorated)]
+    decorated = list(zip(keys, range(len(items))))
+    kernel(decorated)
+    return [items[i] for _, i in decorated]
+
+
+def _bubble_sort_inplace(arr: List) -> None:
     n = len(arr)
     for i in range(n):
         swapped = False
@@ -21,46 +122,317 @@ def bubble_sort(data: Iterable) -> List:
                 swapped = True
         if not swapped:
             break
-    return arr
 
 
-def quick_sort(data: Iterable) -> List:
-    arr = list(data)
-    if len(arr) <= 1:
-        return arr
+def bubble_sort(
+    data: Iterable, key: KeyFunc = None, reverse: bool = False, inplace: bool = False
+) -> Optional[List]:
+    return _comparison_sort(_bubble_sort_inplace, data, key, reverse, inplace)
 
-    pivot = arr[len(arr) // 2]
-    left = [x for x in arr if x < pivot]
-    middle = [x for x in arr if x == pivot]
-    right = [x for x in arr if x > pivot]
-    return quick_sort(left) + middle + quick_sort(right)
 
+# Ranges at or below this size are finished with insertion sort.
+_INSERTION_CUTOFF = 16
+# Ranges larger than this use Tukey's ninther instead of median-of-three.
+_NINTHER_THRESHOLD = 128
 
-def merge_sort(data: Iterable) -> List:
-    arr = list(data)
-    if len(arr) <= 1:
-        return arr
 
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid])
-    right = merge_sort(arr[mid:])
+def _insertion_sort_range(arr: List, lo: int, hi: int) -> None:
+    for i in range(lo + 1, hi):
+        item = arr[i]
+        j = i - 1
+        while j >= lo and item < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = item
+
 
-    merged = []
-    i = j = 0
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            merged.append(left[i])
+def _median_of_three(arr: List, a: int, b: int, c: int) -> int:
+    x, y, z = arr[a], arr[b], arr[c]
+    if x < y:
+        if y < z:
+            return b
+        return c if x < z else a
+    if x < z:
+        return a
+    return c if y < z else b
+
+
+def _choose_pivot(arr: List, lo: int, hi: int):
+    n = hi - lo
+    mid = lo + n // 2
+    if n > _NINTHER_THRESHOLD:
+        s = n // 8
+        a = _median_of_three(arr, lo, lo + s, lo + 2 * s)
+        b = _median_of_three(arr, mid - s, mid, mid + s)
+        c = _median_of_three(arr, hi - 1 - 2 * s, hi - 1 - s, hi - 1)
+        return arr[_median_of_three(arr, a, b, c)]
+    return arr[_median_of_three(arr, lo, mid, hi - 1)]
+
+
+def _partition3(arr: List, lo: int, hi: int, pivot) -> Tuple[int, int]:
+    """Dijkstra three-way partition of ``arr[lo:hi]`` around ``pivot``.
+
+    Returns ``(lt, gt)`` such that ``arr[lo:lt] < pivot``,
+    ``arr[lt:gt] == pivot`` and ``arr[gt:hi] > pivot``.
+    """
+    lt = i = lo
+    gt = hi
+    while i < gt:
+        x = arr[i]
+        if x < pivot:
+            arr[lt], arr[i] = x, arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < x:
+            gt -= 1
+            arr[i], arr[gt] = arr[gt], x
+        else:
             i += 1
+    return lt, gt
+
+
+def _introsort(arr: List, lo: int, hi: int, depth: int) -> None:
+    while hi - lo > _INSERTION_CUTOFF:
+        if depth == 0:
+            # Too many unbalanced partitions: guarantee O(n log n).
+            heap_sort_range(arr, lo, hi)
+            return
+        depth -= 1
+        lt, gt = _partition3(arr, lo, hi, _choose_pivot(arr, lo, hi))
+        # Recurse into the smaller side and loop on the larger one so the
+        # stack depth stays O(log n).
+        if lt - lo < hi - gt:
+            _introsort(arr, lo, lt, depth)
+            lo = gt
         else:
-            merged.append(right[j])
+            _introsort(arr, gt, hi, depth)
+            hi = lt
+    _insertion_sort_range(arr, lo, hi)
+
+
+def _quick_sort_inplace(arr: List) -> None:
+    n = len(arr)
+    if n > 1:
+        _introsort(arr, 0, n, 2 * n.bit_length())
+
+
+def quick_sort(
+    data: Iterable,
+    key: KeyFunc = None,
+    reverse: bool = False,
+    inplace: bool = False,
+    backend: str = "python",
+) -> Optional[List]:
+    if _use_numpy(backend, key):
+        from . import numpy_backend
+
+        return numpy_backend.run("quick", data, reverse, inplace)
+    return _comparison_sort(_quick_sort_inplace, data, key, reverse, inplace)
+
+
+# Consecutive wins by one run before the merge switches to galloping.
+_MIN_GALLOP = 7
+
+
+def _min_run_length(n: int) -> int:
+    """Return the shortest run the merge engine builds for ``n`` items.
+
+    Mirrors TimSort: a value in ``[32, 64]`` chosen so ``n / minrun`` is
+    close to, but not above, a power of two, keeping merges balanced.
+    """
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _count_run(arr: List, lo: int, hi: int) -> int:
+    """Return the end of the natural run starting at ``lo``.
+
+    Strictly descending runs are reversed in place so every run returned
+    is ascending; requiring strictness keeps the sort stable.
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return hi
+    if arr[run_hi] < arr[lo]:
+        run_hi += 1
+        while run_hi < hi and arr[run_hi] < arr[run_hi - 1]:
+            run_hi += 1
+        arr[lo:run_hi] = arr[lo:run_hi][::-1]
+    else:
+        run_hi += 1
+        while run_hi < hi and not arr[run_hi] < arr[run_hi - 1]:
+            run_hi += 1
+    return run_hi
+
+
+def _binary_insertion_sort(arr: List, lo: int, hi: int, start: int) -> None:
+    """Sort ``arr[lo:hi]`` given that ``arr[lo:start]`` is already sorted."""
+    for i in range(start, hi):
+        item = arr[i]
+        left, right = lo, i
+        while left < right:
+            m = (left + right) >> 1
+            if item < arr[m]:
+                right = m
+            else:
+                left = m + 1
+        if left < i:
+            arr[left + 1 : i + 1] = arr[left:i]
+            arr[left] = item
+
+
+def _gallop_left(key, seq: List, lo: int, hi: int) -> int:
+    """Return the first index in sorted ``seq[lo:hi]`` with ``seq[i] >= key``.
+
+    Probes ``lo``, ``lo + 1``, ``lo + 2``, ``lo + 4``... before bisecting,
+    so the cost is logarithmic in the distance from ``lo`` rather than in
+    the length of the range.
+    """
+    last = lo
+    probe = lo
+    step = 1
+    while probe < hi and seq[probe] < key:
+        last = probe + 1
+        probe = lo + step
+        step <<= 1
+    if probe > hi:
+        probe = hi
+    while last < probe:
+        m = (last + probe) >> 1
+        if seq[m] < key:
+            last = m + 1
+        else:
+            probe = m
+    return last
+
+
+def _gallop_right(key, seq: List, lo: int, hi: int) -> int:
+    """Return the first index in sorted ``seq[lo:hi]`` with ``seq[i] > key``.
+
+    Same exponential search as :func:`_gallop_left`, but equal items are
+    skipped so merges stay stable.
+    """
+    last = lo
+    probe = lo
+    step = 1
+    while probe < hi and not key < seq[probe]:
+        last = probe + 1
+        probe = lo + step
+        step <<= 1
+    if probe > hi:
+        probe = hi
+    while last < probe:
+        m = (last + probe) >> 1
+        if key < seq[m]:
+            probe = m
+        else:
+            last = m + 1
+    return last
+
+
+def _merge_runs(arr: List, aux: List, lo: int, mid: int, hi: int) -> None:
+    """Stably merge the adjacent sorted runs ``arr[lo:mid]`` and ``arr[mid:hi]``.
+
+    Only the left run (after trimming) is copied into ``aux``, which is
+    reused across merges. When one run wins
+    ``_MIN_GALLOP`` times in a row, the merge gallops to find how many
+    more items it can move in one slice copy.
+    """
+    # Left items <= the right head and right items >= the left tail are
+    # already in their final position.
+    lo = _gallop_right(arr[mid], arr, lo, mid)
+    if lo == mid:
+        return
+    hi = _gallop_left(arr[mid - 1], arr, mid, hi)
+    n1 = mid - lo
+    aux[:n1] = arr[lo:mid]
+    i, j, k = 0, mid, lo
+    wins_left = wins_right = 0
+    while i < n1 and j < hi:
+        if arr[j] < aux[i]:
+            arr[k] = arr[j]
+            k += 1
             j += 1
-    merged.extend(left[i:])
-    merged.extend(right[j:])
-    return merged
+            wins_right += 1
+            wins_left = 0
+            if wins_right >= _MIN_GALLOP:
+                end = _gallop_left(aux[i], arr, j, hi)
+                arr[k : k + end - j] = arr[j:end]
+                k += end - j
+                j = end
+                wins_right = 0
+        else:
+            arr[k] = aux[i]
+            k += 1
+            i += 1
+            wins_left += 1
+            wins_right = 0
+            if wins_left >= _MIN_GALLOP:
+                end = _gallop_right(arr[j], aux, i, n1)
+                arr[k : k + end - i] = aux[i:end]
+                k += end - i
+                i = end
+                wins_left = 0
+    if i < n1:
+        arr[k : k + n1 - i] = aux[i:n1]
 
 
-def selection_sort(data: Iterable) -> List:
-    arr = list(data)
+def _natural_merge_sort(arr: List) -> None:
+    """Sort ``arr`` in place with a bottom-up natural merge sort.
+
+    Existing ascending and descending runs are detected first (short
+    runs are extended to the minimum run length with binary insertion
+    sort), then adjacent runs are merged pairwise, pass by pass, sharing
+    one auxiliary buffer. Already sorted input is a single run and costs
+    one linear scan.
+    """
+    n = len(arr)
+    if n < 2:
+        return
+    min_run = _min_run_length(n)
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        run_hi = _count_run(arr, lo, n)
+        if run_hi - lo < min_run:
+            forced = min(lo + min_run, n)
+            _binary_insertion_sort(arr, lo, forced, run_hi)
+            run_hi = forced
+        bounds.append(run_hi)
+        lo = run_hi
+
+    # Lists, arrays and bytearrays grow the buffer on demand through slice
+    # assignment; memoryviews cannot grow, so they get a full-size one.
+    aux = _scratch_like(arr, n) if isinstance(arr, memoryview) else arr[:0]
+    while len(bounds) > 2:
+        merged = [0]
+        for p in range(2, len(bounds), 2):
+            _merge_runs(arr, aux, bounds[p - 2], bounds[p - 1], bounds[p])
+            merged.append(bounds[p])
+        if len(bounds) % 2 == 0:
+            # Odd number of runs: the last one carries over to the next pass.
+            merged.append(bounds[-1])
+        bounds = merged
+
+
+def merge_sort(
+    data: Iterable,
+    key: KeyFunc = None,
+    reverse: bool = False,
+    inplace: bool = False,
+    backend: str = "python",
+) -> Optional[List]:
+    if _use_numpy(backend, key):
+        from . import numpy_backend
+
+        return numpy_backend.run("merge", data, reverse, inplace)
+    return _comparison_sort(_natural_merge_sort, data, key, reverse, inplace)
+
+
+def _selection_sort_inplace(arr: List) -> None:
     n = len(arr)
     for i in range(n):
         min_idx = i
@@ -68,11 +440,15 @@ def selection_sort(data: Iterable) -> List:
             if arr[j] < arr[min_idx]:
                 min_idx = j
         arr[i], arr[min_idx] = arr[min_idx], arr[i]
-    return arr
 
 
-def insertion_sort(data: Iterable) -> List:
-    arr = list(data)
+def selection_sort(
+    data: Iterable, key: KeyFunc = None, reverse: bool = False, inplace: bool = False
+) -> Optional[List]:
+    return _comparison_sort(_selection_sort_inplace, data, key, reverse, inplace)
+
+
+def _insertion_sort_inplace(arr: List) -> None:
     for i in range(1, len(arr)):
         key = arr[i]
         j = i - 1
@@ -80,38 +456,27 @@ def insertion_sort(data: Iterable) -> List:
             arr[j + 1] = arr[j]
             j -= 1
         arr[j + 1] = key
-    return arr
 
 
-def heap_sort(data: Iterable) -> List:
-    arr = list(data)
+def insertion_sort(
+    data: Iterable, key: KeyFunc = None, reverse: bool = False, inplace: bool = False
+) -> Optional[List]:
+    return _comparison_sort(_insertion_sort_inplace, data, key, reverse, inplace)
 
-    def heapify(n, i):
-        largest = i
-        left_idx = 2 * i + 1
-        right_idx = 2 * i + 2
-        if left_idx < n and arr[left_idx] > arr[largest]:
-            largest = left_idx
-        if right_idx < n and arr[right_idx] > arr[largest]:
-            largest = right_idx
-        if largest != i:
-            arr[i], arr[largest] = arr[largest], arr[i]
-            heapify(n, largest)
 
-    n = len(arr)
-    for i in range(n // 2 - 1, -1, -1):
-        heapify(n, i)
-    for i in range(n - 1, 0, -1):
-        arr[0], arr[i] = arr[i], arr[0]
-        heapify(i, 0)
-    return arr
+def _heap_sort_inplace(arr: List) -> None:
+    heap_sort_range(arr, 0, len(arr))
 
 
-def shell_sort(data: Iterable) -> List:
-    arr = list(data)
+def heap_sort(
+    data: Iterable, key: KeyFunc = None, reverse: bool = False, inplace: bool = False
+) -> Optional[List]:
+    return _comparison_sort(_heap_sort_inplace, data, key, reverse, inplace)
+
+
+def _shell_sort_inplace(arr: List, gaps: Iterable[int]) -> None:
     n = len(arr)
-    gap = n // 2
-    while gap > 0:
+    for gap in gaps:
         for i in range(gap, n):
             temp = arr[i]
             j = i
@@ -119,101 +484,565 @@ def shell_sort(data: Iterable) -> List:
                 arr[j] = arr[j - gap]
                 j -= gap
             arr[j] = temp
-        gap //= 2
-    return arr
 
 
-def counting_sort(data: Iterable) -> List:
+def shell_sort(
+    data: Iterable,
+    gaps: Union[str, Iterable[int]] = "ciura",
+    key: KeyFunc = None,
+    reverse: bool = False,
+    inplace: bool = False,
+) -> Optional[List]:
+    """Shell sort using the named gap sequence (see :mod:`sort_it_out.gaps`).
+
+    ``gaps`` may also be an explicit iterable of gaps. The default Ciura
+    sequence avoids the O(n^2) worst case of Shell's halving sequence
+    (still available as ``gaps="shell"``).
+    """
+
+    def kernel(arr: List) -> None:
+        _shell_sort_inplace(arr, gap_sequence(gaps, len(arr)))
+
+    return _comparison_sort(kernel, data, key, reverse, inplace)
+
+
+# Dense count tables are never allocated with more slots than this.
+COUNTING_MAX_RANGE = 1 << 22
+# A dense table is used only while the value span is at most this multiple
+# of the item count (plus a small constant); wider spans are counted in a
+# sparse dict histogram instead.
+_DENSE_SPAN_RATIO = 4
+_DENSE_SPAN_SLACK = 1024
+
+_COUNTING_FALLBACKS = ("sparse", "radix", "error")
+
+
+def _use_dense_counts(span: int, n: int, max_range: int) -> bool:
+    return span <= max_range and span <= _DENSE_SPAN_RATIO * n + _DENSE_SPAN_SLACK
+
+
+def _int_histogram(
+    arr: List[int], lo_val: int, hi_val: int, max_range: int
+) -> List[Tuple[int, int]]:
+    span = hi_val - lo_val + 1
+    if _use_dense_counts(span, len(arr), max_range):
+        counts = [0] * span
+        for x in arr:
+            counts[x - lo_val] += 1
+        return [(i + lo_val, c) for i, c in enumerate(counts) if c]
+    hist = Counter(arr)
+    return [(v, hist[v]) for v in radix_sort(hist)]
+
+
+def _counting_sort_keyed(
+    items: List, keys: List[int], lo_val: int, hi_val: int, max_range: int
+) -> List:
+    """Stable counting sort of ``items`` by their integer ``keys``."""
+    span = hi_val - lo_val + 1
+    out = [None] * len(items)
+    if _use_dense_counts(span, len(items), max_range):
+        starts = [0] * span
+        for k in keys:
+            starts[k - lo_val] += 1
+        total = 0
+        for slot in range(span):
+            c = starts[slot]
+            starts[slot] = total
+            total += c
+        for k, x in zip(keys, items):
+            slot = k - lo_val
+            out[starts[slot]] = x
+            starts[slot] += 1
+        return out
+    hist = Counter(keys)
+    offsets: Dict[int, int] = {}
+    total = 0
+    for k in radix_sort(hist):
+        offsets[k] = total
+        total += hist[k]
+    for k, x in zip(keys, items):
+        out[offsets[k]] = x
+        offsets[k] += 1
+    return out
+
+
+def counting_histogram(
+    data: Iterable, max_range: int = COUNTING_MAX_RANGE
+) -> List[Tuple[int, int]]:
+    """Return ``(value, count)`` pairs for integer ``data`` in ascending order.
+
+    Uses a dense count table when the value span is small compared to the
+    number of items (and at most ``max_range`` slots), otherwise a sparse
+    dict histogram whose distinct keys are ordered with ``radix_sort``.
+    """
     arr = list(data)
     if not arr:
         return []
-    # Counting sort only works with integers
     if not all(isinstance(x, int) for x in arr):
+        raise TypeError("counting_histogram requires integer inputs")
+    return _int_histogram(arr, min(arr), max(arr), max_range)
+
+
+# Values counted per step by stream_counting_histogram.
+_STREAM_BLOCK = 1 << 16
+
+
+def stream_counting_histogram(
+    values: Iterable, max_range: int = COUNTING_MAX_RANGE, reverse: bool = False
+) -> List[Tuple[int, int]]:
+    """Return ``(value, count)`` pairs for the integer stream ``values``,
+    in ascending order (descending for ``reverse``), without storing the
+    values.
+
+    Memory is O(distinct values): counting stops with ``ValueError`` as
+    soon as more than ``max_range`` distinct values have been seen.
+    """
+    hist: Counter = Counter()
+    it = iter(values)
+    while True:
+        block = list(islice(it, _STREAM_BLOCK))
+        if not block:
+            break
+        hist.update(block)
+        if len(hist) > max_range:
+            raise ValueError(
+                f"more than max_range={max_range} distinct values for "
+                "streaming counting sort"
+            )
+    if not all(isinstance(v, int) for v in hist):
         raise TypeError("counting_sort requires integer inputs")
-    min_val = min(arr)
-    max_val = max(arr)
-    offset = -min_val
-    size = max_val - min_val + 1
-    counts = [0] * size
-    for x in arr:
-        counts[x + offset] += 1
-    res: List[int] = []
-    for i, c in enumerate(counts):
-        res.extend([i - offset] * c)
-    return res
+    keys = radix_sort(hist, reverse=reverse)
+    return [(v, hist[v]) for v in keys]
 
 
-def radix_sort(data: Iterable) -> List:
-    arr = list(data)
+def stream_counting_sort(
+    values: Iterable, max_range: int = COUNTING_MAX_RANGE, reverse: bool = False
+) -> Iterator[int]:
+    """Counting sort of the integer stream ``values`` in O(distinct values)
+    memory: the histogram is built while reading and the sorted values
+    are generated from the counts. See :func:`stream_counting_histogram`.
+    """
+    for v, c in stream_counting_histogram(values, max_range, reverse):
+        yield from repeat(v, c)
+
+
+def counting_sort(
+    data: Iterable,
+    max_range: int = COUNTING_MAX_RANGE,
+    fallback: str = "sparse",
+    key: KeyFunc = None,
+    reverse: bool = False,
+    inplace: bool = False,
+    backend: str = "python",
+) -> Optional[List]:
+    """Counting sort for integers with a guard on the count table size.
+
+    Small spans use a dense ``[0] * span`` table. Spans that are wide
+    compared to the input use a sparse histogram, so a single outlier
+    cannot trigger a huge allocation. When the span exceeds ``max_range``
+    the ``fallback`` decides: ``"sparse"`` (default) keeps the sparse
+    histogram, ``"radix"`` delegates to :func:`radix_sort` and
+    ``"error"`` raises ``ValueError``.
+
+    ``key`` must return integers; it is called once per item and the keys
+    are counted directly, with items placed stably by prefix sums.
+    ``reverse`` counts negated keys, which keeps the sort stable.
+
+    ``backend="numpy"`` counts with ``np.bincount`` and hands spans too
+    wide for a dense table to the vectorized radix sort.
+    """
+    if fallback not in _COUNTING_FALLBACKS:
+        raise ValueError(f"fallback must be one of {', '.join(_COUNTING_FALLBACKS)}")
+    if _use_numpy(backend, key):
+        from . import numpy_backend
+
+        return numpy_backend.run(
+            "counting", data, reverse, inplace, max_range=max_range
+        )
+    arr = data if inplace else list(data)
     if not arr:
-        return []
-    if not all(isinstance(x, int) for x in arr):
-        raise TypeError("radix_sort requires integer inputs")
-    # Handle negatives by offsetting
-    neg = [x for x in arr if x < 0]
-    pos = [x for x in arr if x >= 0]
-
-    def _radix(ls: List[int]) -> List[int]:
-        if not ls:
-            return []
-        max_val = max(ls)
-        exp = 1
-        res = list(ls)
-        while max_val // exp > 0:
-            buckets = [[] for _ in range(10)]
-            for num in res:
-                buckets[(num // exp) % 10].append(num)
-            res = [v for bucket in buckets for v in bucket]
-            exp *= 10
+        return None if inplace else []
+    keys = arr if key is None else [key(x) for x in arr]
+    # Counting sort only works with integers
+    if not all(isinstance(k, int) for k in keys):
+        raise TypeError("counting_sort requires integer inputs")
+    if reverse:
+        keys = [-k for k in keys]
+    min_val = min(keys)
+    max_val = max(keys)
+    if max_val - min_val + 1 > max_range:
+        if fallback == "radix":
+            return radix_sort(arr, key=key, reverse=reverse, inplace=inplace)
+        if fallback == "error":
+            raise ValueError(
+                f"counting_sort value range {max_val - min_val + 1} exceeds "
+                f"max_range={max_range}"
+            )
+    if keys is not arr:
+        res = _counting_sort_keyed(arr, keys, min_val, max_val, max_range)
+        if inplace:
+            _write_back(arr, res)
+            return None
         return res
+    hist = _int_histogram(arr, min_val, max_val, max_range)
+    if inplace:
+        # Rewrite the input from the histogram: no second n-item list.
+        pos = 0
+        for v, c in hist:
+            if isinstance(arr, list):
+                arr[pos : pos + c] = [v] * c
+            else:
+                for i in range(pos, pos + c):
+                    arr[i] = v
+            pos += c
+        return None
+    res = []
+    for v, c in hist:
+        res.extend([v] * c)
+    return res
 
-    pos_sorted = _radix(pos)
-    # For negatives, sort absolute values then reverse
-    neg_sorted = _radix([abs(x) for x in neg])
-    neg_sorted = [-x for x in reversed(neg_sorted)]
-    return neg_sorted + pos_sorted
 
+def _radix_bias(lo_val: int, hi_val: int) -> int:
+    if lo_val >= 0:
+        return 0
+    # Adding 2**(width - 1) to a width-bit two's complement value is the
+    # same as flipping its sign bit: keys become non-negative and keep
+    # their order.
+    return 1 << max(lo_val.bit_length(), hi_val.bit_length())
 
-def bucket_sort(data: Iterable) -> List:
-    arr = list(data)
+
+def _radix_prefix(counts: List[int]) -> None:
+    total = 0
+    for d in range(len(counts)):
+        c = counts[d]
+        counts[d] = total
+        total += c
+
+
+def _radix_sort_inplace(arr, bits: int, buf) -> None:
+    """Sort the integers in ``arr`` in place.
+
+    ``buf`` must have the same length and type as ``arr``; passes
+    alternate between the two and the result is copied back to ``arr``
+    after an odd number of passes.
+    """
+    n = len(arr)
+    lo_val = min(arr)
+    hi_val = max(arr)
+    bias = _radix_bias(lo_val, hi_val)
+    key_bits = (hi_val + bias).bit_length()
+    radix = 1 << bits
+    mask = radix - 1
+
+    src, dst = arr, buf
+    shift = 0
+    while shift < key_bits:
+        if bias:
+            digits = [((x + bias) >> shift) & mask for x in src]
+        else:
+            digits = [(x >> shift) & mask for x in src]
+        counts = [0] * radix
+        for d in digits:
+            counts[d] += 1
+        if counts[digits[0]] != n:
+            _radix_prefix(counts)
+            for x, d in zip(src, digits):
+                dst[counts[d]] = x
+                counts[d] += 1
+            src, dst = dst, src
+        shift += bits
+    if src is not arr:
+        arr[:] = src
+
+
+def _radix_sort_indices(keys: List[int], bits: int) -> List[int]:
+    """Return the stable permutation that orders the integer ``keys``.
+
+    Same passes as :func:`radix_sort`, but only item indices move; digits
+    are read from ``keys`` through the index.
+    """
+    n = len(keys)
+    bias = _radix_bias(min(keys), max(keys))
+    if bias:
+        keys = [k + bias for k in keys]
+    key_bits = max(keys).bit_length()
+    radix = 1 << bits
+    mask = radix - 1
+
+    perm = list(range(n))
+    buf = [0] * n
+    shift = 0
+    while shift < key_bits:
+        digits = [(keys[i] >> shift) & mask for i in perm]
+        counts = [0] * radix
+        for d in digits:
+            counts[d] += 1
+        if counts[digits[0]] != n:
+            _radix_prefix(counts)
+            for i, d in zip(perm, digits):
+                buf[counts[d]] = i
+                counts[d] += 1
+            perm, buf = buf, perm
+        shift += bits
+    return perm
+
+
+def radix_sort(
+    data: Iterable,
+    bits: int = 8,
+    key: KeyFunc = None,
+    reverse: bool = False,
+    inplace: bool = False,
+    backend: str = "python",
+) -> Optional[List]:
+    """LSD radix sort over ``bits``-wide digits (base ``2 ** bits``).
+
+    Digits are extracted with shifts and masks and each pass places items
+    through counting prefix sums into one preallocated buffer, swapping
+    source and destination between passes. Negative numbers are handled
+    by flipping the sign bit of a two's complement encoding just wide
+    enough for the data, so they need no separate pass. Only as many
+    passes run as the widest key needs, and passes where every item has
+    the same digit are skipped.
+
+    ``key`` must return integers; keys are computed once and the passes
+    move item indices instead of values. ``reverse`` sorts negated keys,
+    which keeps the sort stable.
+
+    ``backend="numpy"`` runs every pass on whole arrays and also accepts
+    floats, which are mapped to order-preserving 64-bit keys.
+    """
+    if bits < 1:
+        raise ValueError("bits must be >= 1")
+    if _use_numpy(backend, key):
+        from . import numpy_backend
+
+        return numpy_backend.run("radix", data, reverse, inplace, bits=bits)
+    arr = data if inplace else list(data)
     if not arr:
-        return []
-    # This implementation expects floats in [0, 1)
-    if not all(isinstance(x, float) for x in arr):
-        raise TypeError("bucket_sort expects floats in [0, 1)")
+        return None if inplace else []
+    keys = arr if key is None else [key(x) for x in arr]
+    if not all(isinstance(k, int) for k in keys):
+        raise TypeError("radix_sort requires integer inputs")
+    if reverse:
+        keys = [-k for k in keys]
+    if keys is arr:
+        _radix_sort_inplace(arr, bits, _scratch_like(arr, len(arr)))
+        return None if inplace else arr
+    res = [arr[i] for i in _radix_sort_indices(keys, bits)]
+    if inplace:
+        _write_back(arr, res)
+        return None
+    return res
+
+
+_INFINITIES = (float("inf"), float("-inf"))
+# Integer spans wider than this are scaled with integer arithmetic, as
+# converting them to float would overflow.
+_FLOAT_SAFE_BITS = 1000
+# Buckets holding at most this many items are finished with insertion sort.
+_BUCKET_INSERTION_LIMIT = 32
+# Overflowing buckets are bucket sorted recursively up to this depth and
+# merge sorted below it, which bounds skewed (e.g. exponential) inputs.
+_BUCKET_MAX_DEPTH = 16
+
+
+def _bucket_sort_list(arr: List, depth: int) -> List:
+    lo_val = min(arr)
+    hi_val = max(arr)
+    if lo_val == hi_val:
+        return arr
     n = len(arr)
-    buckets: List[List[float]] = [[] for _ in range(n)]
-    for x in arr:
-        idx = min(n - 1, int(x * n))
-        buckets[idx].append(x)
-    res: List[float] = []
+    # sqrt(n) buckets keeps the number of Python lists small while each
+    # level still shrinks the problem quickly.
+    count = max(2, isqrt(n))
+    last = count - 1
+    buckets: List[List] = [[] for _ in range(count)]
+    span = hi_val - lo_val
+    if isinstance(span, int) and span.bit_length() > _FLOAT_SAFE_BITS:
+        # Exact integer scaling: the span does not fit a float.
+        span += 1
+        for x in arr:
+            buckets[int((x - lo_val) * count // span)].append(x)
+    elif span == _INFINITIES[0] or not isfinite(count / span):
+        # The float range overflows (e.g. -1e308 to 1e308) or is too
+        # small to invert (a subnormal span): no scale.
+        _natural_merge_sort(arr)
+        return arr
+    else:
+        scale = count / span
+        for x in arr:
+            idx = int((x - lo_val) * scale)
+            buckets[idx if idx < last else last].append(x)
+    res: List = []
+    for b in buckets:
+        if len(b) <= _BUCKET_INSERTION_LIMIT:
+            _insertion_sort_range(b, 0, len(b))
+            res.extend(b)
+        elif depth >= _BUCKET_MAX_DEPTH:
+            _natural_merge_sort(b)
+            res.extend(b)
+        else:
+            res.extend(_bucket_sort_list(b, depth + 1))
+    return res
+
+
+def _bucket_sort_indices(keys: List, order: List[int], depth: int) -> List[int]:
+    """Bucket sort the indices in ``order`` by ``keys[i]``, stably."""
+    vals = [keys[i] for i in order]
+    lo_val = min(vals)
+    hi_val = max(vals)
+    if lo_val == hi_val:
+        return order
+    count = max(2, isqrt(len(order)))
+    last = count - 1
+    buckets: List[List[int]] = [[] for _ in range(count)]
+    span = hi_val - lo_val
+    if isinstance(span, int) and span.bit_length() > _FLOAT_SAFE_BITS:
+        span += 1
+        for i, k in zip(order, vals):
+            buckets[int((k - lo_val) * count // span)].append(i)
+    elif span == _INFINITIES[0] or not isfinite(count / span):
+        pairs = [(keys[i], i) for i in order]
+        _natural_merge_sort(pairs)
+        return [i for _, i in pairs]
+    else:
+        scale = count / span
+        for i, k in zip(order, vals):
+            idx = int((k - lo_val) * scale)
+            buckets[idx if idx < last else last].append(i)
+    res: List[int] = []
     for b in buckets:
-        res.extend(sorted(b))
+        if len(b) <= _BUCKET_INSERTION_LIMIT:
+            for j in range(1, len(b)):
+                i = b[j]
+                k = keys[i]
+                m = j - 1
+                while m >= 0 and k < keys[b[m]]:
+                    b[m + 1] = b[m]
+                    m -= 1
+                b[m + 1] = i
+            res.extend(b)
+        elif depth >= _BUCKET_MAX_DEPTH:
+            # Indices within a bucket are ascending, so (key, index) pairs
+            # sort stably.
+            pairs = [(keys[i], i) for i in b]
+            _natural_merge_sort(pairs)
+            res.extend(i for _, i in pairs)
+        else:
+            res.extend(_bucket_sort_indices(keys, b, depth + 1))
     return res
 
 
-def comb_sort(data: Iterable) -> List:
-    arr = list(data)
+def _bucket_sort_order(keys: List) -> List[int]:
+    """Stable bucket sort permutation of ``keys``; infinities and NaNs,
+    which have no place on a bucket scale, are split off first and placed
+    as ``-inf``, finite keys, ``+inf``, then NaN."""
+    order = list(range(len(keys)))
+    odd = [i for i in order if keys[i] != keys[i] or keys[i] in _INFINITIES]
+    if not odd:
+        return _bucket_sort_indices(keys, order, 0)
+    skip = set(odd)
+    finite = [i for i in order if i not in skip]
+    res = [i for i in odd if keys[i] < 0]
+    if finite:
+        res.extend(_bucket_sort_indices(keys, finite, 0))
+    res.extend(i for i in odd if keys[i] > 0)
+    res.extend(i for i in odd if keys[i] != keys[i])
+    return res
+
+
+def bucket_sort(
+    data: Iterable,
+    key: KeyFunc = None,
+    reverse: bool = False,
+    inplace: bool = False,
+    backend: str = "python",
+) -> Optional[List]:
+    """Bucket sort for arbitrary int and float data.
+
+    The ``[min, max]`` range of the input is scaled onto ``sqrt(n)``
+    buckets. Small buckets are finished with insertion sort and larger
+    ones are bucket sorted recursively on their own range, so the sort
+    adapts to clustered data. The sort is stable. Integer ranges too wide
+    for a float are scaled with exact integer arithmetic; infinities go to
+    the ends and NaNs last. Ints beyond the float range mixed with floats
+    have no common scale and are merge sorted.
+
+    ``key`` must return numbers; keys are computed once and drive the
+    bucket index directly while item indices are distributed.
+
+    Buckets always hold every item, so ``inplace`` saves the final copy
+    but not the bucket memory.
+
+    ``backend="numpy"`` computes every bucket index at once and finishes
+    the buckets with vectorized odd-even transposition rounds.
+    """
+    if _use_numpy(backend, key):
+        from . import numpy_backend
+
+        return numpy_backend.run("bucket", data, reverse, inplace)
+    arr = data if inplace else list(data)
+    if not arr:
+        return None if inplace else []
+    keys = arr if key is None else [key(x) for x in arr]
+    if not all(isinstance(k, (int, float)) for k in keys):
+        raise TypeError("bucket_sort requires numeric (int or float) inputs")
+    if reverse:
+        keys = [-k for k in keys]
+    try:
+        if keys is arr and not any(k != k or k in _INFINITIES for k in keys):
+            res = _bucket_sort_list(arr, 0)
+        else:
+            res = [arr[i] for i in _bucket_sort_order(keys)]
+    except OverflowError:
+        # Ints beyond the float range mixed with floats: no common scale.
+        pairs = list(zip(keys, range(len(arr))))
+        _natural_merge_sort(pairs)
+        res = [arr[i] for _, i in pairs]
+    if inplace:
+        _write_back(arr, res)
+        return None
+    return res
+
+
+def _comb_sort_inplace(arr: List, gaps: Iterable[int]) -> None:
     n = len(arr)
-    gap = n
-    shrink = 1.3
-    sorted_flag = False
-    while not sorted_flag:
-        gap = int(gap / shrink)
-        if gap <= 1:
-            gap = 1
-            sorted_flag = True
-        i = 0
-        while i + gap < n:
+    for gap in gaps:
+        if gap == 1:
+            break
+        for i in range(n - gap):
             if arr[i] > arr[i + gap]:
                 arr[i], arr[i + gap] = arr[i + gap], arr[i]
+    # Finish with gap-1 passes until nothing moves.
+    sorted_flag = False
+    while not sorted_flag:
+        sorted_flag = True
+        for i in range(n - 1):
+            if arr[i] > arr[i + 1]:
+                arr[i], arr[i + 1] = arr[i + 1], arr[i]
                 sorted_flag = False
-            i += 1
-    return arr
 
 
-def cocktail_sort(data: Iterable) -> List:
-    arr = list(data)
+def comb_sort(
+    data: Iterable,
+    gaps: Union[str, Iterable[int]] = "comb",
+    key: KeyFunc = None,
+    reverse: bool = False,
+    inplace: bool = False,
+) -> Optional[List]:
+    """Comb sort using the named gap sequence (see :mod:`sort_it_out.gaps`).
+
+    The default ``"comb"`` sequence is the classic 1.3 shrink factor.
+    """
+
+    def kernel(arr: List) -> None:
+        _comb_sort_inplace(arr, gap_sequence(gaps, len(arr)))
+
+    return _comparison_sort(kernel, data, key, reverse, inplace)
+
+
+def _cocktail_sort_inplace(arr: List) -> None:
     n = len(arr)
     swapped = True
     start = 0
@@ -233,11 +1062,15 @@ def cocktail_sort(data: Iterable) -> List:
                 arr[i], arr[i + 1] = arr[i + 1], arr[i]
                 swapped = True
         start += 1
-    return arr
 
 
-def gnome_sort(data: Iterable) -> List:
-    arr = list(data)
+def cocktail_sort(
+    data: Iterable, key: KeyFunc = None, reverse: bool = False, inplace: bool = False
+) -> Optional[List]:
+    return _comparison_sort(_cocktail_sort_inplace, data, key, reverse, inplace)
+
+
+def _gnome_sort_inplace(arr: List) -> None:
     i = 1
     n = len(arr)
     while i < n:
@@ -248,26 +1081,46 @@ def gnome_sort(data: Iterable) -> List:
             i -= 1
             if i == 0:
                 i = 1
-    return arr
+
+
+def gnome_sort(
+    data: Iterable, key: KeyFunc = None, reverse: bool = False, inplace: bool = False
+) -> Optional[List]:
+    return _comparison_sort(_gnome_sort_inplace, data, key, reverse, inplace)
+
+
+def _fresh_copy(data):
+    """Return a copy of ``data`` of the same mutable type for one timed run."""
+    if isinstance(data, memoryview):
+        return memoryview(bytearray(data.tobytes())).cast(data.format)
+    if isinstance(data, (array, bytearray)):
+        return data[:]
+    return list(data)
 
 
 def time_sort(
     algorithm: Callable[[Iterable], List],
     data: Iterable,
     repeat: int = 3,
+    inplace: bool = False,
 ) -> float:
     """Time ``algorithm`` on ``data``.
 
     Runs ``algorithm`` ``repeat`` times and returns the average elapsed
-    time in seconds.
+    time in seconds. With ``inplace`` each run sorts a fresh copy of
+    ``data`` (of the same type) with ``inplace=True``; the copy is made
+    outside the timed region.
     """
     if repeat <= 0:
         raise ValueError("repeat must be >= 1")
     total = 0.0
     for _ in range(repeat):
-        to_run = list(data)
+        to_run = _fresh_copy(data) if inplace else list(data)
         start = time.perf_counter()
-        algorithm(to_run)
+        if inplace:
+            algorithm(to_run, inplace=True)
+        else:
+            algorithm(to_run)
         end = time.perf_counter()
         total += end - start
     return total / repeat
@@ -277,13 +1130,14 @@ def compare_algorithms(
     algorithms: Dict[str, Callable[[Iterable], List]],
     data: Iterable,
     repeat: int = 3,
+    inplace: bool = False,
 ) -> Dict[str, float]:
     """Return a mapping algorithm_name -> average_time_seconds for each
     algorithm.
     """
     results: Dict[str, float] = {}
     for name, alg in algorithms.items():
-        results[name] = time_sort(alg, data, repeat=repeat)
+        results[name] = time_sort(alg, data, repeat=repeat, inplace=inplace)
     return results
 
 
@@ -291,6 +1145,18 @@ __all__ = [
     "bubble_sort",
     "quick_sort",
     "merge_sort",
+    "selection_sort",
+    "insertion_sort",
+    "heap_sort",
+    "shell_sort",
+    "counting_sort",
+    "counting_histogram",
+    "radix_sort",
+    "bucket_sort",
+    "comb_sort",
+    "cocktail_sort",
+    "gnome_sort",
     "time_sort",
     "compare_algorithms",
+    "COUNTING_MAX_RANGE",
 ]
@@ -0,0 +1,138 @@
+"""Streaming, buffered line I/O for the command line tools.
+
+Input is read lazily, in blocks of lines through a buffer of
+configurable size, and each block is converted in bulk as it is read, so
+no list of all raw lines is built. Output is formatted in batches: each batch of values
+is joined into one string and written with a single call to a buffered
+stream, instead of one ``print`` per value.
+"""
+from __future__ import annotations
+
+import io
+import sys
+from contextlib import contextmanager
+from functools import partial
+from itertools import chain, islice
+from typing import IO, Iterable, Iterator, List, Optional
+
+from .parsing import PARSE_TYPES, auto_kind, convert_lines
+
+# Default read/write buffer size in bytes.
+DEFAULT_BUFFER_SIZE = 1 << 20
+# Values formatted and written per write call.
+WRITE_BATCH = 1 << 14
+
+
+def iter_lines(
+    path: Optional[str], buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> Iterator[str]:
+    """Yield the lines of ``path`` (stdin for ``None`` or ``"-"``) without
+    their trailing newline."""
+    if path and path != "-":
+        with open(path, "r", encoding="utf-8", buffering=buffer_size) as fh:
+            for line in fh:
+                yield line.rstrip("\n")
+    else:
+        for line in sys.stdin:
+            yield line.rstrip("\n")
+
+
+def iter_line_blocks(
+    path: Optional[str], buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> Iterator[List[str]]:
+    """Yield the lines of ``path`` (stdin for ``None`` or ``"-"``) in
+    lists of about ``buffer_size`` bytes, trailing newlines included."""
+    if path and path != "-":
+        with open(path, "r", encoding="utf-8", buffering=buffer_size) as fh:
+            yield from iter(partial(fh.readlines, buffer_size), [])
+    else:
+        yield from iter(partial(sys.stdin.readlines, buffer_size), [])
+
+
+def iter_value_blocks(
+    path: Optional[str], kind: str = "auto", buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> Iterator[List]:
+    """Yield lists of the values of ``path`` parsed as ``kind`` (see
+    :mod:`sort_it_out.parsing`), one converted block of lines at a time.
+
+    In ``auto`` mode the type is detected for every block from a sample,
+    so the values do not depend on what came before, and a block that
+    does not convert is parsed value by value.
+    """
+    if kind not in PARSE_TYPES:
+        raise ValueError(f"kind must be one of {', '.join(PARSE_TYPES)}")
+    for block in iter_line_blocks(path, buffer_size):
+        if kind == "auto":
+            yield convert_lines(block, auto_kind(block), fallback=True)
+        else:
+            yield convert_lines(block, kind)
+
+
+def iter_values(
+    path: Optional[str], kind: str = "auto", buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> Iterator:
+    """Yield the values of ``path`` one by one; see :func:`iter_value_blocks`."""
+    return chain.from_iterable(iter_value_blocks(path, kind, buffer_size))
+
+
+@contextmanager
+def open_output(path: Optional[str], buffer_size: int = DEFAULT_BUFFER_SIZE):
+    """Open a buffered binary stream to ``path``, or to stdout when
+    ``path`` is ``None``. Streams without a file descriptor (e.g. a
+    replaced ``sys.stdout``) are used as they are."""
+    if path:
+        with open(path, "wb", buffering=buffer_size) as fh:
+            yield fh
+        return
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        yield sys.stdout
+        return
+    sys.stdout.flush()
+    with open(fd, "wb", buffering=buffer_size, closefd=False) as fh:
+        yield fh
+
+
+def write_values(values: Iterable, stream: IO, batch: int = WRITE_BATCH) -> int:
+    """Write ``values`` one per line to the text or binary ``stream`` in
+    batches of ``batch`` values and return how many were written."""
+    binary = not isinstance(stream, io.TextIOBase)
+    it = iter(values)
+    written = 0
+    while True:
+        chunk = list(islice(it, batch))
+        if not chunk:
+            return written
+        text = "\n".join(map(str, chunk)) + "\n"
+        stream.write(text.encode("utf-8") if binary else text)
+        written += len(chunk)
+
+
+def write_histogram(pairs: Iterable, stream: IO, batch: int = WRITE_BATCH) -> int:
+    """Write each value of the ``(value, count)`` pairs ``count`` times,
+    one per line, formatting every distinct value once, and return how
+    many lines were written."""
+    binary = not isinstance(stream, io.TextIOBase)
+    written = 0
+    for value, count in pairs:
+        line = f"{value}\n"
+        if binary:
+            line = line.encode("utf-8")
+        written += count
+        while count:
+            step = min(count, batch)
+            stream.write(line * step)
+            count -= step
+    return written
+
+
+__all__ = [
+    "DEFAULT_BUFFER_SIZE",
+    "WRITE_BATCH",
+    "iter_lines",
+    "iter_values",
+    "open_output",
+    "write_values",
+    "write_histogram",
+]
@@ -0,0 +1,77 @@
+from array import array
+
+import pytest
+
+from scripts.gen_data import generate_data
+from sort_it_out import auto, auto_sort, choose_algorithm, cli, merge_sort
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (list(range(100)), "Sorted"),
+        (list(range(100, 0, -1)), "Reversed"),
+        ([3, 1, 2], "Insertion"),
+        (list(range(500)) + [0] + list(range(500, 1000)), "Merge"),
+        (generate_data(count=1000, lo=0, hi=50), "Counting"),
+        (generate_data(count=1000, lo=-(10**8), hi=10**8), "Radix"),
+        (generate_data(count=1000, lo=0, hi=2**60), "Bucket"),
+        ([x / 3 for x in generate_data(count=1000, lo=0, hi=10**6)], "Bucket"),
+        ([str(x) for x in generate_data(count=1000)], "Quick"),
+        (generate_data(count=1000, lo=0, hi=2**60) + [10**400], "Quick"),
+        ([x / 3 for x in generate_data(count=1000)] + [float("inf")], "Merge"),
+    ],
+)
+def test_choice_matches_data_shape(data, expected):
+    choice = choose_algorithm(data)
+    assert choice.algorithm == expected and choice.reason
+    assert auto_sort(data) == merge_sort(data)
+
+
+def test_reverse_and_key_affect_profile():
+    asc = list(range(100))
+    assert choose_algorithm(asc, reverse=True).algorithm == "Reversed"
+    assert choose_algorithm(asc, key=lambda x: -x).algorithm == "Reversed"
+    # Equal keys are not strictly descending: reversing would break stability.
+    assert choose_algorithm([2, 2, 1] * 20, key=lambda x: 0).algorithm == "Sorted"
+
+
+@pytest.mark.parametrize("engine", sorted(auto.ENGINES))
+def test_key_and_reverse_through_every_engine(engine, monkeypatch):
+    data = [(x % 7, i) for i, x in enumerate(generate_data(count=300, lo=0, hi=99))]
+    monkeypatch.setattr(auto, "_decide", lambda p: auto.AutoChoice(engine, "forced", p))
+    for reverse in (False, True):
+        expected = merge_sort(data, key=lambda r: r[0], reverse=reverse)
+        assert auto_sort(data, key=lambda r: r[0], reverse=reverse) == expected
+
+
+def test_report_and_inplace():
+    seen = []
+    values = array("q", range(50, 0, -1))
+    assert auto_sort(values, inplace=True, report=seen.append) is None
+    assert list(values) == list(range(1, 51))
+    assert seen[0].algorithm == "Reversed" and seen[0].profile.n == 50
+    view = memoryview(bytearray(range(40, 0, -1)))
+    auto_sort(view, inplace=True)
+    assert list(view) == list(range(1, 41))
+
+
+def test_cli_auto_explain(tmp_path, capsys):
+    src = tmp_path / "in.txt"
+    src.write_text("\n".join(str(x) for x in generate_data(count=200, lo=0, hi=9)))
+    assert cli.main(["-i", str(src), "-s", "auto", "--explain"]) == 0
+    captured = capsys.readouterr()
+    assert "Auto chose Counting" in captured.err
+    assert [int(x) for x in captured.out.split()] == sorted(
+        int(x) for x in src.read_text().split()
+    )
+    argv = ["-i", str(src), "-s", "auto", "--explain", "--workers", "2"]
+    assert cli.main(argv) == 2
+    assert "--explain is not supported with --workers" in capsys.readouterr().out
+
+
+def test_nan_is_not_sent_to_bucket_sort():
+    data = [x / 3 for x in generate_data(count=1000)] + [float("nan")]
+    choice = choose_algorithm(data)
+    assert choice.algorithm == "Merge" and not choice.profile.finite
+    assert len(auto_sort(data)) == len(data)
@@ -0,0 +1,51 @@
+import pytest
+
+from scripts.gen_data import generate_data
+from sort_it_out import cli
+
+
+@pytest.fixture
+def small_ints(tmp_path):
+    src = tmp_path / "in.txt"
+    src.write_text("\n".join(str(x) for x in generate_data(count=200, lo=0, hi=9)))
+    return src
+
+
+def test_explain_with_external(small_ints, capsys):
+    argv = ["-i", str(small_ints), "-s", "auto", "--explain", "--external"]
+    assert cli.main(argv) == 0
+    captured = capsys.readouterr()
+    assert "Auto chose Counting" in captured.err
+    assert [int(x) for x in captured.out.split()] == sorted(
+        int(x) for x in small_ints.read_text().split()
+    )
+
+
+@pytest.mark.parametrize(
+    "mode, flag",
+    [
+        (["--top", "3"], "--top"),
+        (["--bottom", "3"], "--bottom"),
+        (["--quantiles", "0.5"], "--quantiles"),
+        (["--stream-counting"], "--stream-counting"),
+    ],
+)
+def test_explain_rejected_where_no_algorithm_runs(small_ints, capsys, mode, flag):
+    argv = ["-i", str(small_ints), "-s", "auto", "--explain"] + mode
+    assert cli.main(argv) == 2
+    assert f"--explain is not supported with {flag}" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "mode, flag",
+    [
+        (["--top", "3"], "--top"),
+        (["--bottom", "3"], "--bottom"),
+        (["--quantiles", "0.5"], "--quantiles"),
+        (["--stream-counting"], "--stream-counting"),
+    ],
+)
+def test_numpy_backend_rejected_by_selection_modes(small_ints, capsys, mode, flag):
+    argv = ["-i", str(small_ints), "-s", "radix", "--backend", "numpy"] + mode
+    assert cli.main(argv) == 2
+    assert f"--backend is not supported with {flag}" in capsys.readouterr().out
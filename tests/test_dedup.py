@@ -0,0 +1,43 @@
+import random
+
+from sort_it_out import cli, dedup, sort_counts, sort_unique
+from sort_it_out.algorithms import ALGORITHMS
+
+
+def test_sort_counts_with_every_algorithm():
+    data = [random.randint(0, 30) for _ in range(500)]
+    expected = sorted((v, data.count(v)) for v in set(data))
+    for name, alg in ALGORITHMS.items():
+        assert sort_counts(iter(data), alg) == expected, name
+    assert sort_unique(data, reverse=True) == sorted(set(data), reverse=True)
+    assert sort_counts([]) == []
+
+
+def test_only_distinct_values_are_sorted():
+    seen = []
+
+    def spy(items, reverse=False):
+        seen.append(list(items))
+        return ALGORITHMS["Counting"](items, reverse=reverse)
+
+    assert sort_counts([3, 1, 3, 3, 2, 1], spy) == [(1, 2), (2, 1), (3, 3)]
+    assert sorted(seen[0]) == [1, 2, 3]
+
+
+def test_unhashable_values_collapse_runs(monkeypatch):
+    monkeypatch.setattr(dedup, "_BLOCK", 2)
+    data = [[2], [1], [2], [3], [1], [2]]
+    assert sort_counts(data) == [([1], 2), ([2], 3), ([3], 1)]
+    assert sort_unique(data, reverse=True) == [[3], [2], [1]]
+
+
+def test_cli_unique_and_count(tmp_path, capsys):
+    src = tmp_path / "in.txt"
+    src.write_text("b\na\nb\nc\nb\n")
+    assert cli.main(["-i", str(src), "--unique"]) == 0
+    assert capsys.readouterr().out == "a\nb\nc\n"
+    assert cli.main(["-i", str(src), "--count", "-s", "radix"]) == 3
+    capsys.readouterr()
+    assert cli.main(["-i", str(src), "--count", "-s", "quick"]) == 0
+    assert capsys.readouterr().out == "1 a\n3 b\n1 c\n"
+    assert cli.main(["-i", str(src), "--count", "--external"]) == 2
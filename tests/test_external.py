@@ -0,0 +1,96 @@
+import io
+
+import pytest
+
+from scripts.gen_data import generate_data
+from sort_it_out import cli, external, merge_sort, quick_sort
+
+
+def test_parse_memory_limit():
+    assert external.parse_memory_limit("2G") == 2 << 30
+    assert external.parse_memory_limit("512m") == 512 << 20
+    assert external.parse_memory_limit("64KB") == 64 << 10
+    assert external.parse_memory_limit("1000") == 1000
+    for bad in ("", "lots", "0", "5X"):
+        with pytest.raises(ValueError):
+            external.parse_memory_limit(bad)
+
+
+def test_kway_merge_is_stable():
+    runs = [[(1, "a"), (3, "a")], [(1, "b"), (2, "b")], [], [(1, "c")]]
+    merged = list(external.kway_merge(runs, key=lambda r: r[0]))
+    assert merged == [(1, "a"), (1, "b"), (1, "c"), (2, "b"), (3, "a")]
+    desc = [[(3, "a"), (1, "a")], [(3, "b"), (1, "b")]]
+    merged = list(external.kway_merge(desc, key=lambda r: r[0], reverse=True))
+    assert merged == [(3, "a"), (3, "b"), (1, "a"), (1, "b")]
+
+
+@pytest.mark.parametrize("fan_in", [2, 3, 64])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_external_sort_spills_and_merges(fan_in, reverse, tmp_path):
+    values = generate_data(count=5000, lo=-1000, hi=1000)
+    out = io.StringIO()
+    written = external.external_sort(
+        iter(values),
+        out,
+        quick_sort,
+        memory_limit=4096,
+        parse=int,
+        reverse=reverse,
+        fan_in=fan_in,
+        tmp_dir=str(tmp_path),
+    )
+    assert written == len(values)
+    assert [int(x) for x in out.getvalue().split()] == merge_sort(
+        values, reverse=reverse
+    )
+    # Runs and intermediate passes are cleaned up.
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_external_sort_small_input_is_not_spilled(tmp_path):
+    out = io.StringIO()
+    external.external_sort(["b", "", "a"], out, tmp_dir=str(tmp_path))
+    assert out.getvalue() == "\na\nb\n"
+    assert external.external_sort([], out) == 0
+
+
+def test_cli_external(tmp_path):
+    words = [f"w{x}" for x in generate_data(count=3000, lo=0, hi=10**6)]
+    src = tmp_path / "in.txt"
+    src.write_text("\n".join(words) + "\n")
+    dst = tmp_path / "out.txt"
+    argv = ["-i", str(src), "-o", str(dst), "--external", "--memory-limit", "16K"]
+    assert cli.main(argv) == 0
+    assert dst.read_text().splitlines() == merge_sort(words)
+    assert cli.main(argv + ["--time"]) == 2
+    assert cli.main(argv[:-1] + ["huge"]) == 2
+
+
+def test_check_sorted_reports_first_disorder():
+    assert list(external.check_sorted([1, 2, 2, 5])) == [1, 2, 2, 5]
+    assert list(external.check_sorted([3, 1], reverse=True)) == [3, 1]
+    with pytest.raises(ValueError, match="shard.txt is not sorted at item 3"):
+        list(external.check_sorted([1, 4, 2], "shard.txt"))
+
+
+def test_cli_merge_subcommand(tmp_path, capsys):
+    shards = []
+    for i, values in enumerate([[1, 4, 9], [2, 3, 10], [], [0, 4]]):
+        path = tmp_path / f"s{i}.txt"
+        path.write_text("".join(f"{v}\n" for v in values))
+        shards.append(str(path))
+    assert cli.main(["merge", *shards, "--check"]) == 0
+    assert capsys.readouterr().out.split() == [
+        str(v) for v in [0, 1, 2, 3, 4, 4, 9, 10]
+    ]
+    dst = tmp_path / "out.txt"
+    assert cli.main(["merge", *shards, "-o", str(dst), "--read-buffer", "1K"]) == 0
+    assert dst.read_text().split()[-1] == "10"
+
+    bad = tmp_path / "bad.txt"
+    bad.write_text("5\n1\n")
+    assert cli.main(["merge", shards[0], str(bad)]) == 0
+    capsys.readouterr()
+    assert cli.main(["merge", shards[0], str(bad), "--check"]) == 3
+    assert "bad.txt is not sorted" in capsys.readouterr().out
@@ -0,0 +1,92 @@
+import random
+import sys
+from array import array
+
+import pytest
+
+from sort_it_out import cli, formats
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+def test_format_for_path():
+    assert formats.format_for_path("data.I64") == "int64"
+    assert formats.format_for_path("a.f64") == "float64"
+    assert formats.format_for_path("a.npy") == "npy"
+    assert formats.format_for_path("a.txt") == "text"
+    assert formats.format_for_path(None) == "text"
+
+
+@pytest.mark.parametrize("fmt", ["int32", "int64", "float64", "npy"])
+def test_round_trip(tmp_path, fmt):
+    values = [random.randint(-1000, 1000) for _ in range(100)]
+    if fmt == "float64":
+        values = [v / 8 for v in values]
+    path = str(tmp_path / "data.bin")
+    formats.save_values(values, path, fmt)
+    view = formats.load_values(path, fmt)
+    assert view.tolist() == values
+    view[0] = 7
+    # Copy-on-write: changes to the view never reach the file.
+    assert formats.load_values(path, fmt)[0] == values[0]
+
+
+def test_empty_and_truncated_files(tmp_path):
+    empty = tmp_path / "e.i64"
+    empty.write_bytes(b"")
+    assert formats.load_values(str(empty), "int64").tolist() == []
+    bad = tmp_path / "b.i64"
+    bad.write_bytes(b"\x00" * 12)
+    with pytest.raises(ValueError):
+        formats.load_values(str(bad), "int64")
+    with pytest.raises(ValueError):
+        formats.load_values(str(bad), "text")
+
+
+@pytest.mark.skipif(np is None, reason="numpy not installed")
+def test_npy_compatible_with_numpy(tmp_path):
+    path = tmp_path / "a.npy"
+    np.save(path, np.arange(10, dtype="<i4")[::-1])
+    view = formats.load_values(str(path), "npy")
+    assert view.format == "i" and view.tolist() == list(range(9, -1, -1))
+    formats.save_values(view, str(path), "npy")
+    loaded = np.load(path)
+    assert loaded.dtype == np.dtype("<i4") and loaded.tolist() == view.tolist()
+    np.save(path, np.zeros((2, 2)))
+    with pytest.raises(ValueError):
+        formats.load_values(str(path), "npy")
+
+
+@pytest.mark.skipif(sys.byteorder != "little", reason="raw bytes are little-endian")
+def test_cli_sorts_binary_by_extension_and_format(tmp_path):
+    values = [random.randint(-(1 << 40), 1 << 40) for _ in range(500)]
+    src = tmp_path / "in.i64"
+    src.write_bytes(array("q", values).tobytes())
+    dst = tmp_path / "out.i64"
+    assert cli.main(["-i", str(src), "-s", "radix", "-o", str(dst)]) == 0
+    assert array("q", dst.read_bytes()).tolist() == sorted(values)
+    assert array("q", src.read_bytes()).tolist() == values
+
+    raw = tmp_path / "in.bin"
+    raw.write_bytes(src.read_bytes())
+    txt = tmp_path / "out.txt"
+    args = ["-i", str(raw), "--format", "int64", "-s", "heap", "-o", str(txt)]
+    assert cli.main(args) == 0
+    # --format applies to the output too.
+    assert array("q", txt.read_bytes()).tolist() == sorted(values)
+
+    assert cli.main(["-i", str(src), "-o", str(txt)]) == 0
+    assert txt.read_text().split() == [str(v) for v in sorted(values)]
+    assert cli.main(["-i", str(src), "--external"]) == 2
+
+
+def test_save_over_mapped_source(tmp_path):
+    path = str(tmp_path / "data.i32")
+    formats.save_values([3, 1, 2], path, "int32")
+    view = formats.load_values(path, "int32")
+    view[:] = array("i", sorted(view))
+    formats.save_values(view, path, "int32")
+    assert formats.load_values(path, "int32").tolist() == [1, 2, 3]
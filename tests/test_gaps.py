@@ -0,0 +1,33 @@
+import pytest
+
+from scripts.gen_data import generate_data
+from sort_it_out import comb_sort, shell_sort
+from sort_it_out.gaps import GAP_SEQUENCES, gap_sequence
+
+
+def test_known_sequence_prefixes():
+    assert gap_sequence("ciura", 1000) == (701, 301, 132, 57, 23, 10, 4, 1)
+    assert gap_sequence("tokuda", 300) == (233, 103, 46, 20, 9, 4, 1)
+    assert gap_sequence("sedgewick", 300) == (281, 77, 23, 8, 1)
+    assert gap_sequence("pratt", 10) == (9, 8, 6, 4, 3, 2, 1)
+    assert gap_sequence("knuth", 200) == (40, 13, 4, 1)
+    assert gap_sequence("shell", 16) == (8, 4, 2, 1)
+
+
+def test_ciura_is_extended_beyond_table():
+    gaps = gap_sequence("ciura", 100_000)
+    assert gaps[-9:] == (1750, 701, 301, 132, 57, 23, 10, 4, 1)
+    assert gaps[0] < 100_000 and len(gaps) > 9
+
+
+def test_custom_and_unknown_sequences():
+    assert gap_sequence([7, 3], 5) == (3, 1)
+    with pytest.raises(ValueError):
+        gap_sequence("fibonacci", 10)
+
+
+@pytest.mark.parametrize("name", sorted(GAP_SEQUENCES))
+def test_shell_and_comb_sort_with_each_sequence(name):
+    data = generate_data(count=300, lo=-500, hi=500)
+    assert shell_sort(data, gaps=name) == sorted(data)
+    assert comb_sort(data, gaps=name) == sorted(data)
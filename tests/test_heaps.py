@@ -0,0 +1,40 @@
+from scripts.gen_data import generate_data
+from sort_it_out import heaps
+
+
+def _is_max_heap(arr, lo, end):
+    size = end - lo
+    return all(
+        not arr[lo + i] < arr[lo + c]
+        for i in range(size)
+        for c in (2 * i + 1, 2 * i + 2)
+        if c < size
+    )
+
+
+def test_heapify_builds_max_heap_in_subrange():
+    data = generate_data(count=101, lo=-50, hi=50)
+    arr = list(data)
+    heaps.heapify(arr, 10, 90)
+    assert _is_max_heap(arr, 10, 90)
+    assert arr[:10] == data[:10] and arr[90:] == data[90:]
+
+
+def test_heap_sort_range_only_touches_range():
+    data = generate_data(count=300, lo=0, hi=1000)
+    arr = list(data)
+    heaps.heap_sort_range(arr, 50, 250)
+    assert arr[50:250] == sorted(data[50:250])
+    assert arr[:50] == data[:50] and arr[250:] == data[250:]
+
+
+def test_min_heap_priority_queue():
+    data = generate_data(count=200, lo=-50, hi=50)
+    heap = list(data[:50])
+    heaps.min_heapify(heap)
+    for x in data[50:]:
+        heaps.min_heap_push(heap, x)
+    assert heaps.min_heap_replace(heap, 1000) == min(data)
+    out = [heaps.min_heap_pop(heap) for _ in range(len(heap))]
+    assert out == sorted(data)[1:] + [1000]
+    assert heap == []
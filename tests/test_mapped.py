@@ -0,0 +1,53 @@
+import random
+from array import array
+
+import pytest
+
+from sort_it_out import cli, formats, mapped
+
+
+@pytest.mark.parametrize("algorithm", ["Heap", "quick", "Radix", "shell"])
+def test_sort_mapped_file_in_place(tmp_path, monkeypatch, algorithm):
+    monkeypatch.setattr(mapped, "BLOCK", 7)
+    values = [random.randint(-(1 << 40), 1 << 40) for _ in range(300)]
+    path = tmp_path / "data.i64"
+    path.write_bytes(array("q", values).tobytes())
+    assert mapped.sort_mapped_file(str(path), algorithm) == 300
+    assert array("q", path.read_bytes()).tolist() == sorted(values)
+
+
+def test_sort_mapped_npy_and_options(tmp_path):
+    values = [random.random() for _ in range(100)]
+    path = str(tmp_path / "data.npy")
+    formats.save_values(values, path, "npy")
+    mapped.sort_mapped_file(path, "Shell", gaps="knuth")
+    assert formats.load_values(path, "npy").tolist() == sorted(values)
+    with pytest.raises(TypeError):
+        mapped.sort_mapped_file(path, "Radix")
+    raw = tmp_path / "data.bin"
+    raw.write_bytes(array("i", [3, -1, 2]).tobytes())
+    mapped.sort_mapped_file(str(raw), "Radix", fmt="int32", bits=1)
+    assert array("i", raw.read_bytes()).tolist() == [-1, 2, 3]
+
+
+def test_sort_mapped_rejects_bad_input(tmp_path):
+    empty = tmp_path / "e.i32"
+    empty.write_bytes(b"")
+    assert mapped.sort_mapped_file(str(empty), "Radix") == 0
+    with pytest.raises(ValueError):
+        mapped.sort_mapped_file(str(empty), "Merge")
+    text = tmp_path / "a.txt"
+    text.write_text("1\n")
+    with pytest.raises(ValueError):
+        mapped.sort_mapped_file(str(text))
+
+
+def test_cli_inplace_mmap(tmp_path, capsys):
+    values = list(range(50, 0, -1))
+    path = tmp_path / "data.i32"
+    path.write_bytes(array("i", values).tobytes())
+    assert cli.main(["--inplace-mmap", str(path), "-s", "radix", "--time"]) == 0
+    assert "50 values sorted in place" in capsys.readouterr().out
+    assert array("i", path.read_bytes()).tolist() == sorted(values)
+    assert cli.main(["--inplace-mmap", str(path), "-s", "merge"]) == 2
+    assert cli.main(["--inplace-mmap", str(path), "-o", "x.i32"]) == 2
@@ -0,0 +1,127 @@
+from array import array
+
+import pytest
+
+from scripts.gen_data import generate_data
+from sort_it_out import cli, sorts
+from sort_it_out.algorithms import ALGORITHMS, NUMPY_ALGORITHMS
+
+np = pytest.importorskip("numpy")
+
+NUMPY_NAMES = ["Counting", "Radix", "Bucket", "Merge", "Quick"]
+
+INT_CASES = [
+    [],
+    [7],
+    [3, 3, 3, 3],
+    list(range(500, 0, -1)),
+    generate_data(count=3000, lo=-1000, hi=1000),
+    generate_data(count=2000, lo=0, hi=10),
+    generate_data(count=2000, lo=-(2**62), hi=2**62),
+    [0] * 300 + [10**9],
+]
+
+
+def test_registry_entries_bound_to_numpy():
+    assert sorted(NUMPY_ALGORITHMS) == sorted(NUMPY_NAMES)
+    assert NUMPY_ALGORITHMS["Radix"]([3, -1, 2]) == [-1, 2, 3]
+
+
+@pytest.mark.parametrize("name", NUMPY_NAMES)
+@pytest.mark.parametrize("data", INT_CASES)
+def test_integer_results_match_python_backend(name, data):
+    alg = ALGORITHMS[name]
+    assert alg(data, backend="numpy") == alg(data)
+    assert alg(data, reverse=True, backend="numpy") == alg(data, reverse=True)
+
+
+@pytest.mark.parametrize("name", ["Radix", "Bucket", "Merge", "Quick"])
+def test_float_results_match_python_backend(name):
+    data = [x / 7 for x in generate_data(count=2500, lo=-5000, hi=5000)]
+    data += [0.0, -0.5, 1e300, -1e300]
+    assert ALGORITHMS[name](data, backend="numpy") == ALGORITHMS["Merge"](data)
+
+
+@pytest.mark.parametrize("name", NUMPY_NAMES)
+def test_ndarray_in_ndarray_out(name):
+    values = np.array(generate_data(count=1000, lo=-50, hi=50), np.int32)
+    res = ALGORITHMS[name](values, backend="numpy")
+    assert isinstance(res, np.ndarray) and res.dtype == np.int32
+    assert res.tolist() == sorts.merge_sort(values.tolist())
+
+
+@pytest.mark.parametrize("name", NUMPY_NAMES)
+def test_inplace_on_ndarray_list_and_array(name):
+    data = generate_data(count=700, lo=-100, hi=100)
+    expected = sorts.merge_sort(data)
+    for seq in (np.array(data), list(data), array("q", data)):
+        assert ALGORITHMS[name](seq, inplace=True, backend="numpy") is None
+        assert list(seq) == expected
+
+
+def test_bucket_sort_heavy_buckets():
+    data = [0] * 200 + list(range(100)) + [10**6] * 50 + [5.5] * 40
+    assert sorts.bucket_sort(data, backend="numpy") == sorts.bucket_sort(data)
+
+
+def test_quick_sort_structured_inputs():
+    for data in (
+        list(range(1000)) * 2,
+        list(range(2048)) + list(range(2048, 0, -1)),
+        [i * i for i in range(4096)],
+    ):
+        assert sorts.quick_sort(data, backend="numpy") == sorts.merge_sort(data)
+
+
+def test_backend_errors():
+    with pytest.raises(ValueError):
+        sorts.merge_sort([1], backend="fortran")
+    with pytest.raises(ValueError):
+        sorts.merge_sort([1], key=abs, backend="numpy")
+    with pytest.raises(TypeError):
+        sorts.radix_sort(["a", "b"], backend="numpy")
+    with pytest.raises(TypeError):
+        sorts.counting_sort([1.5, 2.0], backend="numpy")
+
+
+def test_cli_backend(tmp_path, capsys):
+    src = tmp_path / "in.txt"
+    src.write_text("3\n-1\n2\n")
+    assert cli.main(["-i", str(src), "-s", "radix", "--backend", "numpy"]) == 0
+    assert capsys.readouterr().out.split() == ["-1", "2", "3"]
+    assert cli.main(["-i", str(src), "-s", "heap", "--backend", "numpy"]) == 2
+
+
+@pytest.mark.parametrize("name", ["Radix", "Bucket", "Merge", "Quick"])
+def test_nan_and_inf_go_to_the_ends(name):
+    finite = [x / 3 for x in generate_data(count=1500, lo=-3000, hi=3000)]
+    data = finite + [float("nan")] * 4 + [float("inf"), float("-inf")]
+    data = [data[(i * 7919) % len(data)] for i in range(len(data))]
+    res = ALGORITHMS[name](data, backend="numpy")
+    assert len(res) == len(data)
+    assert res[:-4] == [float("-inf")] + sorted(finite) + [float("inf")]
+    assert all(np.isnan(res[-4:]))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [1_700_000_000_000_000_000 + (i * 7919) % 2001 for i in range(5000)],
+        [0.0, 5e-324] * 20,
+        [2**63 - 1, -(2**63), 0, 5] * 10,
+    ],
+    ids=["ns-timestamps", "subnormal-span", "int64-extremes"],
+)
+def test_bucket_sort_narrow_and_extreme_spans(data):
+    assert ALGORITHMS["Bucket"](data, backend="numpy") == sorted(data)
+
+
+@pytest.mark.parametrize("name", ["Radix", "Bucket", "Merge", "Quick"])
+def test_reverse_keeps_nans_last_like_python(name):
+    nan = float("nan")
+    data = [2.5, nan, -1.0, float("inf"), 0.0, nan, 7.0]
+    res = ALGORITHMS[name](data, reverse=True, backend="numpy")
+    # The pure-Python bucket sort is the one that defines a NaN order.
+    expected = sorts.bucket_sort(data, reverse=True)
+    assert res[:-2] == expected[:-2] == [float("inf"), 7.0, 2.5, 0.0, -1.0]
+    assert all(np.isnan(res[-2:])) and all(np.isnan(expected[-2:]))
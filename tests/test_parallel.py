@@ -0,0 +1,55 @@
+import pytest
+
+from scripts.gen_data import generate_data
+from sort_it_out import cli, merge_sort, parallel
+
+
+@pytest.fixture(autouse=True)
+def small_threshold(monkeypatch):
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_ITEMS", 100)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        generate_data(count=3000, lo=-(10**9), hi=10**9),
+        [x / 3 for x in generate_data(count=3000, lo=-1000, hi=1000)],
+        [str(x) for x in generate_data(count=2000)],
+        [7] * 1500 + [3] * 1500,
+        generate_data(count=500, lo=0, hi=2**70),
+    ],
+)
+@pytest.mark.parametrize("algorithm", ["Merge", "Quick"])
+def test_parallel_matches_serial(data, algorithm):
+    assert parallel.parallel_sort(data, algorithm, workers=3) == merge_sort(data)
+    assert parallel.parallel_sort(
+        data, algorithm, workers=2, reverse=True
+    ) == merge_sort(data, reverse=True)
+
+
+def test_parallel_key_is_stable_and_options_are_forwarded():
+    data = [(x % 10, i) for i, x in enumerate(generate_data(count=2000))]
+    for reverse in (False, True):
+        assert parallel.parallel_sort(
+            data, "Shell", workers=3, key=lambda r: r[0], reverse=reverse, gaps="knuth"
+        ) == merge_sort(data, key=lambda r: r[0], reverse=reverse)
+
+
+def test_parallel_inplace_and_errors():
+    data = generate_data(count=1000, lo=0, hi=100)
+    expected = merge_sort(data)
+    assert parallel.parallel_sort(data, "radix", workers=2, inplace=True) is None
+    assert data == expected
+    with pytest.raises(ValueError):
+        parallel.parallel_sort(data, "Bogo")
+    with pytest.raises(ValueError):
+        parallel.parallel_sort(data, workers=0)
+
+
+def test_cli_workers(tmp_path, capsys):
+    values = generate_data(count=500, lo=-50, hi=50)
+    src = tmp_path / "in.txt"
+    src.write_text("\n".join(map(str, values)))
+    assert cli.main(["-i", str(src), "-s", "heap", "--workers", "2"]) == 0
+    assert [int(x) for x in capsys.readouterr().out.split()] == merge_sort(values)
+    assert cli.main(["-i", str(src), "--workers", "-1"]) == 2
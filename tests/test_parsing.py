@@ -0,0 +1,66 @@
+import pytest
+
+from sort_it_out import cli, parsing
+
+
+def test_parse_value_matches_legacy_rules():
+    assert parsing.parse_value(" 42 ") == 42
+    assert parsing.parse_value("4.5\n") == 4.5
+    assert parsing.parse_value(" abc ") == "abc"
+    assert parsing.parse_value("  ") == ""
+
+
+@pytest.mark.parametrize(
+    "lines, kind",
+    [
+        (["1\n", "-2\n", " 3 \n"], "int"),
+        (["1.5\n", "2e3\n"], "float"),
+        (["a\n", "b\n"], "str"),
+        (["1\n", "b\n"], "mixed"),
+        ([], "str"),
+    ],
+)
+def test_detect_type(lines, kind):
+    assert parsing.detect_type(lines) == kind
+
+
+def test_typed_modes_convert_in_bulk():
+    lines = ["3\n", "\n", "-1\n"]
+    assert parsing.parse_values(lines, "int") == [3, -1]
+    assert parsing.parse_values(lines, "float") == [3.0, -1.0]
+    assert parsing.parse_values(lines, "str") == ["3", "", "-1"]
+    with pytest.raises(ValueError):
+        parsing.parse_values(["1\n", "x\n"], "int")
+    with pytest.raises(ValueError):
+        parsing.parse_values(lines, "complex")
+
+
+def test_auto_falls_back_when_typed_path_fails():
+    lines = [f"{i}\n" for i in range(parsing.SAMPLE_LINES)] + ["x\n"]
+    values = parsing.parse_values(lines)
+    assert values[:3] == [0, 1, 2] and values[-1] == "x"
+    assert parsing.parse_values(["2", "1.5", "a"]) == [2, 1.5, "a"]
+
+
+def test_auto_floats_keep_integer_values():
+    lines = ["1.5\n"] * parsing.SAMPLE_LINES + ["7\n", "\n", "7.0\n", "1e3\n"]
+    values = parsing.parse_values(lines)
+    assert values[-3:] == [7, 7.0, 1000.0]
+    assert [type(v) for v in values[-3:]] == [int, float, float]
+
+
+def test_value_parser():
+    assert parsing.value_parser("int")("7") == 7
+    assert parsing.value_parser("str")(" a ") == "a"
+    assert parsing.value_parser("auto")("7.5") == 7.5
+
+
+def test_cli_type_option(tmp_path, capsys):
+    src = tmp_path / "in.txt"
+    src.write_text("10\n9\n100\n")
+    assert cli.main(["-i", str(src), "--type", "str"]) == 0
+    assert capsys.readouterr().out.split() == ["10", "100", "9"]
+    assert cli.main(["-i", str(src), "--type", "float"]) == 0
+    assert capsys.readouterr().out.split() == ["9.0", "10.0", "100.0"]
+    src.write_text("1\nx\n")
+    assert cli.main(["-i", str(src), "--type", "int"]) == 3
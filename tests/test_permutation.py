@@ -0,0 +1,53 @@
+from array import array
+
+import pytest
+
+from scripts.gen_data import generate_data
+from sort_it_out import apply_permutation, argsort, lexsort
+from sort_it_out.algorithms import ALGORITHMS, get_algorithm, resolve_algorithm
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("name", list(ALGORITHMS))
+def test_argsort_is_stable_for_every_algorithm(name, reverse):
+    data = generate_data(count=150, lo=-20, hi=20)
+    expected = sorted(range(len(data)), key=data.__getitem__, reverse=reverse)
+    assert argsort(data, name, reverse=reverse) == expected
+
+
+def test_argsort_key_and_options():
+    words = ["pear", "fig", "banana", "kiwi", "apple"]
+    assert argsort(words, "counting", key=len) == [1, 0, 3, 4, 2]
+    data = generate_data(count=300, lo=-(2**40), hi=2**40)
+    perm = argsort(data, "Radix", bits=4)
+    assert [data[i] for i in perm] == sorted(data)
+    assert argsort([], "Quick") == []
+
+
+def test_lexsort_orders_by_first_column_then_the_rest():
+    city = ["b", "a", "b", "a", "a"]
+    age = [30, 40, 20, 40, 10]
+    perm = lexsort([city, age])
+    assert perm == [4, 1, 3, 2, 0]
+    assert lexsort([city, age], reverse=[False, True]) == [1, 3, 4, 0, 2]
+    with pytest.raises(ValueError):
+        lexsort([city, age[:2]])
+
+
+def test_algorithm_lookup_by_name_or_function():
+    assert get_algorithm("Radix") is get_algorithm("radix") is ALGORITHMS["Radix"]
+    assert resolve_algorithm("merge") is resolve_algorithm(ALGORITHMS["Merge"])
+    with pytest.raises(ValueError, match="Available: Auto, Bubble"):
+        argsort([2, 1], "nope")
+
+
+def test_apply_permutation_reorders_columns_in_place():
+    ids = list(range(100, 200))
+    stamps = array("q", generate_data(count=100, lo=0, hi=50))
+    names = [f"n{i}" for i in range(100)]
+    expected = sorted(zip(stamps, ids, names), key=lambda r: r[0])
+    perm = argsort(stamps, "Bucket")
+    apply_permutation(perm, stamps, ids, names)
+    assert list(zip(stamps, ids, names)) == expected
+    with pytest.raises(ValueError):
+        apply_permutation([1, 1, 0], [1, 2, 3])
@@ -0,0 +1,73 @@
+import io
+
+import pytest
+
+from scripts.gen_data import generate_data
+from sort_it_out import cli, records
+
+
+def test_parse_key_columns():
+    assert records.parse_key_columns("3,1") == [(2, "auto"), (0, "auto")]
+    assert records.parse_key_columns("2:float, 1", "str") == [(1, "float"), (0, "str")]
+    for bad in ("0", "x", "1:date", ""):
+        with pytest.raises(ValueError):
+            records.parse_key_columns(bad)
+
+
+def test_sort_records_by_typed_columns():
+    lines = ["b,10,x", "a,9,y", "b,9,z", '"a,z",9,w', "c,2.5,v"]
+    keys = [(1, "auto"), (0, "str")]
+    assert records.sort_records(lines, keys) == [
+        "c,2.5,v",
+        "a,9,y",
+        '"a,z",9,w',
+        "b,9,z",
+        "b,10,x",
+    ]
+    by_name = records.sort_records(lines, [(0, "str")], algorithm="Quick")
+    assert [line[:2] for line in by_name] == ["a,", '"a', "b,", "b,", "c,"]
+    desc = records.sort_records(["1\tb", "2\ta"], [(1, "str")], "\t", reverse=True)
+    assert desc == ["1\tb", "2\ta"]
+    with pytest.raises(ValueError, match="record 2 has no column 2"):
+        records.sort_records(["a,1", "b"], [(1, "int")])
+    with pytest.raises(ValueError, match="record 1: column 1 is not a valid int"):
+        records.sort_records(["a,1"], [(0, "int")])
+
+
+def test_external_sort_records_matches_in_memory(tmp_path):
+    ids = generate_data(count=3000, lo=0, hi=50)
+    lines = [f"{i % 7};{x};row{i}" for i, x in enumerate(ids)]
+    keys = [(1, "int"), (0, "auto")]
+    out = io.StringIO()
+    written = records.external_sort_records(
+        iter(lines), out, keys, ";", "Counting", memory_limit=4096, tmp_dir=tmp_path
+    )
+    assert written == len(lines)
+    assert out.getvalue().splitlines() == records.sort_records(lines, keys, ";")
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("extra", [[], ["--external", "--memory-limit", "1K"]])
+def test_cli_key_column(tmp_path, capsys, extra):
+    src = tmp_path / "in.tsv"
+    rows = [f"n{i}\t{x}\t{i % 3}" for i, x in enumerate(generate_data(200, 0, 20))]
+    src.write_text("name\tscore\tgroup\n" + "\n".join(rows) + "\n")
+    argv = ["-i", str(src), "--key-column", "3:int,2", "--header", "-s", "radix"]
+    assert cli.main(argv + extra) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == "name\tscore\tgroup"
+    expected = sorted(
+        rows, key=lambda r: (int(r.split("\t")[2]), int(r.split("\t")[1]))
+    )
+    assert out[1:] == expected
+
+
+def test_cli_key_column_rejects_other_modes(tmp_path, capsys):
+    src = tmp_path / "in.csv"
+    src.write_text("b,1\na,2\n")
+    assert cli.main(["-i", str(src), "--delimiter", ","]) == 0
+    assert capsys.readouterr().out == "a,2\nb,1\n"
+    assert cli.main(["-i", str(src), "--key-column", "2", "--top", "1"]) == 2
+    assert cli.main(["-i", str(src), "--key-column", "2", "--time"]) == 2
+    assert cli.main(["-i", str(src), "--key-column", "0"]) == 2
+    assert cli.main(["-i", str(src), "--key-column", "3"]) == 3
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from sort_it_out import cli, selection
+from sort_it_out.selection import partial_sort
+
+
+@pytest.mark.parametrize("fraction", [0, 2])
+def test_partial_sort_heap_and_select_paths(monkeypatch, fraction):
+    # fraction 0 always quickselects; 2 always uses the bounded heap.
+    monkeypatch.setattr(selection, "_SELECT_FRACTION", fraction)
+    for n in (0, 1, 7, 100):
+        data = [random.randint(0, 20) for _ in range(n)]
+        for k in (1, 3, n // 2, n, n + 5):
+            assert partial_sort(data, k) == sorted(data)[:k]
+            assert partial_sort(data, k, largest=True) == sorted(data)[::-1][:k]
+
+
+@pytest.mark.parametrize("fraction", [0, 2])
+def test_partial_sort_key_is_stable(monkeypatch, fraction):
+    monkeypatch.setattr(selection, "_SELECT_FRACTION", fraction)
+    pairs = [(random.randint(0, 4), i) for i in range(200)]
+
+    def first(p):
+        return p[0]
+
+    assert partial_sort(pairs, 50, key=first) == sorted(pairs, key=first)[:50]
+    expected = sorted(pairs, key=first, reverse=True)[:50]
+    assert partial_sort(pairs, 50, largest=True, key=first) == expected
+
+
+def test_partial_sort_streams_iterators():
+    data = list(range(1000))
+    random.shuffle(data)
+    assert partial_sort(iter(data), 3, largest=True) == [999, 998, 997]
+    assert partial_sort(iter(data), 0) == []
+    with pytest.raises(ValueError):
+        partial_sort(data, -1)
+
+
+def test_cli_top_and_bottom(tmp_path, capsys):
+    src = tmp_path / "in.txt"
+    src.write_text("5\n1\n9\n3\n7\n")
+    assert cli.main(["-i", str(src), "--top", "2"]) == 0
+    assert capsys.readouterr().out == "9\n7\n"
+    assert cli.main(["-i", str(src), "--bottom", "3"]) == 0
+    assert capsys.readouterr().out == "1\n3\n5\n"
+    assert cli.main(["-i", str(src), "--top", "-1"]) == 2
+    assert cli.main(["-i", str(src), "--top", "1", "--external"]) == 2
+
+
+def test_select_matches_sorted():
+    data = [random.randint(0, 50) for _ in range(300)]
+    expected = sorted(data)
+    for k in (0, 1, 150, 299, -1, -300):
+        assert selection.select(data, k) == expected[k]
+    with pytest.raises(IndexError):
+        selection.select(data, 300)
+    pairs = [(random.randint(0, 3), i) for i in range(100)]
+    assert (
+        selection.select(pairs, 40, key=lambda p: p[0])
+        == sorted(pairs, key=lambda p: p[0])[40]
+    )
+
+
+def test_median_of_medians_fallback_is_exact():
+    data = list(range(2000))
+    random.shuffle(data)
+    # Depth 0 selects with median-of-medians pivots only.
+    selection._quickselect(data, 0, len(data), 777, 0)
+    assert data[777] == 777
+    assert max(data[:777]) < 777 < min(data[778:])
+
+
+def test_quantiles_methods():
+    data = list(range(10, 0, -1))
+    assert selection.quantiles(data, [0, 0.5, 1]) == [1, 5.5, 10]
+    assert selection.quantiles(data, [0.5], "lower") == [5]
+    assert selection.quantiles(data, [0.5], "higher") == [6]
+    assert selection.quantiles(data, [0.5, 0.9], "nearest") == [5, 9]
+    assert selection.quantiles(["b", "a", "c"], [0.5], "lower") == ["b"]
+    with pytest.raises(ValueError):
+        selection.quantiles(data, [1.5])
+    with pytest.raises(ValueError):
+        selection.quantiles([], [0.5])
+
+
+def test_cli_quantiles(tmp_path, capsys):
+    src = tmp_path / "in.txt"
+    src.write_text("".join(f"{x}\n" for x in range(101)))
+    assert cli.main(["-i", str(src), "--quantiles", "0.5,0.99"]) == 0
+    assert capsys.readouterr().out == "0.5: 50\n0.99: 99\n"
+    assert cli.main(["-i", str(src), "--quantiles", "95"]) == 2
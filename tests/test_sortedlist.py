@@ -0,0 +1,82 @@
+import bisect
+import random
+
+import pytest
+
+from sort_it_out import SortedList
+
+
+@pytest.mark.parametrize("load", [4, 7, 50])
+def test_matches_sorted_list(load):
+    sl = SortedList(load=load)
+    ref = []
+    for step in range(1500):
+        op = random.random()
+        if op < 0.5:
+            v = random.randint(0, 100)
+            sl.add(v)
+            bisect.insort(ref, v)
+        elif op < 0.55:
+            batch = [random.randint(0, 100) for _ in range(random.choice([1, 40]))]
+            sl.update(batch)
+            ref = sorted(ref + batch)
+        elif op < 0.8:
+            v = random.randint(0, 100)
+            assert sl.discard(v) == (v in ref)
+            if v in ref:
+                ref.remove(v)
+        elif ref:
+            i = random.randrange(-len(ref), len(ref))
+            assert sl.pop(i) == ref.pop(i)
+        assert len(sl) == len(ref)
+        if step % 25 == 0:
+            assert list(sl) == ref
+            assert list(reversed(sl)) == ref[::-1]
+            assert [sl[i] for i in range(len(ref))] == ref
+            assert sl[3:40] == ref[3:40] and sl[::3] == ref[::3]
+            v = random.randint(0, 100)
+            assert sl.bisect_left(v) == bisect.bisect_left(ref, v)
+            assert sl.bisect_right(v) == bisect.bisect_right(ref, v)
+            assert sl.count(v) == ref.count(v) and (v in sl) == (v in ref)
+            lo, hi = sorted(random.randint(0, 100) for _ in range(2))
+            assert list(sl.irange(lo, hi)) == [x for x in ref if lo <= x <= hi]
+            assert list(sl.irange(lo, hi, (False, False))) == [
+                x for x in ref if lo < x < hi
+            ]
+
+
+def test_equal_values_keep_insertion_order():
+    pairs = [(random.randint(0, 3), i) for i in range(300)]
+
+    class Item:
+        def __init__(self, pair):
+            self.pair = pair
+
+        def __lt__(self, other):
+            return self.pair[0] < other.pair[0]
+
+        def __eq__(self, other):
+            return self.pair[0] == other.pair[0]
+
+    sl = SortedList(load=4)
+    for p in pairs[:100]:
+        sl.add(Item(p))
+    sl.update(Item(p) for p in pairs[100:])
+    assert [x.pair for x in sl] == sorted(pairs, key=lambda p: p[0])
+
+
+def test_errors_and_repr():
+    sl = SortedList([3, 1, 2])
+    assert repr(sl) == "SortedList([1, 2, 3])"
+    assert sl.index(2) == 1
+    with pytest.raises(ValueError):
+        sl.remove(5)
+    with pytest.raises(ValueError):
+        sl.index(5)
+    with pytest.raises(IndexError):
+        sl[3]
+    sl.clear()
+    with pytest.raises(IndexError):
+        sl.pop()
+    with pytest.raises(ValueError):
+        SortedList(load=2)
@@ -1,19 +1,24 @@
+from array import array
+
 import pytest
 
 from scripts.gen_data import generate_data
-from sort_it_out import time_sort
+from sort_it_out import (
+    bucket_sort,
+    counting_histogram,
+    counting_sort,
+    merge_sort,
+    quick_sort,
+    radix_sort,
+    sorts,
+    time_sort,
+)
 from sort_it_out.algorithms import ALGORITHMS
 
 
 @pytest.mark.parametrize("name,alg", list(ALGORITHMS.items()))
 def test_algorithms_sort_correctly(name, alg):
-    # Bucket sort implementation expects floats in [0, 1). Provide
-    # appropriate input for that case; otherwise use integer data.
-    if name.lower().startswith("bucket"):
-        ints = generate_data(count=200, lo=0, hi=999)
-        data = [x / 1000.0 for x in ints]
-    else:
-        data = generate_data(count=200, lo=-1000, hi=1000)
+    data = generate_data(count=200, lo=-1000, hi=1000)
 
     expected = sorted(data)
     data_copy = list(data)
@@ -30,3 +35,208 @@ def test_time_sort_returns_float():
     t = time_sort(merge, data, repeat=2)
     assert isinstance(t, float)
     assert t >= 0.0
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        list(range(5000)),
+        list(range(5000, 0, -1)),
+        [7] * 3000,
+        [i % 3 for i in range(3000)],
+        list(range(2500)) + list(range(2500, 0, -1)),
+    ],
+    ids=["sorted", "reversed", "constant", "few-unique", "organ-pipe"],
+)
+def test_quick_sort_adversarial_inputs(data):
+    assert quick_sort(data) == sorted(data)
+
+
+def test_quick_sort_falls_back_to_heap_sort(monkeypatch):
+    calls = []
+    original = sorts.heap_sort_range
+
+    def spy(arr, lo, hi):
+        calls.append((lo, hi))
+        original(arr, lo, hi)
+
+    monkeypatch.setattr(sorts, "heap_sort_range", spy)
+    data = generate_data(count=500, lo=0, hi=10_000)
+    arr = list(data)
+    sorts._introsort(arr, 0, len(arr), 0)
+    assert arr == sorted(data)
+    assert calls == [(0, len(data))]
+
+
+class _Record:
+    """Orders only by ``key`` so tests can observe stability via ``tag``."""
+
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def test_merge_sort_is_stable():
+    data = [_Record(x % 10, i) for i, x in enumerate(generate_data(1000, 0, 99))]
+    result = merge_sort(data)
+    assert [(r.key, r.tag) for r in result] == sorted((r.key, r.tag) for r in data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        list(range(3000)),
+        list(range(3000, 0, -1)),
+        list(range(1000)) + list(range(500, 0, -1)) + list(range(2000)),
+        [3, 1] * 1500,
+    ],
+    ids=["sorted", "reversed", "runs", "alternating"],
+)
+def test_merge_sort_natural_runs(data):
+    assert merge_sort(data) == sorted(data)
+
+
+@pytest.mark.parametrize("bits", [1, 4, 8, 11, 16])
+def test_radix_sort_digit_widths(bits):
+    data = generate_data(count=300, lo=-(2**40), hi=2**40) + [0, -1, 1]
+    assert radix_sort(data, bits=bits) == sorted(data)
+
+
+def test_radix_sort_wide_signed_values():
+    data = [-(2**63), 2**63 - 1, -1, 0, 1, -(2**31), 2**31]
+    assert radix_sort(data) == sorted(data)
+
+
+def test_counting_sort_outlier_uses_sparse_histogram():
+    data = generate_data(count=500, lo=-20, hi=20) + [10**12, -(10**12)]
+    assert counting_sort(data) == sorted(data)
+
+
+def test_counting_sort_max_range_fallbacks():
+    data = [5, 1, 10**9, 1]
+    assert counting_sort(data, max_range=100, fallback="radix") == sorted(data)
+    with pytest.raises(ValueError):
+        counting_sort(data, max_range=100, fallback="error")
+
+
+def test_counting_histogram_pairs():
+    assert counting_histogram([3, -1, 3, 7, -1, 3]) == [(-1, 2), (3, 3), (7, 1)]
+    assert counting_histogram([]) == []
+
+
+def test_stream_counting_sort_reads_iterators():
+    data = generate_data(count=2000, lo=-5, hi=300)
+    assert list(sorts.stream_counting_sort(iter(data))) == sorted(data)
+    desc = sorts.stream_counting_histogram(iter([2, 9, 2]), reverse=True)
+    assert desc == [(9, 1), (2, 2)]
+    with pytest.raises(ValueError):
+        sorts.stream_counting_histogram(iter(range(100)), max_range=10)
+    with pytest.raises(TypeError):
+        list(sorts.stream_counting_sort(iter([1.5])))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [x / 1000.0 for x in generate_data(count=300, lo=0, hi=999)],
+        [x * 0.5 - 1e6 for x in generate_data(count=300, lo=0, hi=10**7)],
+        [2.0**i for i in range(200)] + [-1.5, 0, 3],
+        [1.0] * 100 + [0.5] * 100,
+        [float("inf"), 2.5, float("-inf"), -1, float("inf"), 0.5] * 20,
+        [10**400, -(10**400), 3, 10**309, 0] * 20,
+        [10**400, 2.5, -1, 0.5] * 20,
+        [1e308, -1e308, 0.0, 5e307] * 20,
+        [0.0, 5e-324],
+        [5e-324, 0.0, -5e-324] * 20,
+    ],
+    ids=[
+        "unit-floats",
+        "wide-floats",
+        "exponential",
+        "two-values",
+        "infinities",
+        "huge-ints",
+        "huge-ints-and-floats",
+        "float-extremes",
+        "subnormal-pair",
+        "subnormal-span",
+    ],
+)
+def test_bucket_sort_numeric_ranges(data):
+    assert bucket_sort(data) == sorted(data)
+    assert bucket_sort(data, reverse=True) == sorted(data, reverse=True)
+    assert bucket_sort(data, key=lambda x: x) == sorted(data)
+
+
+def test_bucket_sort_puts_nan_last():
+    nan = float("nan")
+    data = [3.0, nan, float("-inf"), 1.5, nan, float("inf")] * 10
+    res = bucket_sort(data)
+    assert res[:-20] == sorted(x for x in data if x == x)
+    assert all(x != x for x in res[-20:])
+    assert bucket_sort(data, key=lambda x: x)[-1] is nan
+
+
+def test_bucket_sort_rejects_strings():
+    with pytest.raises(TypeError):
+        bucket_sort(["b", "a"])
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("name,alg", list(ALGORITHMS.items()))
+def test_algorithms_key_and_reverse_are_stable(name, alg, reverse):
+    groups = generate_data(count=150, lo=-5, hi=5)
+    records = [(g, i) for i, g in enumerate(groups)]
+    calls = []
+
+    def key(rec):
+        calls.append(rec)
+        return rec[0]
+
+    result = alg(records, key=key, reverse=reverse)
+    assert result == sorted(records, key=lambda r: r[0], reverse=reverse)
+    assert len(calls) == len(records)
+
+
+@pytest.mark.parametrize("name,alg", list(ALGORITHMS.items()))
+def test_algorithms_reverse_without_key(name, alg):
+    data = generate_data(count=100, lo=-50, hi=50)
+    assert alg(data, reverse=True) == sorted(data, reverse=True)
+
+
+def _mutable_containers(values):
+    return {
+        "list": list(values),
+        "array": array("q", values),
+        "memoryview": memoryview(array("q", values)),
+    }
+
+
+@pytest.mark.parametrize("name,alg", list(ALGORITHMS.items()))
+def test_algorithms_sort_inplace(name, alg):
+    data = generate_data(count=120, lo=-1000, hi=1000)
+    for kind, container in _mutable_containers(data).items():
+        assert alg(container, inplace=True) is None, kind
+        assert list(container) == sorted(data), kind
+    raw = bytearray(generate_data(count=120, lo=0, hi=255))
+    expected = sorted(raw)
+    assert alg(raw, inplace=True) is None
+    assert list(raw) == expected
+
+
+def test_inplace_with_key_and_reverse():
+    data = generate_data(count=100, lo=-50, hi=50)
+    arr = array("q", data)
+    merge_sort(arr, key=abs, reverse=True, inplace=True)
+    assert list(arr) == sorted(data, key=abs, reverse=True)
+
+
+def test_time_sort_inplace_keeps_input_unsorted():
+    data = array("q", generate_data(count=100, lo=1, hi=100))
+    before = list(data)
+    t = time_sort(ALGORITHMS["Quick"], data, repeat=2, inplace=True)
+    assert t >= 0.0
+    assert list(data) == before
@@ -0,0 +1,81 @@
+import io
+
+from sort_it_out import cli, streams
+
+
+def test_iter_values_parses_block_by_block(tmp_path):
+    src = tmp_path / "in.txt"
+    src.write_text("".join(f"{x}\n" for x in range(100)) + "1.5\n")
+    blocks = list(streams.iter_value_blocks(str(src), buffer_size=64))
+    assert len(blocks) > 1
+    # Detected per block; the odd block falls back.
+    assert list(streams.iter_values(str(src), buffer_size=64)) == list(range(100)) + [
+        1.5
+    ]
+
+
+def test_write_values_batches_to_text_and_binary():
+    values = list(range(10))
+    text = io.StringIO()
+    assert streams.write_values(values, text, batch=3) == 10
+    binary = io.BytesIO()
+    assert streams.write_values(iter(values), binary, batch=4) == 10
+    expected = "".join(f"{v}\n" for v in values)
+    assert text.getvalue() == expected
+    assert binary.getvalue() == expected.encode()
+    assert streams.write_values([], text) == 0
+
+
+def test_open_output_file_and_replaced_stdout(tmp_path, capsys):
+    dst = tmp_path / "out.txt"
+    with streams.open_output(str(dst), buffer_size=64) as out:
+        streams.write_values(["b", "a"], out)
+    assert dst.read_text() == "b\na\n"
+    with streams.open_output(None) as out:
+        streams.write_values([1, 2], out)
+    assert capsys.readouterr().out == "1\n2\n"
+
+
+def test_cli_time_reports_phases(tmp_path, capsys):
+    src = tmp_path / "in.txt"
+    src.write_text("3\n1\n2\n")
+    dst = tmp_path / "out.txt"
+    argv = ["-i", str(src), "-o", str(dst), "--time", "--read-buffer", "4K"]
+    assert cli.main(argv) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("Merge: ")
+    assert [part.split(":")[0] for part in lines[1].split(", ")] == [
+        "parse",
+        "sort",
+        "write",
+    ]
+    assert dst.read_text() == "1\n2\n3\n"
+    assert cli.main(["-i", str(src), "--write-buffer", "big"]) == 2
+
+
+def test_write_histogram_expands_counts(tmp_path, capsys):
+    text = io.StringIO()
+    assert streams.write_histogram([(1, 3), (5, 0), (7, 1)], text, batch=2) == 4
+    assert text.getvalue() == "1\n1\n1\n7\n"
+    binary = io.BytesIO()
+    streams.write_histogram([("a", 2)], binary)
+    assert binary.getvalue() == b"a\na\n"
+
+    src = tmp_path / "in.txt"
+    src.write_text("3\n1\n3\n2\n")
+    assert cli.main(["-i", str(src), "--stream-counting"]) == 0
+    assert capsys.readouterr().out == "1\n2\n3\n3\n"
+    src.write_text("b\na\n")
+    assert cli.main(["-i", str(src), "--stream-counting"]) == 3
+    assert cli.main(["-i", str(src), "--stream-counting", "--time"]) == 2
+
+
+def test_auto_detection_does_not_carry_over_blocks(tmp_path, capsys):
+    src = tmp_path / "in.txt"
+    src.write_text("2.5\n" * 1200 + "7\n")
+    values = list(streams.iter_values(str(src), buffer_size=64))
+    assert values[-1] == 7 and type(values[-1]) is int
+    values = list(streams.iter_values(str(src)))
+    assert values[-1] == 7 and type(values[-1]) is int
+    assert cli.main(["-i", str(src)]) == 0
+    assert capsys.readouterr().out.splitlines()[-1] == "7"